@@ -16,13 +16,17 @@ from helpers_session import (
     parse_resume, fetch_youtube_resources, store_quiz_results, 
     validate_email, validate_password, validate_name, store_progress_achievement,
     create_user, authenticate_user, find_user_by_email, get_session_stats, 
-    init_session_state_db, get_user_progress_stats
+    init_session_state_db, get_user_progress_stats, store_roadmap, get_skill_mastery
 )
 
 # Import new authentication system
 from auth_system import get_auth_system
 from project_suggester import suggest_projects
-from quiz_engine import load_questions, run_quiz, fetch_questions_from_api
+from asset_loader import load_lottie
+from tracing import set_correlation_id, begin_span, end_span
+from quiz_engine import load_questions, run_quiz, fetch_questions_from_api, get_quiz_session
+from career_discovery import get_discovery_table
+from warmup import start_warm_up
 
 # Import smart quiz with fallback
 try:
@@ -38,6 +42,7 @@ if 'resumes' not in st.session_state:
 import hashlib
 import requests
 import json
+import uuid
 
 # Initialize session state for authentication
 if 'authenticated' not in st.session_state:
@@ -46,6 +51,11 @@ if 'user_name' not in st.session_state:
     st.session_state.user_name = ""
 if 'user_email' not in st.session_state:
     st.session_state.user_email = ""
+if 'session_id' not in st.session_state:
+    st.session_state.session_id = uuid.uuid4().hex[:12]
+
+# Tag every traced span in this rerun with the session's correlation id
+set_correlation_id(st.session_state.session_id)
 
 # Initialize session state database
 init_session_state_db()
@@ -53,15 +63,9 @@ init_session_state_db()
 # Initialize user_skills as an empty list
 user_skills = []
 
-# Function to load Lottie animations
-def load_lottieurl(url):
-    try:
-        r = requests.get(url)
-        if r.status_code != 200:
-            return None
-        return r.json()
-    except:
-        return None
+# Function to load Lottie animations (timeout-bounded, cached, bundled offline fallback)
+def load_lottieurl(url, fallback=None):
+    return load_lottie(url, fallback=fallback)
 
 # Function to cache resources for better performance
 @st.cache_resource
@@ -94,6 +98,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# No-op when launched through warmup.py; otherwise warms the remaining engines in the background
+start_warm_up()
+
 # Complete black theme for full visibility
 st.markdown(
     """
@@ -639,6 +646,9 @@ st.sidebar.markdown("""
 # Clean up the page variable for logic consistency
 page_clean = page
 
+# Time the page render (closed at the end of the script; early st.stop() exits are not recorded)
+_page_span = begin_span(f"page:{page_clean}")
+
 # Log In / Sign Up Section
 if page_clean == "Log In / Sign Up":
     # Reset redirect flag when user reaches login page
@@ -963,36 +973,48 @@ elif page_clean == "Skill Quiz & Resume Upload":
         st.info(f"📊 Ready to test your knowledge in: **{', '.join(user_skills[:5])}**" + 
                 ("..." if len(user_skills) > 5 else ""))
 
+        # Pin one quiz per user + skills: reruns reuse its question list instead of re-running
+        # prediction and question selection, and answers stay lined up with what is graded
+        # Each finished quiz updates skill mastery and starts a new attempt that favours weak skills
+        current_user = st.session_state.get('user_email', 'unknown@example.com')
+        mastery = get_skill_mastery(current_user)
+
+        def _build_skill_quiz(seed):
+            if SMART_QUIZ_AVAILABLE:
+                try:
+                    # Try smart quiz with ML-based question selection
+                    questions, quiz_config = integrate_smart_quiz_in_app(user_skills, seed=seed,
+                                                                         mastery=mastery.lookup())
+                    if questions:
+                        return questions, quiz_config
+                    raise Exception("Smart quiz returned no questions")
+                except Exception as smart_quiz_error:
+                    print(f"Smart quiz unavailable, using standard quiz: {smart_quiz_error}")
+            # Standard quiz system
+            return fetch_questions_from_api(user_skills, seed=seed), {"standard": True}
+
         # Try to fetch questions with ML enhancement
         try:
             with st.spinner("🤖 Preparing your AI-optimized quiz..." if SMART_QUIZ_AVAILABLE else "Preparing your personalized quiz..."):
-                if SMART_QUIZ_AVAILABLE:
-                    try:
-                        # Try smart quiz with ML-based question selection
-                        questions, quiz_config = integrate_smart_quiz_in_app(user_skills)
-                        
-                        if questions:
-                            # Show smart quiz info
-                            st.success(f"✨ **AI-Optimized Quiz Generated!** {len(questions)} questions tailored for your profile")
-                            
-                            # Show predicted career from quiz analysis
-                            if quiz_config.get('predicted_career'):
-                                st.info(f"🎯 **Quiz Focus:** Optimized for {quiz_config['predicted_career']} career path")
-                            
-                            # Show focus areas if any
-                            focus_areas = quiz_config.get('adaptive_rules', {}).get('focus_areas', [])
-                            if focus_areas:
-                                st.warning(f"📋 **Key Areas to Assess:** {', '.join(focus_areas[:3])}")
-                        else:
-                            raise Exception("Smart quiz returned no questions")
-                            
-                    except Exception as smart_quiz_error:
-                        # Fallback to API questions
-                        st.info("📝 Using standard quiz system...")
-                        questions = fetch_questions_from_api(user_skills)
+                quiz = get_quiz_session(user_skills, user_id=current_user, attempt=mastery.quizzes,
+                                        build=_build_skill_quiz)
+            questions, quiz_config = list(quiz.questions), quiz.config
+
+            if SMART_QUIZ_AVAILABLE and questions:
+                if quiz_config.get("standard"):
+                    st.info("📝 Using standard quiz system...")
                 else:
-                    # Standard quiz system
-                    questions = fetch_questions_from_api(user_skills)
+                    # Show smart quiz info
+                    st.success(f"✨ **AI-Optimized Quiz Generated!** {len(questions)} questions tailored for your profile")
+                    
+                    # Show predicted career from quiz analysis
+                    if quiz_config.get('predicted_career'):
+                        st.info(f"🎯 **Quiz Focus:** Optimized for {quiz_config['predicted_career']} career path")
+                    
+                    # Show focus areas if any
+                    focus_areas = quiz_config.get('adaptive_rules', {}).get('focus_areas', [])
+                    if focus_areas:
+                        st.warning(f"📋 **Key Areas to Assess:** {', '.join(focus_areas[:3])}")
 
             if not questions:
                 st.warning("⚠️ Unable to generate quiz questions for your skills. Please try with different skills.")
@@ -1002,11 +1024,11 @@ elif page_clean == "Skill Quiz & Resume Upload":
                     st.success(f"📝 Generated {len(questions)} questions based on your skills!")
                 
                 # Add a reset quiz button if there are existing answers
-                existing_answers = any(f"quiz_q_{q['id']}" in st.session_state for q in questions)
+                existing_answers = any(quiz.answer_key(q) in st.session_state for q in questions)
                 if existing_answers:
                     if st.button("🔄 Reset Quiz", help="Clear all answers and start over"):
                         for question in questions:
-                            key = f"quiz_q_{question['id']}"
+                            key = quiz.answer_key(question)
                             if key in st.session_state:
                                 del st.session_state[key]
                         st.rerun()
@@ -1016,8 +1038,8 @@ elif page_clean == "Skill Quiz & Resume Upload":
                     st.info("💡 **Important:** Please answer all questions before submitting the quiz.")
                     
                     # Add progress tracking
-                    if any(f"quiz_q_{q['id']}" in st.session_state for q in questions):
-                        answered_count = sum(1 for q in questions if f"quiz_q_{q['id']}" in st.session_state and st.session_state[f"quiz_q_{q['id']}"] is not None)
+                    if any(quiz.answer_key(q) in st.session_state for q in questions):
+                        answered_count = quiz.grade(quiz.answers(st.session_state))["answered"]
                         progress = answered_count / len(questions)
                         st.progress(progress)
                         st.caption(f"Progress: {answered_count}/{len(questions)} questions answered")
@@ -1030,7 +1052,7 @@ elif page_clean == "Skill Quiz & Resume Upload":
                         st.radio(
                             "Select your answer:",
                             options=question['options'],
-                            key=f"quiz_q_{question['id']}",
+                            key=quiz.answer_key(question),
                             index=None  # No default selection
                         )
                         st.markdown("---")
@@ -1040,43 +1062,29 @@ elif page_clean == "Skill Quiz & Resume Upload":
                 # Process quiz results
                 if quiz_submitted:
                     # Collect answers from session state after form submission
-                    user_answers = {}
-                    for question in questions:
-                        key = f"quiz_q_{question['id']}"
-                        if key in st.session_state:
-                            user_answers[question['id']] = st.session_state[key]
-                        else:
-                            user_answers[question['id']] = None
+                    user_answers = quiz.answers(st.session_state)
                     
                     # Debug information (can be removed later)
                     # st.write("Debug - User answers:", {k: v for k, v in user_answers.items() if v is not None})
                     
-                    # Check if all questions are answered
-                    unanswered = [i+1 for i, q in enumerate(questions) if user_answers.get(q['id']) is None]
+                    # Grade the whole sheet once against the pinned questions (see quiz_scoring)
+                    result = quiz.grade(user_answers)
+                    unanswered = result["unanswered"]
                     
                     if unanswered:
                         st.error(f"❌ Please answer all questions before submitting!")
                         
                         # Show specific questions that need answers
-                        missing_questions = []
-                        for i, q in enumerate(questions):
-                            if user_answers.get(q['id']) is None:
-                                missing_questions.append(f"Question {i+1}: {q['question'][:50]}...")
-                        
                         st.warning("� **Missing answers for:**")
-                        for missing in missing_questions:
-                            st.write(f"• {missing}")
+                        for position in unanswered:
+                            st.write(f"• Question {position}: {questions[position - 1]['question'][:50]}...")
                             
                         # Show which questions are answered vs unanswered
-                        answered_count = len([q for q in questions if user_answers.get(q['id']) is not None])
-                        st.info(f"📊 **Progress:** {answered_count}/{len(questions)} questions answered")
+                        st.info(f"📊 **Progress:** {result['answered']}/{result['total']} questions answered")
                         st.info("🔄 Please scroll up, answer the missing questions, and submit again.")
                     else:
-                        # Calculate score
-                        score = sum(1 for q in questions if user_answers.get(q['id']) == q['answer'])
-                        total = len(questions)
-                        percentage = (score / total) * 100
-                        wrong_qs = [q for q in questions if user_answers.get(q['id']) != q['answer']]
+                        score, total, percentage = result["score"], result["total"], result["percentage"]
+                        wrong_qs = quiz.wrong_questions(result, user_answers)
 
                         # Get current user info
                         current_user = st.session_state.get('user_email', 'unknown@example.com')
@@ -1090,7 +1098,8 @@ elif page_clean == "Skill Quiz & Resume Upload":
                                 "percentage": percentage,
                                 "skills_tested": user_skills,
                                 "wrong_answers": len(wrong_qs),
-                                "quiz_type": "skill_assessment"
+                                "quiz_type": "skill_assessment",
+                                "per_skill": result["per_skill"]
                             }
                             
                             store_quiz_results(current_user, quiz_data)
@@ -1125,6 +1134,12 @@ elif page_clean == "Skill Quiz & Resume Upload":
                             else:
                                 st.metric("Grade", "📚 Keep Learning!")
 
+                        # Per-skill accuracy of this quiz
+                        st.markdown("**📊 Accuracy by skill:**")
+                        for skill, skill_result in result["per_skill"].items():
+                            st.progress(skill_result["accuracy"],
+                                        text=f"{skill}: {skill_result['correct']}/{skill_result['total']}")
+
                         # Detailed feedback
                         if wrong_qs:
                             st.subheader("� Review & Learn")
@@ -1250,6 +1265,14 @@ elif page_clean == "Career Roadmap":
                 # Show diversity metrics
                 diversity_score = len(set(pred['career'] for pred in prediction_result['all_predictions'][:5])) / 5
                 st.caption(f"🎭 **Career Diversity Score:** {diversity_score:.1%} (Higher = more diverse options discovered)")
+                
+                # Emerging paths come from the offline discovery job's precomputed table
+                emerging_paths = get_discovery_table().paths_for_career(predicted_career)
+                if emerging_paths:
+                    with st.expander(f"🚀 Emerging career paths around {predicted_career}"):
+                        for path in emerging_paths[:3]:
+                            st.markdown(f"**{path['suggested_name']}** — key skills: {', '.join(path['key_skills'])}")
+                            st.caption(f"Related careers: {', '.join(path['related_careers'][:5])}")
             elif not ML_ENHANCED:
                 # Show original career matches for fallback
                 career_matches = get_career_matches(user_skills)
@@ -1276,9 +1299,20 @@ elif page_clean == "Career Roadmap":
                 st.markdown("---")
             
             # Generate roadmap
-            roadmap, all_required = generate_roadmap(user_skills, predicted_career)
+            # Skills the user's quizzes show as weak get review steps
+            roadmap, all_required = generate_roadmap(
+                user_skills, predicted_career,
+                mastery=get_skill_mastery(st.session_state.get('user_email', 'unknown@example.com'))
+            )
             
             if roadmap:
+                # Following the roadmap is an accepted prediction (feeds online learning);
+                # stored once per skills/career pair, not on every rerun
+                roadmap_key = (predicted_career, tuple(user_skills))
+                if st.session_state.get('stored_roadmap_key') != roadmap_key:
+                    store_roadmap(st.session_state.get('user_email', 'unknown@example.com'),
+                                  predicted_career, roadmap, skills=user_skills)
+                    st.session_state.stored_roadmap_key = roadmap_key
                 st.subheader("📚 Your Learning Roadmap")
                 st.info(f"Based on your current skills, here are the areas to focus on for {predicted_career}:")
                 
@@ -1803,3 +1837,5 @@ if page_clean == "Progress Dashboard":
     except Exception as e:
         st.error(f"Error loading dashboard data: {str(e)}")
         st.info("Please check your Progress Tracker for logged achievements.")
+
+end_span(_page_span)
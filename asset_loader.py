@@ -0,0 +1,187 @@
+"""
+Remote Asset Loader for AspirePath
+Fetches Lottie animations and other JSON assets with bounded timeouts,
+a two-tier cache (in-process LRU + on-disk directory) revalidated by ETag,
+and bundled local animations when the network is unavailable
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import requests
+from requests.adapters import HTTPAdapter
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CACHE_DIR = os.path.join(BASE_DIR, ".asset_cache")
+DEFAULT_FALLBACK_DIR = os.path.join(BASE_DIR, "assets", "lottie")
+
+# (connect, read) timeouts in seconds - a slow CDN must never hang a page render
+DEFAULT_TIMEOUT = (3.05, 5)
+
+
+class AssetLoader:
+    """Pooled, cached JSON asset fetcher with offline fallback"""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, fallback_dir=DEFAULT_FALLBACK_DIR,
+                 timeout=DEFAULT_TIMEOUT, max_memory_items=32, max_age=300, pool_size=10):
+        """
+        Args:
+            cache_dir (str): Directory for the on-disk cache tier (None disables it)
+            fallback_dir (str): Directory holding bundled JSON animations
+            timeout (tuple): (connect, read) timeouts in seconds
+            max_memory_items (int): Capacity of the in-process LRU tier
+            max_age (int): Seconds a cached entry is served without revalidation
+            pool_size (int): Keep-alive connections kept per host
+        """
+        self.cache_dir = cache_dir
+        self.fallback_dir = fallback_dir
+        self.timeout = timeout
+        self.max_memory_items = max_memory_items
+        self.max_age = max_age
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+    # --- in-process LRU tier ---
+    def _memory_get(self, url):
+        with self._lock:
+            entry = self._memory.get(url)
+            if entry is not None:
+                self._memory.move_to_end(url)
+            return entry
+
+    def _memory_put(self, url, entry):
+        with self._lock:
+            self._memory[url] = entry
+            self._memory.move_to_end(url)
+            while len(self._memory) > self.max_memory_items:
+                self._memory.popitem(last=False)
+
+    # --- on-disk tier ---
+    def _disk_path(self, url):
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _disk_get(self, url):
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self._disk_path(url), "r", encoding="utf-8") as f:
+                record = json.load(f)
+            return {"data": record["data"], "etag": record.get("etag"), "fetched_at": 0}
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _disk_put(self, url, entry):
+        if not self.cache_dir:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = self._disk_path(url)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"url": url, "etag": entry["etag"], "data": entry["data"]}, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Failed to write asset cache for {url}: {e}")
+
+    # --- bundled fallback ---
+    def load_fallback(self, name):
+        """Load a bundled animation by name (file name without .json)"""
+        if not name or not self.fallback_dir:
+            return None
+        path = os.path.join(self.fallback_dir, f"{os.path.basename(name)}.json")
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _fallback_for(self, url, fallback):
+        if fallback:
+            return self.load_fallback(fallback)
+        name = os.path.splitext(url.rstrip("/").rsplit("/", 1)[-1])[0]
+        return self.load_fallback(name)
+
+    def load_json(self, url, fallback=None):
+        """
+        Load a JSON asset, preferring fresh cache, then the network, then stale cache,
+        then the bundled fallback.
+
+        Args:
+            url (str): Asset URL
+            fallback (str): Bundled animation name to use when offline
+                (defaults to the URL's file name)
+
+        Returns:
+            dict or None: Parsed JSON, or None if nothing is available
+        """
+        entry = self._memory_get(url)
+        if entry is None:
+            entry = self._disk_get(url)
+        if entry is not None and time.time() - entry["fetched_at"] < self.max_age:
+            return entry["data"]
+
+        headers = {}
+        if entry is not None and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+
+        try:
+            r = self.session.get(url, headers=headers, timeout=self.timeout)
+            if r.status_code == 304 and entry is not None:
+                entry = {"data": entry["data"], "etag": entry["etag"], "fetched_at": time.time()}
+                self._memory_put(url, entry)
+                return entry["data"]
+            if r.status_code == 200:
+                entry = {"data": r.json(), "etag": r.headers.get("ETag"), "fetched_at": time.time()}
+                self._memory_put(url, entry)
+                self._disk_put(url, entry)
+                return entry["data"]
+            print(f"Asset request for {url} returned status {r.status_code}")
+        except (requests.exceptions.RequestException, ValueError) as e:
+            print(f"Asset request for {url} failed: {e}")
+
+        # Offline or failing upstream: serve stale cache before the bundled copy
+        if entry is not None:
+            self._memory_put(url, entry)
+            return entry["data"]
+        return self._fallback_for(url, fallback)
+
+    def clear(self, disk=False):
+        """Drop the in-process cache (and optionally the on-disk cache)"""
+        with self._lock:
+            self._memory.clear()
+        if disk and self.cache_dir and os.path.isdir(self.cache_dir):
+            for file_name in os.listdir(self.cache_dir):
+                if file_name.endswith(".json"):
+                    try:
+                        os.remove(os.path.join(self.cache_dir, file_name))
+                    except OSError:
+                        pass
+
+
+_default_loader = None
+_default_loader_lock = threading.Lock()
+
+
+def get_asset_loader():
+    """Get or create the process-wide asset loader"""
+    global _default_loader
+    with _default_loader_lock:
+        if _default_loader is None:
+            _default_loader = AssetLoader()
+        return _default_loader
+
+
+def load_lottie(url, fallback=None):
+    """Load a Lottie animation through the shared cached loader"""
+    return get_asset_loader().load_json(url, fallback=fallback)
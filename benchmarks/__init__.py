@@ -0,0 +1,4 @@
+"""
+Reproducible benchmark suite for AspirePath's scoring and selection paths.
+Run `python -m benchmarks --help` for usage.
+"""
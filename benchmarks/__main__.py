@@ -0,0 +1,62 @@
+"""
+Command-line entry point for the benchmark suite.
+
+    python -m benchmarks run --output benchmarks/results/latest.json
+    python -m benchmarks run --save-baseline
+    python -m benchmarks compare benchmarks/results/latest.json --threshold 0.2
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.generators import SCALES
+from benchmarks.suite import BENCHMARKS, run_suite, save_results, load_results, compare_results
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIR, "baseline.json")
+DEFAULT_OUTPUT = os.path.join(BENCHMARK_DIR, "results", "latest.json")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="AspirePath benchmark suite")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = sub.add_parser("run", help="Run benchmarks and save results to JSON")
+    run_parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="Benchmarks to run")
+    run_parser.add_argument("--scales", nargs="+", choices=list(SCALES), help="Input scales to run")
+    run_parser.add_argument("--repeat", type=int, default=10)
+    run_parser.add_argument("--seed", type=int, default=42)
+    run_parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    run_parser.add_argument("--save-baseline", action="store_true", help=f"Also write {DEFAULT_BASELINE}")
+
+    compare_parser = sub.add_parser("compare", help="Flag regressions against a stored baseline")
+    compare_parser.add_argument("results", nargs="?", default=DEFAULT_OUTPUT)
+    compare_parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    compare_parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown (0.2 = 20%%)")
+    compare_parser.add_argument("--metric", default="median_ms")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        report = run_suite(args.only, args.scales, args.repeat, args.seed)
+        print(f"Results saved to {save_results(report, args.output)}")
+        if args.save_baseline:
+            print(f"Baseline saved to {save_results(report, DEFAULT_BASELINE)}")
+        return 0
+
+    rows = compare_results(load_results(args.baseline), load_results(args.results),
+                           args.threshold, args.metric)
+    regressions = [row for row in rows if row["regression"]]
+    for row in rows:
+        flag = "REGRESSION" if row["regression"] else "ok"
+        print(f"{row['benchmark']:45s} {row['baseline']:10.3f} -> {row['current']:10.3f} ms "
+              f"({row['change']:+.1%}) {flag}")
+    print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%} out of {len(rows)} benchmarks")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
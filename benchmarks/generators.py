@@ -0,0 +1,197 @@
+"""
+Synthetic input generators for the AspirePath benchmark suite.
+Every generator takes an explicit seed so runs are reproducible.
+"""
+
+import io
+import json
+import random
+
+from config import SKILL_TEMPLATES
+
+# Benchmark scales: how many skills a user lists, how long a resume is,
+# how many training rows the career models see, how big the question bank is
+# how big a synthetic skill taxonomy is and how many profiles the neighbour index holds
+SCALES = {
+    "small": {"skills": 5, "resume_words": 200, "training_rows": 20, "questions": 26,
+              "taxonomy_skills": 70, "taxonomy_careers": 7, "profiles": 2000},
+    "medium": {"skills": 25, "resume_words": 2000, "training_rows": 200, "questions": 500,
+               "taxonomy_skills": 1000, "taxonomy_careers": 50, "profiles": 50000},
+    "large": {"skills": 100, "resume_words": 20000, "training_rows": 2000, "questions": 5000,
+              "taxonomy_skills": 10000, "taxonomy_careers": 500, "profiles": 250000},
+}
+
+KNOWN_SKILLS = sorted({skill for skills in SKILL_TEMPLATES.values() for skill in skills})
+
+# Skills outside the templates, so inputs contain realistic misses
+EXTRA_SKILLS = [
+    "Docker", "Kubernetes", "AWS", "Azure", "GCP", "Terraform", "Go", "Rust", "Scala",
+    "Kotlin", "Swift", "Spark", "Hadoop", "Kafka", "Airflow", "Figma", "Jira", "Agile",
+    "Scrum", "GraphQL", "Redis", "PostgreSQL", "Flask", "Django", "Spring", "Solidity",
+    "Blockchain", "Arduino", "Embedded Systems", "CI/CD", "Git", "Bash", "Matlab",
+]
+
+FILLER_WORDS = [
+    "managed", "delivered", "team", "project", "stakeholders", "improved", "designed",
+    "implemented", "customer", "reporting", "quarterly", "growth", "workflow", "platform",
+    "collaborated", "launched", "optimized", "mentored", "requirements", "documentation",
+]
+
+DIFFICULTIES = ["easy", "medium", "hard"]
+
+
+def generate_skills(count, seed=0, known_ratio=0.7):
+    """Generate a list of user skills, mostly from the known templates"""
+    rng = random.Random(seed)
+    skills = []
+    for _ in range(count):
+        pool = KNOWN_SKILLS if rng.random() < known_ratio else EXTRA_SKILLS
+        skill = rng.choice(pool)
+        # Mimic real input: inconsistent casing and stray whitespace
+        if rng.random() < 0.2:
+            skill = skill.lower()
+        if rng.random() < 0.1:
+            skill = f" {skill} "
+        skills.append(skill)
+    return skills
+
+
+def generate_resume_text(word_count, seed=0, skill_density=0.05):
+    """Generate resume-like prose with skills sprinkled through it"""
+    rng = random.Random(seed)
+    words = []
+    while len(words) < word_count:
+        if rng.random() < skill_density:
+            words.append(rng.choice(KNOWN_SKILLS + EXTRA_SKILLS) + ",")
+        else:
+            words.append(rng.choice(FILLER_WORDS))
+        if rng.random() < 0.08:
+            words[-1] += ".\n"
+    return " ".join(words)
+
+
+def make_resume_file(text, file_type="txt", name="resume"):
+    """Wrap resume text in an in-memory upload that parse_resume accepts"""
+    if file_type == "docx":
+        from docx import Document
+        doc = Document()
+        for line in text.split("\n"):
+            doc.add_paragraph(line)
+        buffer = io.BytesIO()
+        doc.save(buffer)
+        buffer.seek(0)
+    else:
+        buffer = io.BytesIO(text.encode("utf-8"))
+    buffer.name = f"{name}.{file_type}"
+    return buffer
+
+
+def generate_training_rows(count, seed=0, skills_per_row=6):
+    """Generate (skills, career) rows shaped like DynamicCareerPredictor's dataset"""
+    import pandas as pd
+
+    rng = random.Random(seed)
+    careers = list(SKILL_TEMPLATES.items())
+    rows = []
+    for _ in range(count):
+        career, template = rng.choice(careers)
+        picked = rng.sample(template, min(skills_per_row - 1, len(template)))
+        picked.append(rng.choice(EXTRA_SKILLS))
+        rows.append({"skills": ", ".join(picked), "career": career})
+    return pd.DataFrame(rows)
+
+
+def generate_question_bank(count, seed=0):
+    """Generate a question bank in the real_mcq_bank.json format"""
+    rng = random.Random(seed)
+    skills = KNOWN_SKILLS + EXTRA_SKILLS
+    bank = []
+    for i in range(count):
+        skill = rng.choice(skills)
+        options = [f"Option {j} for {skill}" for j in range(4)]
+        bank.append({
+            "id": f"synthetic_{i}",
+            "question": f"Which statement about {skill} is correct ({i})?",
+            "options": options,
+            "answer": rng.choice(options),
+            "skill": skill,
+            "difficulty": rng.choice(DIFFICULTIES),
+        })
+    return bank
+
+
+def write_question_bank(path, count, seed=0):
+    """Write a synthetic question bank to disk and return its path"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(generate_question_bank(count, seed), f)
+    return path
+
+
+def generate_taxonomy(skill_count, career_count, seed=0, skills_per_career=12):
+    """Generate a skill_taxonomy.json-shaped document of arbitrary size"""
+    rng = random.Random(seed)
+    base = KNOWN_SKILLS + EXTRA_SKILLS
+    skills = {}
+    for i in range(skill_count):
+        name = base[i] if i < len(base) else f"{rng.choice(base)} {rng.choice(FILLER_WORDS).title()} {i}"
+        skills[f"skill_{i}"] = {"name": name, "aliases": [f"{name} alias"] if rng.random() < 0.3 else []}
+    skill_ids = list(skills)
+    careers = {}
+    for c in range(career_count):
+        picked = rng.sample(skill_ids, min(skills_per_career, len(skill_ids)))
+        careers[f"Career {c}"] = {
+            "skills": {skill_id: round(rng.uniform(0.5, 1.5), 2) for skill_id in picked},
+            "quiz_priorities": [skills[s]["name"].lower() for s in picked[:4]],
+            "focus_areas": [skills[s]["name"] for s in picked[:3]],
+        }
+    keywords = {career: [c["focus_areas"][0].lower()] for career, c in careers.items()}
+    return {"version": 1, "skills": skills, "careers": careers, "keyword_fallback": keywords}
+
+
+def write_taxonomy(path, skill_count, career_count, seed=0):
+    """Write a synthetic taxonomy to disk and return its path"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(generate_taxonomy(skill_count, career_count, seed), f)
+    return path
+
+
+def sample_taxonomy_skills(source, count, seed=0):
+    """Pick user skills against a generated taxonomy: full names, single words and misses"""
+    rng = random.Random(seed)
+    names = [skill["name"] for skill in source["skills"].values()]
+    skills = []
+    for _ in range(count):
+        roll = rng.random()
+        name = rng.choice(names)
+        if roll < 0.6:
+            skills.append(name)
+        elif roll < 0.85:
+            skills.append(rng.choice(name.split()))
+        else:
+            skills.append(rng.choice(EXTRA_SKILLS) + " " + rng.choice(FILLER_WORDS))
+    return skills
+
+
+def generate_profile_rows(count, seed=0, skill_count=2000, career_count=200):
+    """Generate (skills, career) rows clustered around synthetic taxonomy careers"""
+    import pandas as pd
+
+    rng = random.Random(seed)
+    source = generate_taxonomy(skill_count, career_count, seed)
+    names = [skill["name"] for skill in source["skills"].values()]
+    careers = [
+        (career, [source["skills"][s]["name"] for s in spec["skills"]])
+        for career, spec in source["careers"].items()
+    ]
+    rows = []
+    for _ in range(count):
+        career, required = rng.choice(careers)
+        picked = rng.sample(required, rng.randint(4, min(8, len(required))))
+        picked += rng.sample(names, rng.randint(0, 2))
+        rows.append({"skills": ", ".join(picked), "career": career})
+    return pd.DataFrame(rows)
+
+
+def generate_profile_texts(count, seed=0, skill_count=2000, career_count=200):
+    """Generate skill-profile documents clustered around synthetic taxonomy careers"""
+    return generate_profile_rows(count, seed, skill_count, career_count)["skills"].tolist()
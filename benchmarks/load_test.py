@@ -0,0 +1,280 @@
+"""
+Headless load-test harness simulating concurrent AspirePath sessions.
+
+Each virtual user drives app.py through streamlit.testing.v1.AppTest in its own
+process: sign up, log in, upload a resume, take the quiz, generate a roadmap and
+log progress. Per-page latency percentiles, throughput and per-session memory are
+reported at the end.
+
+    python -m benchmarks.load_test --users 8 --processes 4 --output load.json
+
+Two pieces of the UI can't be driven by AppTest, so the harness installs shims in
+each worker process: the streamlit-option-menu sidebar component (navigation is read
+from session_state['_loadtest_page']) and st.file_uploader (returns the virtual
+user's generated resume).
+"""
+
+import argparse
+import json
+import logging
+import os
+import pickle
+import resource
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(ROOT_DIR, "app.py")
+sys.path.insert(0, ROOT_DIR)
+
+from benchmarks.generators import generate_resume_text, make_resume_file, generate_skills
+
+PASSWORD = "LoadTest#2024"
+
+
+def _install_headless_shims():
+    """Replace the widgets AppTest can't interact with by session_state-driven stand-ins"""
+    import streamlit as st
+    import streamlit_option_menu
+
+    def option_menu(menu_title, options, default_index=0, **kwargs):
+        return st.session_state.get("_loadtest_page") or options[default_index]
+
+    def file_uploader(label, *args, key=None, **kwargs):
+        upload = st.session_state.get("_loadtest_upload") if key is None else None
+        if upload is not None:
+            upload.seek(0)
+        return upload
+
+    streamlit_option_menu.option_menu = option_menu
+    st.file_uploader = file_uploader
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+
+
+def _widget(widgets, label):
+    for widget in widgets:
+        if widget.label == label:
+            return widget
+    raise LookupError(f"Widget not found: {label}")
+
+
+class VirtualUser:
+    """One scripted AspirePath session"""
+
+    def __init__(self, user_id, seed=0, timeout=60):
+        from streamlit.testing.v1 import AppTest
+
+        self.user_id = user_id
+        self.seed = seed + user_id
+        self.email = f"loadtest{user_id}_{os.getpid()}@aspirepath.com"
+        self.skills = [s.strip() for s in generate_skills(6, self.seed, known_ratio=1.0)]
+        self.at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+        self.timings = []
+
+    def _run(self, page, action=None):
+        """Run one rerun (optionally after a widget action) and time it under a page label"""
+        start = time.perf_counter()
+        (action() if action else self.at).run()
+        self.timings.append((page, (time.perf_counter() - start) * 1000))
+        if self.at.exception:
+            raise RuntimeError(f"{page}: {self.at.exception[0].message}")
+
+    def goto(self, page):
+        self.at.session_state["_loadtest_page"] = page
+        self._run(page)
+
+    def sign_up(self):
+        self.at.session_state["show_signup"] = True
+        self.goto("Log In / Sign Up")
+        # validate_name only accepts letters and spaces
+        suffix = "".join(chr(ord("A") + int(d)) for d in str(self.user_id))
+        _widget(self.at.text_input, "👤 Full Name").set_value(f"Load Tester {suffix}")
+        _widget(self.at.text_input, "📧 Email Address").set_value(self.email)
+        _widget(self.at.text_input, "🔒 Password").set_value(PASSWORD)
+        _widget(self.at.text_input, "🔒 Confirm Password").set_value(PASSWORD)
+        self.at.checkbox[0].check()
+        self._run("Sign Up", _widget(self.at.button, "🎯 Create My Account").click)
+
+    def log_in(self):
+        self.goto("Logout")
+        self.at.session_state["show_signup"] = False
+        self.goto("Log In / Sign Up")
+        _widget(self.at.text_input, "📧 Email Address").set_value(self.email)
+        _widget(self.at.text_input, "🔒 Password").set_value(PASSWORD)
+        self._run("Log In", _widget(self.at.button, "🚀 Sign In").click)
+        if not self.at.session_state["authenticated"]:
+            raise RuntimeError("Log In: user was not authenticated")
+
+    def upload_resume_and_take_quiz(self):
+        text = generate_resume_text(400, self.seed) + "\n" + ", ".join(self.skills)
+        self.at.session_state["_loadtest_upload"] = make_resume_file(text, "docx", f"resume_{self.user_id}")
+        self.goto("Skill Quiz & Resume Upload")
+        # Answer widgets are keyed by the pinned quiz sessions (QuizSession.answer_key)
+        sessions = self.at.session_state["quiz_sessions"] if "quiz_sessions" in self.at.session_state else {}
+        prefixes = tuple(quiz.answer_key_prefix for quiz in sessions.values())
+        answered = 0
+        for radio in self.at.radio:
+            if prefixes and radio.key and radio.key.startswith(prefixes):
+                radio.set_value(radio.options[self.user_id % len(radio.options)])
+                answered += 1
+        if not answered:
+            raise RuntimeError("Quiz: no quiz questions were rendered")
+        stored = len(self.at.session_state["quiz_results"])
+        self._run("Quiz Submit", _widget(self.at.button, "🎯 Submit Quiz").click)
+        self.at.session_state["_loadtest_upload"] = None
+        if len(self.at.session_state["quiz_results"]) <= stored:
+            raise RuntimeError("Quiz Submit: quiz results were not stored")
+
+    def generate_roadmap(self):
+        self.goto("Career Roadmap")
+        self.at.text_input[0].set_value(", ".join(self.skills))
+        self._run("Career Roadmap")
+
+    def log_progress(self):
+        self.goto("Progress Tracker")
+        self.at.text_area[0].set_value(f"Finished a {self.skills[0]} course")
+        self.at.text_input[0].set_value(", ".join(self.skills[:2]))
+        self._run("Progress Submit", _widget(self.at.button, "📝 Submit Achievement").click)
+        self.goto("Progress Dashboard")
+
+    def session_state_bytes(self):
+        size = 0
+        for value in self.at.session_state.values():
+            try:
+                size += len(pickle.dumps(value))
+            except Exception:
+                pass
+        return size
+
+    def run_flow(self):
+        self.goto("Home")
+        self.sign_up()
+        self.log_in()
+        self.upload_resume_and_take_quiz()
+        self.generate_roadmap()
+        self.log_progress()
+
+
+def _rss_kb():
+    # ru_maxrss is kilobytes on Linux, bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+
+def _run_user(args):
+    """Worker entry point: run one virtual user flow and return its measurements"""
+    user_id, seed, timeout = args
+    _install_headless_shims()
+    rss_before = _rss_kb()
+    started = time.perf_counter()
+    user = VirtualUser(user_id, seed, timeout)
+    error = None
+    try:
+        user.run_flow()
+    except Exception as e:
+        error = str(e)
+    return {
+        "user_id": user_id,
+        "pid": os.getpid(),
+        "duration_s": time.perf_counter() - started,
+        "timings": user.timings,
+        "error": error,
+        "session_state_bytes": user.session_state_bytes(),
+        "peak_rss_kb": _rss_kb(),
+        "rss_growth_kb": _rss_kb() - rss_before,
+    }
+
+
+def _percentile(sorted_values, pct):
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def summarize(user_results, wall_s):
+    """Aggregate per-page latency percentiles, throughput and memory"""
+    pages = {}
+    for result in user_results:
+        for page, elapsed in result["timings"]:
+            pages.setdefault(page, []).append(elapsed)
+
+    page_stats = {}
+    for page, samples in pages.items():
+        samples.sort()
+        page_stats[page] = {
+            "count": len(samples),
+            "p50_ms": round(_percentile(samples, 50), 2),
+            "p90_ms": round(_percentile(samples, 90), 2),
+            "p95_ms": round(_percentile(samples, 95), 2),
+            "p99_ms": round(_percentile(samples, 99), 2),
+            "mean_ms": round(statistics.fmean(samples), 2),
+        }
+
+    completed = [r for r in user_results if not r["error"]]
+    reruns = sum(len(r["timings"]) for r in user_results)
+    return {
+        "users": len(user_results),
+        "completed": len(completed),
+        "errors": [{"user_id": r["user_id"], "error": r["error"]} for r in user_results if r["error"]],
+        "wall_s": round(wall_s, 3),
+        "flows_per_s": round(len(completed) / wall_s, 3) if wall_s else 0,
+        "reruns_per_s": round(reruns / wall_s, 3) if wall_s else 0,
+        "pages": page_stats,
+        "memory": {
+            "session_state_kb_mean": round(statistics.fmean(r["session_state_bytes"] for r in user_results) / 1024, 2),
+            "rss_growth_kb_mean": round(statistics.fmean(r["rss_growth_kb"] for r in user_results), 1),
+            "peak_rss_kb_max": max(r["peak_rss_kb"] for r in user_results),
+        },
+    }
+
+
+def run_load_test(users=4, processes=None, seed=42, timeout=60):
+    """
+    Run `users` virtual user flows on a pool of `processes` worker processes.
+
+    Returns:
+        dict: Summary with per-page latency percentiles, throughput and memory
+    """
+    # Reference the worker through its importable module path: AppTest swaps out
+    # __main__ in the workers, so `python -m` style references can't be unpickled
+    from benchmarks.load_test import _run_user as run_user
+
+    processes = processes or users
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        results = list(pool.map(run_user, [(i, seed, timeout) for i in range(users)]))
+    return summarize(results, time.perf_counter() - started)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.load_test",
+                                     description="Simulate concurrent AspirePath sessions")
+    parser.add_argument("--users", type=int, default=4, help="Virtual users to simulate")
+    parser.add_argument("--processes", type=int, default=None, help="Worker processes (default: one per user)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--timeout", type=float, default=60, help="Per-rerun timeout in seconds")
+    parser.add_argument("--output", help="Write the JSON summary to this path")
+    args = parser.parse_args(argv)
+
+    summary = run_load_test(args.users, args.processes, args.seed, args.timeout)
+
+    print(f"{summary['completed']}/{summary['users']} flows completed in {summary['wall_s']}s "
+          f"({summary['flows_per_s']} flows/s, {summary['reruns_per_s']} reruns/s)")
+    for page, stats in sorted(summary["pages"].items()):
+        print(f"  {page:28s} n={stats['count']:<4d} p50 {stats['p50_ms']:9.1f} ms  "
+              f"p95 {stats['p95_ms']:9.1f} ms  p99 {stats['p99_ms']:9.1f} ms")
+    memory = summary["memory"]
+    print(f"  session_state ~{memory['session_state_kb_mean']} KB/session, "
+          f"RSS growth ~{memory['rss_growth_kb_mean']} KB/session, peak RSS {memory['peak_rss_kb_max']} KB")
+    for failure in summary["errors"]:
+        print(f"  user {failure['user_id']} failed: {failure['error']}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+    return 0 if not summary["errors"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
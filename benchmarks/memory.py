@@ -0,0 +1,109 @@
+"""
+Peak-memory benchmark for DynamicCareerPredictor training on large corpora.
+
+Each corpus size is trained in a fresh subprocess so ru_maxrss is a clean
+per-run peak.
+
+    python -m benchmarks.memory --rows 100000 1000000 --output memory.json
+
+Reported per run: peak RSS before and after training, the sparse TF-IDF
+matrix size, and the size the dense float64 copy (the old `.toarray()`)
+would have needed.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+
+def _peak_rss_mb():
+    # ru_maxrss is kilobytes on Linux, bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(rss / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def measure_training(rows, seed=0, trees=None):
+    """Train DynamicCareerPredictor on `rows` synthetic profiles in this process"""
+    from benchmarks.generators import generate_profile_rows
+    from ml_career_predictor import DynamicCareerPredictor
+
+    df = generate_profile_rows(rows, seed)
+    predictor = DynamicCareerPredictor()
+    if trees:
+        predictor.rf_classifier.set_params(n_estimators=trees)
+    baseline = _peak_rss_mb()
+
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        predictor.train_models(df)
+    elapsed = time.perf_counter() - started
+
+    matrix = predictor.skill_embeddings
+    sparse_bytes = matrix.data.nbytes + matrix.indices.nbytes + matrix.indptr.nbytes
+    return {
+        "rows": rows,
+        "features": matrix.shape[1],
+        "dtype": str(matrix.dtype),
+        "train_s": round(elapsed, 2),
+        "peak_rss_before_mb": baseline,
+        "peak_rss_mb": _peak_rss_mb(),
+        "sparse_matrix_mb": round(sparse_bytes / 2 ** 20, 1),
+        "dense_float64_copy_mb": round(matrix.shape[0] * matrix.shape[1] * 8 / 2 ** 20, 1),
+    }
+
+
+def run(rows_list, seed=0, trees=None):
+    """Measure each corpus size in its own subprocess"""
+    results = []
+    for rows in rows_list:
+        command = [sys.executable, "-m", "benchmarks.memory", "--worker", str(rows), "--seed", str(seed)]
+        if trees:
+            command += ["--trees", str(trees)]
+        completed = subprocess.run(command, cwd=ROOT_DIR, capture_output=True, text=True)
+        if completed.returncode != 0:
+            results.append({"rows": rows, "error": completed.stderr.strip().splitlines()[-1:]})
+            continue
+        results.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.memory",
+                                     description="Peak RSS of DynamicCareerPredictor training")
+    parser.add_argument("--rows", type=int, nargs="+", default=[100000, 1000000])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--trees", type=int, default=None,
+                        help="Override the random forest size (training time grows with rows x trees)")
+    parser.add_argument("--output", help="Write the JSON results to this path")
+    parser.add_argument("--worker", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(measure_training(args.worker, args.seed, args.trees)))
+        return 0
+
+    results = run(args.rows, args.seed, args.trees)
+    for result in results:
+        if "error" in result:
+            print(f"{result['rows']:>9,} rows  failed: {result['error']}")
+            continue
+        print(f"{result['rows']:>9,} rows  peak RSS {result['peak_rss_mb']:8.1f} MB "
+              f"(data {result['peak_rss_before_mb']:.1f} MB)  train {result['train_s']:7.1f}s  "
+              f"sparse {result['sparse_matrix_mb']:.1f} MB vs dense copy {result['dense_float64_copy_mb']:.1f} MB")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    return 0 if all("error" not in r for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
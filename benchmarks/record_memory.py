@@ -0,0 +1,148 @@
+"""
+Memory and allocations of dict records vs slotted records and the columnar question bank.
+
+    python -m benchmarks.record_memory --questions 20000 --output records.json
+
+Measured with tracemalloc:
+- resident: bytes held after loading the bank / building session records
+- per call: peak bytes allocated by one load_smart_questions scoring pass, for the
+  previous dict-per-question loop (over an already loaded bank, so file reads are
+  not counted against it) and for the columnar QuestionBank path
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from benchmarks.generators import generate_question_bank, generate_skills
+
+
+def _traced(build):
+    """(result, bytes still held, peak bytes) of build() under tracemalloc"""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    start = tracemalloc.get_traced_memory()[0]
+    result = build()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current - start, peak - start
+
+
+def _dict_scoring(all_questions, user_skills, predicted_career, max_questions=10):
+    """The previous hot loop: one merged dict per question per call"""
+    from skill_taxonomy import get_taxonomy
+    priorities = get_taxonomy().quiz_priorities
+    user_skills_lower = [skill.lower().strip() for skill in user_skills]
+    scored = []
+    for question in all_questions:
+        question_skill = question.get("skill", "").lower().strip()
+        question_text = question.get("question", "").lower()
+        score = 0
+        if any(skill in question_skill or question_skill in skill for skill in user_skills_lower):
+            score += 10
+        if predicted_career in priorities:
+            if any(p in question_skill for p in priorities[predicted_career]):
+                score += 5
+        score += 2 * sum(1 for skill in user_skills_lower if skill in question_text and len(skill) > 2)
+        difficulty = question.get("difficulty", "medium").lower()
+        score += 1 if difficulty == "medium" else 0.5 if difficulty == "hard" else 0
+        scored.append({**question, 'relevance_score': score})
+    scored.sort(key=lambda x: x['relevance_score'], reverse=True)
+    return scored[:max_questions]
+
+
+def _per_call(func, repeat):
+    _traced(func)  # first call outside the measurement (imports, caches)
+    peaks, times = [], []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        _, _, peak = _traced(func)
+        times.append((time.perf_counter() - started) * 1000)
+        peaks.append(peak)
+    return {"peak_kb": round(min(peaks) / 1024, 1), "ms": round(min(times), 2)}
+
+
+def measure(question_count, session_entries, repeat, seed):
+    from records import AchievementRecord, QuestionBank, QuizRecord
+    from smart_quiz import load_smart_questions
+
+    raw = generate_question_bank(question_count, seed)
+    text = json.dumps(raw)
+    results = {"questions": question_count}
+
+    dict_bank, dict_bytes, _ = _traced(lambda: json.loads(text))
+    record_bank, record_bytes, _ = _traced(lambda: QuestionBank.from_dicts(json.loads(text)))
+    results["bank_resident_kb"] = {"dicts": round(dict_bytes / 1024, 1), "columnar": round(record_bytes / 1024, 1)}
+
+    skills = generate_skills(8, seed)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bank.json")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        results["load_smart_questions"] = {
+            "dicts": _per_call(lambda: _dict_scoring(dict_bank, skills, "Data Analyst"), repeat),
+            "columnar": _per_call(lambda: load_smart_questions(skills, "Data Analyst", path=path), repeat),
+        }
+
+    achievement = {"user_id": "user@example.com", "user_name": "User", "date": "2026-01-01T10:00:00",
+                   "week": "2026-W01", "created_at": "2026-01-01T10:00:00", "category": "Project",
+                   "description": "Built a dashboard", "skills": ["Python", "SQL"], "time_spent": 2.0,
+                   "difficulty": "Intermediate"}
+    quiz = {"score": 7, "total": 10, "percentage": 70.0, "skills_tested": ["Python", "SQL"],
+            "wrong_answers": 3, "quiz_type": "skill_assessment"}
+
+    def fresh(data):
+        # Values as they arrive from the UI: new strings per entry, not literals shared by the loop
+        return {key: (value.encode().decode() if isinstance(value, str) else
+                      [v.encode().decode() for v in value] if isinstance(value, list) else value)
+                for key, value in data.items()}
+
+    _, dict_bytes, _ = _traced(lambda: [fresh(achievement) for _ in range(session_entries)]
+                               + [dict(fresh(quiz), user_id="user@example.com", timestamp="t", date="d")
+                                  for _ in range(session_entries)])
+    _, record_bytes, _ = _traced(lambda: [AchievementRecord.from_dict(fresh(achievement))
+                                          for _ in range(session_entries)]
+                                 + [QuizRecord.from_results("user@example.com", "t", "d", fresh(quiz))
+                                    for _ in range(session_entries)])
+    results["session_records_kb"] = {"entries": 2 * session_entries, "dicts": round(dict_bytes / 1024, 1),
+                                     "records": round(record_bytes / 1024, 1)}
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.record_memory",
+                                     description="tracemalloc: dict records vs slotted records / columnar bank")
+    parser.add_argument("--questions", type=int, default=20000)
+    parser.add_argument("--session-entries", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write the JSON results to this path")
+    args = parser.parse_args(argv)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = measure(args.questions, args.session_entries, args.repeat, args.seed)
+    bank = results["bank_resident_kb"]
+    calls = results["load_smart_questions"]
+    session = results["session_records_kb"]
+    print(f"question bank ({args.questions}): dicts {bank['dicts']:.0f} KB, columnar {bank['columnar']:.0f} KB")
+    print(f"load_smart_questions peak/call: dicts {calls['dicts']['peak_kb']:.0f} KB ({calls['dicts']['ms']} ms), "
+          f"columnar {calls['columnar']['peak_kb']:.0f} KB ({calls['columnar']['ms']} ms)")
+    print(f"session records ({session['entries']}): dicts {session['dicts']:.0f} KB, "
+          f"records {session['records']:.0f} KB")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+"""
+Per-worker memory of N serving processes: pickled models vs shared memory-mapped artifacts.
+
+    python -m benchmarks.shared_memory --rows 20000 --workers 1 8 --output shared.json
+
+A model is trained once and stored both ways (save_model pickle + question bank
+JSON, and shared_artifacts.export_artifacts). For each worker count, that many
+processes load the model, serve predictions until every page they need is
+resident, and are measured together from /proc/self/smaps_rollup (Linux).
+
+RSS counts shared pages in full in every process; PSS divides them among the
+processes mapping them, so sum(PSS) is the physical memory the workers take.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+QUESTION_BANK = os.path.join(ROOT_DIR, "real_mcq_bank.json")
+
+
+def _memory_mb():
+    """Rss / Pss / private / shared MB of this process"""
+    fields = {}
+    with open("/proc/self/smaps_rollup", encoding="utf-8") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                fields[parts[0].rstrip(":")] = int(parts[1]) / 1024
+    return {
+        "rss_mb": round(fields.get("Rss", 0), 1),
+        "pss_mb": round(fields.get("Pss", 0), 1),
+        "private_mb": round(fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0), 1),
+        "shared_mb": round(fields.get("Shared_Clean", 0) + fields.get("Shared_Dirty", 0), 1),
+    }
+
+
+def prepare(rows, seed, trees, directory):
+    """Train once and write both model formats to `directory` (reused if present)"""
+    pickle_path = os.path.join(directory, "model.pkl")
+    artifacts = os.path.join(directory, "artifacts")
+    if os.path.exists(pickle_path) and os.path.exists(os.path.join(artifacts, "manifest.json")):
+        return pickle_path, artifacts
+
+    from benchmarks.generators import generate_profile_rows
+    from ml_career_predictor import DynamicCareerPredictor
+    from shared_artifacts import export_artifacts
+
+    predictor = DynamicCareerPredictor()
+    if trees:
+        predictor.rf_classifier.set_params(n_estimators=trees)
+    with contextlib.redirect_stdout(io.StringIO()):
+        predictor.train_models(generate_profile_rows(rows, seed))
+    os.makedirs(directory, exist_ok=True)
+    predictor.save_model(pickle_path)
+    export_artifacts(predictor, artifacts, QUESTION_BANK)
+    return pickle_path, artifacts
+
+
+def _queries(seed, count=200):
+    from benchmarks.generators import generate_profile_rows
+    return [skills.split(", ") for skills in generate_profile_rows(count, seed + 1)["skills"]]
+
+
+def worker(mode, path, seed):
+    """Load the model one way, serve until warm, then report memory when asked"""
+    import numpy as np
+    from ml_career_predictor import DynamicCareerPredictor
+
+    queries = _queries(seed)
+    baseline = _memory_mb()
+    if mode == "pickle":
+        predictor = DynamicCareerPredictor()
+        predictor.load_model(path)
+        with open(QUESTION_BANK, encoding="utf-8") as f:
+            questions = json.load(f)
+        question_count = len(questions)
+    else:
+        from shared_artifacts import QuestionIndex, load_predictor
+        predictor = load_predictor(path)
+        questions = QuestionIndex.load(path)
+        question_count = len(questions)
+        # Fault in every mapped page, as a long-running worker eventually does
+        for name in os.listdir(path):
+            if name.endswith(".npy"):
+                float(np.load(os.path.join(path, name), mmap_mode="r").view(np.uint8).sum())
+
+    for skills in queries:
+        for mode_name in ("full", "fast"):
+            predictor.predict_dynamic_careers(skills, mode=mode_name, use_cache=False)
+
+    print(json.dumps({"ready": True, "questions": question_count}), flush=True)
+    sys.stdin.readline()  # measured while every worker is alive
+    memory = _memory_mb()
+    memory["model_rss_mb"] = round(memory["rss_mb"] - baseline["rss_mb"], 1)
+    memory["model_pss_mb"] = round(memory["pss_mb"] - baseline["pss_mb"], 1)
+    print(json.dumps(memory), flush=True)
+
+
+def measure(mode, path, workers, seed):
+    """Start `workers` processes, wait until all are warm, measure them together"""
+    command = [sys.executable, "-m", "benchmarks.shared_memory", "--worker", mode, path, "--seed", str(seed)]
+    processes = [subprocess.Popen(command, cwd=ROOT_DIR, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+                 for _ in range(workers)]
+    reports = []
+    try:
+        # A worker that dies while loading (typically killed for memory) prints nothing
+        if all(process.stdout.readline() for process in processes):
+            for process in processes:
+                process.stdin.write("measure\n")
+                process.stdin.flush()
+            reports = [json.loads(line) for line in (process.stdout.readline() for process in processes) if line]
+    finally:
+        for process in processes:
+            if len(reports) < workers:
+                process.kill()
+            with contextlib.suppress(BrokenPipeError):
+                process.stdin.close()
+            process.wait()
+    if len(reports) < workers:
+        return {"mode": mode, "workers": workers,
+                "error": "a worker exited before it was measured (out of memory?)"}
+
+    def mean(field):
+        return round(sum(r[field] for r in reports) / len(reports), 1)
+
+    return {
+        "mode": mode,
+        "workers": workers,
+        "rss_mb_per_worker": mean("rss_mb"),
+        "pss_mb_per_worker": mean("pss_mb"),
+        "model_rss_mb_per_worker": mean("model_rss_mb"),
+        "model_pss_mb_per_worker": mean("model_pss_mb"),
+        "private_mb_per_worker": mean("private_mb"),
+        "total_pss_mb": round(sum(r["pss_mb"] for r in reports), 1),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.shared_memory",
+                                     description="Per-worker RSS/PSS: pickled models vs shared mapped artifacts")
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--trees", type=int, default=None)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 8])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--dir", help="Where to keep the trained model (default: a temp dir per rows/seed)")
+    parser.add_argument("--output", help="Write the JSON results to this path")
+    parser.add_argument("--worker", nargs=2, metavar=("MODE", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        worker(args.worker[0], args.worker[1], args.seed)
+        return 0
+    if not os.path.exists("/proc/self/smaps_rollup"):
+        print("This benchmark reads /proc/self/smaps_rollup and needs Linux")
+        return 1
+
+    directory = args.dir or os.path.join(
+        tempfile.gettempdir(), f"aspirepath_shared_{args.rows}_{args.trees or 'default'}_{args.seed}")
+    pickle_path, artifacts = prepare(args.rows, args.seed, args.trees, directory)
+    results = []
+    for workers in args.workers:
+        for mode, path in (("pickle", pickle_path), ("shared", artifacts)):
+            result = measure(mode, path, workers, args.seed)
+            results.append(result)
+            if "error" in result:
+                print(f"{mode:>6} x{workers:<2} failed: {result['error']}")
+                continue
+            print(f"{mode:>6} x{workers:<2} RSS {result['rss_mb_per_worker']:7.1f} MB/worker  "
+                  f"PSS {result['pss_mb_per_worker']:7.1f} MB/worker  "
+                  f"model PSS {result['model_pss_mb_per_worker']:7.1f} MB/worker  "
+                  f"total PSS {result['total_pss_mb']:8.1f} MB")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""
+Precision / recall of resume skill extraction on a hand-labelled sample.
+
+    python -m benchmarks.skill_eval [--sample benchmarks/data/labelled_resumes.json]
+
+Scores core.assess_skills against the labels and, for comparison, the previous
+extractor (lowercased substring search over canonical skill names).
+"""
+
+import argparse
+import json
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+DEFAULT_SAMPLE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "labelled_resumes.json")
+
+
+def load_sample(path=DEFAULT_SAMPLE):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def substring_extractor(text):
+    """The pre-normalization extractor: any skill name found as a substring"""
+    from skill_taxonomy import get_taxonomy
+    taxonomy = get_taxonomy()
+    text_lower = text.lower()
+    return [
+        taxonomy.skill_names[i] for i in taxonomy.career_skill_vocabulary
+        if taxonomy.skill_names_lower[i] in text_lower
+    ]
+
+
+def evaluate(extractor, sample):
+    """
+    Micro-averaged precision, recall and F1 of `extractor(text) -> skills`.
+
+    Returns:
+        dict: precision, recall, f1, counts and per-resume misses / false positives
+    """
+    true_positives = false_positives = false_negatives = 0
+    errors = []
+    for resume in sample:
+        expected = set(resume["skills"])
+        found = set(extractor(resume["text"]))
+        true_positives += len(found & expected)
+        false_positives += len(found - expected)
+        false_negatives += len(expected - found)
+        if found != expected:
+            errors.append({
+                "id": resume["id"],
+                "missed": sorted(expected - found),
+                "false_positives": sorted(found - expected),
+            })
+    precision = true_positives / (true_positives + false_positives) if true_positives + false_positives else 1.0
+    recall = true_positives / (true_positives + false_negatives) if true_positives + false_negatives else 1.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return {
+        "precision": round(precision, 4),
+        "recall": round(recall, 4),
+        "f1": round(f1, 4),
+        "true_positives": true_positives,
+        "false_positives": false_positives,
+        "false_negatives": false_negatives,
+        "errors": errors,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.skill_eval",
+                                     description="Skill extraction precision/recall on a labelled sample")
+    parser.add_argument("--sample", default=DEFAULT_SAMPLE)
+    parser.add_argument("--verbose", action="store_true", help="List misses and false positives")
+    args = parser.parse_args(argv)
+
+    from core import assess_skills
+
+    sample = load_sample(args.sample)
+    print(f"{len(sample)} labelled resumes")
+    for label, extractor in [("substring (previous)", substring_extractor), ("assess_skills", assess_skills)]:
+        result = evaluate(extractor, sample)
+        print(f"  {label:22s} precision {result['precision']:.3f}  recall {result['recall']:.3f}  "
+              f"f1 {result['f1']:.3f}  (tp {result['true_positives']}, fp {result['false_positives']}, "
+              f"fn {result['false_negatives']})")
+        if args.verbose:
+            for error in result["errors"]:
+                print(f"    {error['id']}: missed {error['missed']} false positives {error['false_positives']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
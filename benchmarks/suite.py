@@ -0,0 +1,396 @@
+"""
+Benchmark definitions and runner for the scoring and selection paths.
+
+Each benchmark is a setup function taking (scale, seed) and returning the
+zero-argument callable to time, so expensive setup stays outside the timing loop.
+"""
+
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from benchmarks.generators import (
+    SCALES, generate_skills, generate_resume_text, make_resume_file,
+    generate_training_rows, write_question_bank, write_taxonomy,
+    generate_taxonomy, sample_taxonomy_skills, generate_profile_texts, generate_profile_rows
+)
+
+BENCHMARKS = {}
+
+
+def benchmark(name, repeat=None):
+    """Register a benchmark setup function under a name"""
+    def decorator(setup):
+        BENCHMARKS[name] = {"setup": setup, "repeat": repeat}
+        return setup
+    return decorator
+
+
+@contextlib.contextmanager
+def _quiet():
+    """Silence the engines' progress prints while timing"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+@benchmark("assess_skills")
+def _assess_skills(scale, seed):
+    from core import assess_skills
+    text = generate_resume_text(SCALES[scale]["resume_words"], seed)
+    return lambda: assess_skills(text)
+
+
+@benchmark("predict_career")
+def _predict_career(scale, seed):
+    from core import predict_career
+    skills = generate_skills(SCALES[scale]["skills"], seed)
+    return lambda: predict_career(skills)
+
+
+@benchmark("get_career_matches")
+def _get_career_matches(scale, seed):
+    from core import get_career_matches
+    skills = generate_skills(SCALES[scale]["skills"], seed)
+    return lambda: get_career_matches(skills)
+
+
+@benchmark("predict_career_enhanced")
+def _predict_career_enhanced(scale, seed):
+    from enhanced_prediction import predict_career_enhanced
+    skills = generate_skills(SCALES[scale]["skills"], seed)
+    return lambda: predict_career_enhanced(skills)
+
+
+@benchmark("train_models", repeat=3)
+def _train_models(scale, seed):
+    from ml_career_predictor import DynamicCareerPredictor
+    df = generate_training_rows(SCALES[scale]["training_rows"], seed)
+
+    def run():
+        with _quiet():
+            DynamicCareerPredictor().train_models(df)
+    return run
+
+
+def _train_models_with_workers(workers):
+    def setup(scale, seed):
+        from ml_career_predictor import DynamicCareerPredictor
+        df = generate_training_rows(SCALES[scale]["training_rows"], seed)
+
+        def run():
+            with _quiet():
+                DynamicCareerPredictor(n_jobs=workers).train_models(df)
+        return run
+    setup.__doc__ = f"train_models with {workers} worker thread(s) and forest n_jobs={workers}"
+    return setup
+
+
+# Training scaling across worker counts (speedup is bounded by the cores available)
+for _workers in (1, 2, 4, 8):
+    benchmark(f"train_models_{_workers}_workers", repeat=3)(_train_models_with_workers(_workers))
+
+
+@benchmark("predict_dynamic_careers")
+def _predict_dynamic_careers(scale, seed):
+    from ml_career_predictor import DynamicCareerPredictor
+    predictor = DynamicCareerPredictor()
+    with _quiet():
+        predictor.train_models()
+    skills = generate_skills(SCALES[scale]["skills"], seed)
+    return lambda: predictor.predict_dynamic_careers(skills, mode="full", use_cache=False)
+
+
+@benchmark("predict_dynamic_careers_fast")
+def _predict_dynamic_careers_fast(scale, seed):
+    """Distilled logistic-regression fast path (interactive mode)"""
+    from ml_career_predictor import DynamicCareerPredictor
+    predictor = DynamicCareerPredictor()
+    with _quiet():
+        predictor.train_models()
+    skills = generate_skills(SCALES[scale]["skills"], seed)
+    return lambda: predictor.predict_dynamic_careers(skills, mode="fast", use_cache=False)
+
+
+@benchmark("predict_dynamic_careers_cached")
+def _predict_dynamic_careers_cached(scale, seed):
+    """Repeat request for the same skills (spelled differently) served from the prediction cache"""
+    from ml_career_predictor import DynamicCareerPredictor
+    predictor = DynamicCareerPredictor()
+    with _quiet():
+        predictor.train_models()
+    skills = generate_skills(SCALES[scale]["skills"], seed)
+    predictor.predict_dynamic_careers(skills)
+    respelled = [skill.upper() for skill in reversed(skills)]
+    return lambda: predictor.predict_dynamic_careers(respelled)
+
+
+@benchmark("online_partial_fit")
+def _online_partial_fit(scale, seed):
+    """One mini-batch update: copy the serving model, partial_fit, score the holdout, publish"""
+    from ml_career_predictor import DynamicCareerPredictor
+    from online_learning import OnlineCareerLearner
+    predictor = DynamicCareerPredictor()
+    with _quiet():
+        predictor.train_models(generate_training_rows(SCALES[scale]["training_rows"], seed))
+    learner = OnlineCareerLearner(predictor, seed=seed)
+    feedback = generate_training_rows(learner.batch_size, seed + 1)
+    batch = [(row.skills, row.career, 1.0) for row in feedback.itertuples() if row.career in learner.classes]
+    learner._update(batch)  # the first update also bootstraps the SGD model
+    return lambda: learner._update(batch)
+
+
+@benchmark("career_discovery_job", repeat=3)
+def _career_discovery_job(scale, seed):
+    """Offline batch job: cluster the profile store and compute every path's key skills"""
+    from career_discovery import discover_career_paths
+    profiles = generate_profile_rows(SCALES[scale]["profiles"], seed)
+    return lambda: discover_career_paths(profiles, seed=seed)
+
+
+@benchmark("discovered_paths_lookup")
+def _discovered_paths_lookup(scale, seed):
+    """What the UI does per request: read the materialized table by career"""
+    from career_discovery import get_discovery_table, run_discovery_job
+    path = os.path.join(tempfile.gettempdir(), f"aspirepath_bench_paths_{scale}_{seed}.json")
+    profiles = generate_profile_rows(SCALES[scale]["training_rows"], seed)
+    run_discovery_job(profiles, path, min_cluster_size=2, seed=seed)
+    careers = profiles["career"].unique().tolist()
+    return lambda: [get_discovery_table(path).paths_for_career(career) for career in careers]
+
+
+@benchmark("get_skill_importance")
+def _get_skill_importance(scale, seed):
+    from ml_career_predictor import DynamicCareerPredictor
+    predictor = DynamicCareerPredictor()
+    with _quiet():
+        predictor.train_models(generate_training_rows(SCALES[scale]["training_rows"], seed))
+    careers = list(predictor.rf_classifier.classes_)
+    return lambda: [predictor.get_skill_importance(career) for career in careers]
+
+
+def _question_bank(scale, seed):
+    path = os.path.join(tempfile.gettempdir(), f"aspirepath_bench_bank_{scale}_{seed}.json")
+    if not os.path.exists(path):
+        write_question_bank(path, SCALES[scale]["questions"], seed)
+    return path
+
+
+@benchmark("load_questions")
+def _load_questions(scale, seed):
+    from quiz_engine import load_questions
+    path = _question_bank(scale, seed)
+    skills = generate_skills(SCALES[scale]["skills"], seed)
+    return lambda: load_questions(skills, path=path)
+
+
+@benchmark("sample_questions")
+def _sample_questions(scale, seed):
+    """Ten skill-stratified questions, seeded per user (what a quiz actually needs)"""
+    from quiz_engine import sample_questions
+    path = _question_bank(scale, seed)
+    skills = generate_skills(SCALES[scale]["skills"], seed)
+    return lambda: sample_questions(skills, 10, seed=seed, path=path)
+
+
+@benchmark("load_smart_questions")
+def _load_smart_questions(scale, seed):
+    from smart_quiz import load_smart_questions
+    path = _question_bank(scale, seed)
+    skills = generate_skills(SCALES[scale]["skills"], seed)
+    return lambda: load_smart_questions(skills, "Data Analyst", path=path)
+
+
+@benchmark("taxonomy_load")
+def _taxonomy_load(scale, seed):
+    from skill_taxonomy import load_taxonomy
+    path = os.path.join(tempfile.gettempdir(), f"aspirepath_bench_taxonomy_{scale}_{seed}.json")
+    if not os.path.exists(path):
+        write_taxonomy(path, SCALES[scale]["taxonomy_skills"], SCALES[scale]["taxonomy_careers"], seed)
+    return lambda: load_taxonomy(path)
+
+
+def _taxonomy_match_setup(scale, seed):
+    from skill_normalizer import SkillIndex, normalize_skills
+    from skill_taxonomy import CompiledTaxonomy
+    source = generate_taxonomy(SCALES[scale]["taxonomy_skills"], SCALES[scale]["taxonomy_careers"], seed)
+    index = SkillIndex(CompiledTaxonomy(source))
+    skills = normalize_skills(sample_taxonomy_skills(source, SCALES[scale]["skills"], seed))
+    return index, skills
+
+
+@benchmark("match_skills_index")
+def _match_skills_index(scale, seed):
+    """Exact + partial match counts for every career via the inverted n-gram index"""
+    index, skills = _taxonomy_match_setup(scale, seed)
+    return lambda: index.match_counts(skills)
+
+
+@benchmark("match_skills_pairwise")
+def _match_skills_pairwise(scale, seed):
+    """The same counts computed career by career (reference for match_skills_index)"""
+    from skill_normalizer import count_matches, word_ngrams
+    index, skills = _taxonomy_match_setup(scale, seed)
+    taxonomy = index.taxonomy
+    career_ngrams = {
+        career: {ngram for skill in required for ngram in word_ngrams(skill)}
+        for career, required in taxonomy.career_skill_lower.items()
+    }
+
+    def run():
+        return [count_matches(skills, taxonomy.career_skill_sets[career], career_ngrams[career])
+                for career in taxonomy.career_names]
+    return run
+
+
+def _profile_index_setup(scale, seed, query_count=32):
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from ann_index import IVFIndex
+    profiles = generate_profile_texts(SCALES[scale]["profiles"], seed)
+    matrix = TfidfVectorizer().fit_transform(profiles)
+    return IVFIndex(n_probe=8, seed=seed).fit(matrix), matrix[:query_count]
+
+
+@benchmark("ann_search", repeat=5)
+def _ann_search(scale, seed):
+    """Top-10 neighbours for 32 profiles with the IVF index at its default n_probe"""
+    index, queries = _profile_index_setup(scale, seed)
+    return lambda: index.search(queries, k=10)
+
+
+@benchmark("ann_search_exact", repeat=5)
+def _ann_search_exact(scale, seed):
+    """The same queries scored against every profile (brute-force reference)"""
+    index, queries = _profile_index_setup(scale, seed)
+    return lambda: index.exact_search(queries, k=10)
+
+
+@benchmark("parse_resume")
+def _parse_resume(scale, seed):
+    import logging
+    import streamlit as st
+    from helpers_session import parse_resume
+    # Bare-mode session_state access warns on every call outside `streamlit run`
+    logging.getLogger("streamlit.runtime.scriptrunner_utils.script_run_context").setLevel(logging.ERROR)
+    text = generate_resume_text(SCALES[scale]["resume_words"], seed)
+
+    def run():
+        upload = make_resume_file(text, "docx")
+        parse_resume(upload)
+        # Keep the session store from growing across iterations
+        st.session_state.resumes.clear()
+    return run
+
+
+def time_callable(func, repeat=10, warmup=1):
+    """Time a callable and return summary statistics in milliseconds"""
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    p95_index = min(len(samples) - 1, int(round(0.95 * (len(samples) - 1))))
+    return {
+        "repeat": repeat,
+        "min_ms": round(samples[0], 4),
+        "median_ms": round(statistics.median(samples), 4),
+        "mean_ms": round(statistics.fmean(samples), 4),
+        "p95_ms": round(samples[p95_index], 4),
+        "max_ms": round(samples[-1], 4),
+    }
+
+
+def run_suite(names=None, scales=None, repeat=10, seed=42):
+    """
+    Run the registered benchmarks.
+
+    Args:
+        names (list): Benchmark names to run (default: all)
+        scales (list): Scales to run each benchmark at (default: all)
+        repeat (int): Timed iterations per benchmark (overridden by slow benchmarks)
+        seed (int): Seed for every synthetic input
+
+    Returns:
+        dict: {"meta": {...}, "results": {"<name>[<scale>]": stats}}
+    """
+    names = names or list(BENCHMARKS)
+    scales = scales or list(SCALES)
+    results = {}
+
+    for name in names:
+        entry = BENCHMARKS[name]
+        for scale in scales:
+            key = f"{name}[{scale}]"
+            try:
+                with _quiet():
+                    func = entry["setup"](scale, seed)
+                    results[key] = time_callable(func, repeat=min(repeat, entry["repeat"] or repeat))
+                print(f"{key:45s} median {results[key]['median_ms']:10.3f} ms")
+            except Exception as e:
+                print(f"{key:45s} FAILED: {e}")
+                results[key] = {"error": str(e)}
+
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "seed": seed,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def save_results(report, path):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    return path
+
+
+def load_results(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare_results(baseline, current, threshold=0.2, metric="median_ms"):
+    """
+    Compare two benchmark reports.
+
+    Args:
+        baseline (dict): Stored baseline report
+        current (dict): Freshly measured report
+        threshold (float): Allowed relative slowdown (0.2 = 20%)
+        metric (str): Statistic to compare
+
+    Returns:
+        list: One dict per benchmark present in both reports, flagged with 'regression'
+    """
+    rows = []
+    for key, current_stats in current.get("results", {}).items():
+        baseline_stats = baseline.get("results", {}).get(key)
+        if not baseline_stats or metric not in baseline_stats or metric not in current_stats:
+            continue
+        before = baseline_stats[metric]
+        after = current_stats[metric]
+        change = (after - before) / before if before else 0.0
+        rows.append({
+            "benchmark": key,
+            "baseline": before,
+            "current": after,
+            "change": round(change, 4),
+            "regression": change > threshold,
+        })
+    return rows
@@ -0,0 +1,207 @@
+"""
+Offline Career Path Discovery for AspirePath
+Batch job that clusters the whole profile store and materializes the discovered
+career paths, with their key skills, into a JSON table. The app only reads the
+table: lookups by cluster or by related career are dictionary hits.
+
+    python career_discovery.py --profiles profiles.csv --output discovered_career_paths.json
+
+Schedule it (cron, CI) whenever the profile store has grown. Profiles are rows of
+comma-separated "skills" plus a "career" label; without --profiles the job runs on
+DynamicCareerPredictor's built-in dataset. Clustering is MiniBatchKMeans over
+L2-normalized TruncatedSVD reductions of the TF-IDF skill vectors, so memory and
+time stay linear in the number of profiles.
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.decomposition import TruncatedSVD
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from ann_index import l2_normalize
+
+DISCOVERY_TABLE_PATH = os.environ.get(
+    "ASPIREPATH_DISCOVERY_TABLE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "discovered_career_paths.json")
+)
+
+
+def _default_clusters(n_rows):
+    return int(min(n_rows, max(2, np.sqrt(n_rows / 2))))
+
+
+def discover_career_paths(profiles, n_clusters=None, n_components=10, min_cluster_size=3,
+                          key_skill_count=5, batch_size=4096, seed=42):
+    """
+    Cluster skill profiles and describe every cluster that mixes enough careers.
+
+    Args:
+        profiles (pd.DataFrame): "skills" (comma-separated) and "career" columns
+        n_clusters (int): Clusters to find (default ~sqrt(n_rows / 2))
+        n_components (int): SVD dimensions the clustering runs on
+        min_cluster_size (int): Distinct careers a cluster needs to count as a new path
+        key_skill_count (int): Most frequent skills kept per path
+        batch_size (int): MiniBatchKMeans batch size
+        seed (int): Seed for SVD and clustering
+
+    Returns:
+        dict: Table with "paths" (list of path dicts) plus job metadata
+    """
+    started = time.perf_counter()
+    profiles = profiles.reset_index(drop=True)
+    n_rows = len(profiles)
+    if n_rows == 0:
+        raise ValueError("Cannot discover career paths from an empty profile store")
+
+    embeddings = TfidfVectorizer(max_features=1000, stop_words='english', ngram_range=(1, 2),
+                                 dtype=np.float32).fit_transform(profiles['skills'])
+    svd = TruncatedSVD(n_components=max(1, min(n_components, embeddings.shape[1] - 1)), random_state=seed)
+    reduced = l2_normalize(svd.fit_transform(embeddings))
+
+    n_clusters = min(n_clusters or _default_clusters(n_rows), n_rows)
+    kmeans = MiniBatchKMeans(n_clusters=n_clusters, batch_size=batch_size, n_init=3, random_state=seed)
+    labels = kmeans.fit_predict(reduced)
+
+    # One grouped pass each for careers and skills instead of a mask + Counter per cluster
+    members = pd.DataFrame({'cluster': labels, 'career': profiles['career'].to_numpy()})
+    career_counts = members.groupby(['cluster', 'career'], sort=False).size()
+    skills = profiles['skills'].str.split(',').explode().str.strip()
+    skills = pd.DataFrame({'cluster': labels[skills.index.to_numpy()], 'skill': skills.to_numpy()})
+    skills = skills[skills['skill'].notna() & (skills['skill'] != '')]
+    skill_counts = skills.groupby(['cluster', 'skill'], sort=False).size()
+    sizes = np.bincount(labels, minlength=n_clusters)
+
+    paths = []
+    for cluster_id, careers in career_counts.groupby(level='cluster', sort=True):
+        if len(careers) < min_cluster_size:
+            continue
+        careers = careers.droplevel('cluster').sort_values(ascending=False, kind='stable')
+        top_skills = (skill_counts.loc[cluster_id].sort_values(ascending=False, kind='stable')
+                      .head(key_skill_count))
+        paths.append({
+            'cluster_id': int(cluster_id),
+            'suggested_name': f"Specialized {careers.index[0].split()[-1]}",
+            'key_skills': top_skills.index.tolist(),
+            'related_careers': careers.index.tolist(),
+            'profiles': int(sizes[cluster_id]),
+            'emergence_score': round(len(careers) / int(sizes[cluster_id]), 4),
+        })
+
+    return {
+        'generated_at': time.strftime("%Y-%m-%dT%H:%M:%S"),
+        'profiles': n_rows,
+        'n_clusters': n_clusters,
+        'min_cluster_size': min_cluster_size,
+        'elapsed_s': round(time.perf_counter() - started, 3),
+        'paths': paths,
+    }
+
+
+def run_discovery_job(profiles=None, output=DISCOVERY_TABLE_PATH, **options):
+    """
+    Discover career paths and atomically replace the materialized table.
+
+    Args:
+        profiles (pd.DataFrame): Profile store; defaults to DynamicCareerPredictor's dataset
+        output (str): Table path readers load from
+        **options: Passed to discover_career_paths
+
+    Returns:
+        dict: The table that was written
+    """
+    if profiles is None:
+        from ml_career_predictor import DynamicCareerPredictor
+        profiles = DynamicCareerPredictor().create_synthetic_dataset()
+    table = discover_career_paths(profiles, **options)
+    # Write next to the target and rename, so the app never reads a half-written table
+    temp_path = f"{output}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(table, f, indent=2)
+    os.replace(temp_path, output)
+    return table
+
+
+class DiscoveryTable:
+    """Read-only, indexed view of a materialized discovery table"""
+
+    def __init__(self, table=None, path=None, mtime=None):
+        table = table or {'paths': []}
+        self.path = path
+        self.mtime = mtime
+        self.generated_at = table.get('generated_at')
+        self.min_cluster_size = table.get('min_cluster_size', 0)
+        self.paths = table['paths']
+        self.by_cluster = {path['cluster_id']: path for path in self.paths}
+        self.by_career = {}
+        for path in self.paths:
+            for career in path['related_careers']:
+                self.by_career.setdefault(career, []).append(path)
+
+    def paths_for_career(self, career):
+        """Discovered paths that include `career`"""
+        return self.by_career.get(career, [])
+
+    def path_for_cluster(self, cluster_id):
+        """The discovered path for one cluster, or None"""
+        return self.by_cluster.get(cluster_id)
+
+
+_tables = {}
+_tables_lock = threading.Lock()
+
+
+def get_discovery_table(path=DISCOVERY_TABLE_PATH):
+    """
+    Load the materialized table once and reuse it until the job rewrites the file.
+
+    Returns:
+        DiscoveryTable: Empty when the job has not run yet
+    """
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        mtime = None
+    table = _tables.get(path)
+    if table is not None and table.mtime == mtime:
+        return table
+    with _tables_lock:
+        table = _tables.get(path)
+        if table is None or table.mtime != mtime:
+            try:
+                with open(path, encoding="utf-8") as f:
+                    table = DiscoveryTable(json.load(f), path, mtime)
+            except (OSError, ValueError) as e:
+                if mtime is not None:
+                    print(f"Error loading discovery table {path}: {e}")
+                table = DiscoveryTable(path=path, mtime=mtime)
+            _tables[path] = table
+    return table
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="AspirePath offline career path discovery job")
+    parser.add_argument("--profiles", help="CSV profile store with 'skills' and 'career' columns")
+    parser.add_argument("--output", default=DISCOVERY_TABLE_PATH)
+    parser.add_argument("--clusters", type=int, default=None)
+    parser.add_argument("--min-cluster-size", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    profiles = pd.read_csv(args.profiles) if args.profiles else None
+    table = run_discovery_job(profiles, args.output, n_clusters=args.clusters,
+                              min_cluster_size=args.min_cluster_size, seed=args.seed)
+    print(f"🚀 {len(table['paths'])} career paths from {table['profiles']} profiles "
+          f"in {table['n_clusters']} clusters ({table['elapsed_s']:.2f}s) -> {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
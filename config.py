@@ -1,9 +1,12 @@
-SKILL_TEMPLATES = {
-    "Data Analyst": ["Excel", "SQL", "Python", "Tableau", "Statistics", "Power BI", "Data Analysis", "Analytics", "R", "SPSS", "Data Visualization", "Pandas", "NumPy"],
-    "Web Developer": ["HTML", "CSS", "JavaScript", "React", "Node.js", "MongoDB", "Angular", "Vue", "Frontend", "Backend", "Web Development", "Bootstrap", "jQuery"],
-    "ML Engineer": ["Python", "NumPy", "Pandas", "Scikit-learn", "Deep Learning", "Machine Learning", "TensorFlow", "PyTorch", "Data Science", "Statistics"],
-    "Cybersecurity Analyst": ["Network Security", "Cryptography", "Firewalls", "Linux", "Ethical Hacking", "Penetration Testing", "Security Analysis", "Cybersecurity"],
-    "AI Engineer": ["Python", "TensorFlow", "PyTorch", "Machine Learning", "Neural Networks", "Artificial Intelligence", "Deep Learning", "NLP", "Computer Vision"],
-    "Software Developer": ["C++", "Java", "Python", "Data Structures", "Algorithms", "Programming", "Software Development", "C#", ".NET", "Object-Oriented Programming"],
-    "Game Developer": ["C++", "Unity", "Unreal Engine", "Game Physics", "3D Modeling", "Game Development", "C#", "Graphics Programming", "Animation"]
-}
+from skill_taxonomy import get_taxonomy, register_reload_hook
+
+# Career -> required skills, compiled from skill_taxonomy.json (the single source of truth)
+SKILL_TEMPLATES = get_taxonomy().skill_templates()
+
+
+def _refresh_skill_templates(taxonomy):
+    SKILL_TEMPLATES.clear()
+    SKILL_TEMPLATES.update(taxonomy.skill_templates())
+
+
+register_reload_hook(_refresh_skill_templates)
@@ -1,4 +1,7 @@
-from config import SKILL_TEMPLATES
+from skill_taxonomy import get_taxonomy, register_reload_hook
+from skill_normalizer import extract_skill_ids, get_skill_index, normalize_skills, word_ngrams
+from tracing import traced
+from quiz_scoring import REVIEW_THRESHOLD
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 
@@ -17,21 +20,21 @@ except Exception as e:
     MONGODB_AVAILABLE = False
     skills_collection = None
 
-# Predefined career goals and their associated skills (comprehensive and inclusive)
-CAREER_SKILLS = {
-    "Data Analyst": "Excel, SQL, Python, Tableau, Statistics, Power BI, Data Analysis, Analytics, R, SPSS, Data Visualization, Pandas, NumPy",
-    "Web Developer": "HTML, CSS, JavaScript, React, Node.js, MongoDB, Angular, Vue, Frontend, Backend, Web Development, Bootstrap, jQuery",
-    "ML Engineer": "Python, NumPy, Pandas, Scikit-learn, Deep Learning, Machine Learning, TensorFlow, PyTorch, Data Science, Statistics",
-    "Cybersecurity Analyst": "Network Security, Cryptography, Firewalls, Linux, Ethical Hacking, Penetration Testing, Security Analysis, Cybersecurity",
-    "AI Engineer": "Python, TensorFlow, PyTorch, Machine Learning, Neural Networks, Artificial Intelligence, Deep Learning, NLP, Computer Vision",
-    "Software Developer": "C++, Java, Python, Data Structures, Algorithms, Programming, Software Development, C#, .NET, Object-Oriented Programming",
-    "Game Developer": "C++, Unity, Unreal Engine, Game Physics, 3D Modeling, Game Development, C#, Graphics Programming, Animation"
-}
+# Predefined career goals and their associated skills (comprehensive and inclusive).
+# Kept for compatibility; the engines below read the compiled taxonomy directly.
+CAREER_SKILLS = get_taxonomy().career_skill_strings()
 
+def _refresh_career_skills(taxonomy):
+    CAREER_SKILLS.clear()
+    CAREER_SKILLS.update(taxonomy.career_skill_strings())
+
+register_reload_hook(_refresh_career_skills)
+
+@traced("assess_skills")
 def assess_skills(text):
-    found = []
-    for skills in SKILL_TEMPLATES.values():
-        found += [skill for skill in skills if skill.lower() in text.lower()]
+    taxonomy = get_taxonomy()
+    # Names and aliases are matched on whole words, so "JavaScript" no longer yields "Java"
+    found = [taxonomy.skill_names[i] for i in extract_skill_ids(text)]
     # Store the extracted skills in the database (if available)
     if MONGODB_AVAILABLE and skills_collection is not None:
         try:
@@ -41,14 +44,58 @@ def assess_skills(text):
     return list(set(found))
 
 def select_goal():
-    return list(SKILL_TEMPLATES.keys())
+    return list(get_taxonomy().career_names)
+
+@traced("generate_roadmap")
+def generate_roadmap(user_skills, goal, mastery=None):
+    """
+    Roadmap steps towards a career goal.
+
+    Args:
+        user_skills (list): Skills the user has
+        goal (str): Career goal
+        mastery (SkillMastery): Optional quiz mastery table; required skills the user
+            lists but scored below REVIEW_THRESHOLD on get a "Review" step
 
-def generate_roadmap(user_skills, goal):
-    required = SKILL_TEMPLATES.get(goal, [])
+    Returns:
+        tuple: (roadmap steps, required skills)
+    """
+    required = list(get_taxonomy().career_skill_lists.get(goal, ()))
     missing = list(set(required) - set(user_skills))
     roadmap = [f"Learn {skill}" for skill in missing]
+    if mastery is not None:
+        for skill in required:
+            score = mastery.get(skill) if skill not in missing else None
+            if score is not None and score < REVIEW_THRESHOLD:
+                roadmap.append(f"Review {skill} (quiz mastery {score:.0%})")
     return roadmap, required
 
+def _score_careers(normalized_user_skills):
+    """
+    Scores every career against normalized user skills (see skill_normalizer).
+
+    Returns:
+        dict: Career -> score (exact matches count 2, whole-word partial matches
+              0.5, normalized by the number of required skills)
+    """
+    index = get_skill_index()
+    taxonomy = index.taxonomy
+    # One inverted-index lookup per user skill instead of user x career skill comparisons
+    exact_counts, partial_counts = index.match_counts(normalized_user_skills)
+    career_scores = {}
+    
+    # Calculate scores for each career path
+    for position, career in enumerate(taxonomy.career_names):
+        # Calculate total score (exact matches weighted more heavily)
+        total_score = exact_counts[position] * 2 + (partial_counts[position] * 0.5)
+        
+        # Normalize by career requirements (careers with fewer requirements get slight boost)
+        normalized_score = total_score / len(taxonomy.career_skill_lower[career]) * 100
+        
+        career_scores[career] = normalized_score
+    
+    return career_scores
+
 def predict_career(user_skills):
     """
     Predicts the most suitable career goal based on user skills using improved matching.
@@ -62,37 +109,10 @@ def predict_career(user_skills):
     if not user_skills:
         return "Generalist"
     
-    # Normalize user skills for better matching
-    normalized_user_skills = [skill.strip().lower() for skill in user_skills]
+    # Normalize user skills (aliases, casing, punctuation) for better matching
+    normalized_user_skills = normalize_skills(user_skills)
     
-    career_scores = {}
-    
-    # Calculate scores for each career path
-    for career, skills_str in CAREER_SKILLS.items():
-        career_skills = [skill.strip().lower() for skill in skills_str.split(",")]
-        
-        # Count exact matches
-        exact_matches = 0
-        partial_matches = 0
-        
-        for user_skill in normalized_user_skills:
-            # Check for exact matches
-            if user_skill in career_skills:
-                exact_matches += 2  # Weight exact matches higher
-            else:
-                # Check for partial matches (contains)
-                for career_skill in career_skills:
-                    if user_skill in career_skill or career_skill in user_skill:
-                        partial_matches += 1
-                        break
-        
-        # Calculate total score (exact matches weighted more heavily)
-        total_score = exact_matches + (partial_matches * 0.5)
-        
-        # Normalize by career requirements (careers with fewer requirements get slight boost)
-        normalized_score = total_score / len(career_skills) * 100
-        
-        career_scores[career] = normalized_score
+    career_scores = _score_careers(normalized_user_skills)
     
     # Find the best matching career
     if not career_scores or max(career_scores.values()) == 0:
@@ -121,37 +141,10 @@ def get_career_matches(user_skills):
     if not user_skills:
         return {}
     
-    # Normalize user skills for better matching
-    normalized_user_skills = [skill.strip().lower() for skill in user_skills]
+    # Normalize user skills (aliases, casing, punctuation) for better matching
+    normalized_user_skills = normalize_skills(user_skills)
     
-    career_scores = {}
-    
-    # Calculate scores for each career path
-    for career, skills_str in CAREER_SKILLS.items():
-        career_skills = [skill.strip().lower() for skill in skills_str.split(",")]
-        
-        # Count exact matches
-        exact_matches = 0
-        partial_matches = 0
-        
-        for user_skill in normalized_user_skills:
-            # Check for exact matches
-            if user_skill in career_skills:
-                exact_matches += 2  # Weight exact matches higher
-            else:
-                # Check for partial matches (contains)
-                for career_skill in career_skills:
-                    if user_skill in career_skill or career_skill in user_skill:
-                        partial_matches += 1
-                        break
-        
-        # Calculate total score (exact matches weighted more heavily)
-        total_score = exact_matches + (partial_matches * 0.5)
-        
-        # Normalize by career requirements (careers with fewer requirements get slight boost)
-        normalized_score = total_score / len(career_skills) * 100
-        
-        career_scores[career] = normalized_score
+    career_scores = _score_careers(normalized_user_skills)
     
     # Sort by score (highest first)
     sorted_careers = sorted(career_scores.items(), key=lambda x: x[1], reverse=True)
@@ -168,24 +161,18 @@ def predict_career_by_keywords(normalized_user_skills):
     Returns:
         str: Predicted career goal
     """
-    # Define keyword patterns for each career
-    career_keywords = {
-        "Data Analyst": ["excel", "sql", "tableau", "power bi", "statistics", "data", "analytics", "powerbi"],
-        "Web Developer": ["html", "css", "javascript", "react", "angular", "vue", "web", "frontend", "backend", "node"],
-        "ML Engineer": ["machine learning", "ml", "numpy", "pandas", "scikit", "sklearn", "data science"],
-        "AI Engineer": ["ai", "artificial intelligence", "tensorflow", "pytorch", "neural", "deep learning"],
-        "Cybersecurity Analyst": ["security", "cyber", "network", "firewall", "encryption", "hacking", "penetration"],
-        "Software Developer": ["java", "c++", "programming", "algorithms", "data structures", "software", "development"],
-        "Game Developer": ["unity", "unreal", "game", "gaming", "3d", "physics", "graphics"]
-    }
+    # Keyword patterns for each career (from the taxonomy's keyword_fallback section)
+    career_keywords = get_taxonomy().keyword_fallback
     
     career_scores = {}
     
+    # Whole-word matching, so a short skill like "c" doesn't hit "excel" or "security"
+    user_ngrams = [(user_skill, word_ngrams(user_skill)) for user_skill in normalized_user_skills]
     for career, keywords in career_keywords.items():
         score = 0
-        for user_skill in normalized_user_skills:
+        for user_skill, skill_ngrams in user_ngrams:
             for keyword in keywords:
-                if keyword in user_skill or user_skill in keyword:
+                if keyword in skill_ngrams or user_skill in word_ngrams(keyword):
                     score += 1
                     break
         career_scores[career] = score
@@ -3,7 +3,11 @@
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
+from skill_taxonomy import get_taxonomy
+from skill_normalizer import count_matches, display_skills, get_skill_index, normalize_skills, word_ngrams
+from tracing import traced
 
+@traced("predict_career_enhanced")
 def predict_career_enhanced(user_skills):
     """
     Enhanced career prediction with ML-based confidence scoring and multiple suggestions.
@@ -19,20 +23,12 @@ def predict_career_enhanced(user_skills):
             'method': 'fallback'
         }
     
-    # Your existing career skills data
-    CAREER_SKILLS = {
-        "Data Analyst": "Excel, SQL, Python, Tableau, Statistics, Power BI, Data Analysis, Analytics, R, SPSS, Data Visualization, Pandas, NumPy",
-        "Web Developer": "HTML, CSS, JavaScript, React, Node.js, MongoDB, Angular, Vue, Frontend, Backend, Web Development, Bootstrap, jQuery",
-        "ML Engineer": "Python, NumPy, Pandas, Scikit-learn, Deep Learning, Machine Learning, TensorFlow, PyTorch, Data Science, Statistics",
-        "Cybersecurity Analyst": "Network Security, Cryptography, Firewalls, Linux, Ethical Hacking, Penetration Testing, Security Analysis, Cybersecurity",
-        "AI Engineer": "Python, TensorFlow, PyTorch, Machine Learning, Neural Networks, Artificial Intelligence, Deep Learning, NLP, Computer Vision",
-        "Software Developer": "C++, Java, Python, Data Structures, Algorithms, Programming, Software Development, C#, .NET, Object-Oriented Programming",
-        "Game Developer": "C++, Unity, Unreal Engine, Game Physics, 3D Modeling, Game Development, C#, Graphics Programming, Animation"
-    }
+    # Career requirements come from the compiled skill taxonomy
+    taxonomy = get_taxonomy()
     
-    # Create documents for TF-IDF analysis
-    user_skills_text = " ".join(user_skills)
-    career_documents = [skills_text for skills_text in CAREER_SKILLS.values()]
+    # Create documents for TF-IDF analysis (aliases like "PowerBI" mapped to "Power BI")
+    user_skills_text = " ".join(display_skills(user_skills))
+    career_documents = list(taxonomy.career_documents)
     all_documents = [user_skills_text] + career_documents
     
     # Use TF-IDF for better text similarity (you already have this imported!)
@@ -48,7 +44,7 @@ def predict_career_enhanced(user_skills):
         
         # Create career predictions with confidence scores
         career_predictions = []
-        career_names = list(CAREER_SKILLS.keys())
+        career_names = taxonomy.career_names
         
         for i, similarity in enumerate(similarities):
             confidence = min(similarity * 100, 100)  # Convert to percentage, cap at 100
@@ -62,8 +58,9 @@ def predict_career_enhanced(user_skills):
         career_predictions.sort(key=lambda x: x['confidence'], reverse=True)
         
         # Apply your existing rule-based scoring as a boost
+        rule_based_scores = calculate_rule_based_scores(user_skills)
         for pred in career_predictions:
-            rule_based_score = calculate_rule_based_score(user_skills, pred['career'], CAREER_SKILLS)
+            rule_based_score = rule_based_scores[pred['career']]
             # Combine ML score with rule-based score (weighted average)
             combined_score = (pred['confidence'] * 0.6) + (rule_based_score * 0.4)
             pred['confidence'] = round(combined_score, 1)
@@ -90,25 +87,31 @@ def predict_career_enhanced(user_skills):
             'method': 'rule_based_fallback'
         }
 
-def calculate_rule_based_score(user_skills, career, career_skills_dict):
+def _rule_score(exact, partial, required_count):
+    total_score = exact * 2 + partial * 0.5
+    normalized_score = (total_score / required_count) * 100 if required_count else 0
+    return min(normalized_score, 100)
+
+def calculate_rule_based_scores(user_skills):
+    """Rule-based score for every taxonomy career, from one pass over the skill index"""
+    index = get_skill_index()
+    taxonomy = index.taxonomy
+    exact_counts, partial_counts = index.match_counts(normalize_skills(user_skills))
+    return {
+        career: _rule_score(exact_counts[i], partial_counts[i], len(taxonomy.career_skill_lower[career]))
+        for i, career in enumerate(taxonomy.career_names)
+    }
+
+def calculate_rule_based_score(user_skills, career, career_skills_dict=None):
     """Calculate rule-based score using your existing logic"""
-    skills_str = career_skills_dict.get(career, "")
-    career_skills = [skill.strip().lower() for skill in skills_str.split(",")]
-    normalized_user_skills = [skill.strip().lower() for skill in user_skills]
-    
-    exact_matches = sum(2 for user_skill in normalized_user_skills if user_skill in career_skills)
-    partial_matches = 0
-    
-    for user_skill in normalized_user_skills:
-        if user_skill not in career_skills:
-            for career_skill in career_skills:
-                if user_skill in career_skill or career_skill in user_skill:
-                    partial_matches += 0.5
-                    break
+    if career_skills_dict is None:
+        return calculate_rule_based_scores(user_skills).get(career, 0)
     
-    total_score = exact_matches + partial_matches
-    normalized_score = (total_score / len(career_skills)) * 100 if career_skills else 0
-    return min(normalized_score, 100)
+    skills_str = career_skills_dict.get(career, "")
+    career_skills = normalize_skills(skills_str.split(","))
+    career_ngrams = {ngram for skill in career_skills for ngram in word_ngrams(skill)}
+    exact, partial = count_matches(normalize_skills(user_skills), set(career_skills), career_ngrams)
+    return _rule_score(exact, partial, len(career_skills))
 
 # Test the enhanced function
 if __name__ == "__main__":
@@ -5,9 +5,14 @@ from PyPDF2 import PdfReader
 from docx import Document
 import hashlib
 from datetime import datetime
+from tracing import traced
+from online_learning import record_event
+from quiz_scoring import SkillMastery
+from records import AchievementRecord, QuizRecord, ResumeRecord, RoadmapRecord, content_hash
+from session_store import SESSION_CAPACITIES, bounded, memory_report
 
 # Session State Database Setup
-@st.cache_resource
+# Not cached: session_state is per session, so this must run for every new session
 def init_session_state_db():
     """Initialize session state collections for data storage"""
     try:
@@ -30,31 +35,28 @@ def init_session_state_db():
                 }
             ]
             st.session_state.users.extend(demo_users)
-        if 'resumes' not in st.session_state:
-            st.session_state.resumes = []
         if 'skills' not in st.session_state:
             st.session_state.skills = []
-        if 'quiz_results' not in st.session_state:
-            st.session_state.quiz_results = []
-        if 'roadmaps' not in st.session_state:
-            st.session_state.roadmaps = []
-        if 'progress' not in st.session_state:
-            st.session_state.progress = []
+        if 'skill_mastery' not in st.session_state:
+            st.session_state.skill_mastery = {}
+        # History collections are bounded ring buffers (plain lists assigned elsewhere are converted)
+        for name in SESSION_CAPACITIES:
+            st.session_state[name] = bounded(st.session_state.get(name), name)
         return True
     except Exception as e:
         print(f"Error initializing session state: {e}")
         # Force reinitialize with empty lists
         st.session_state.users = []
-        st.session_state.resumes = []
         st.session_state.skills = []
-        st.session_state.quiz_results = []
-        st.session_state.roadmaps = []
-        st.session_state.progress = []
+        st.session_state.skill_mastery = {}
+        for name in SESSION_CAPACITIES:
+            st.session_state[name] = bounded(None, name)
         return False
 
 # Initialize session state database
 init_session_state_db()
 
+@traced("parse_resume")
 def parse_resume(file):
     """Parse resume and store in session state with enhanced error handling"""
     try:
@@ -82,22 +84,16 @@ def parse_resume(file):
 
         # Ensure session state is properly initialized
         init_session_state_db()
-        
-        # Ensure resumes list exists and is properly initialized
-        if 'resumes' not in st.session_state or st.session_state.resumes is None:
-            st.session_state.resumes = []
 
-        # Store the parsed resume in session state
-        resume_data = {
-            "file_name": file.name, 
-            "content": text.strip(),
-            "uploaded_at": datetime.now().isoformat(),
-            "file_size": len(text),
-            "file_type": file_type
-        }
-        
-        st.session_state.resumes.append(resume_data)
-        return text.strip()
+        # Record a reference to the resume; reruns re-parse the same upload, so repeats are skipped
+        text = text.strip()
+        digest = content_hash(text)
+        latest = st.session_state.resumes.latest()
+        if latest is None or latest.content_hash != digest or latest.file_name != file.name:
+            st.session_state.resumes.append(
+                ResumeRecord(digest, file.name, file_type, len(text), datetime.now().isoformat())
+            )
+        return text
         
     except Exception as e:
         # Enhanced error handling with specific error messages
@@ -107,8 +103,6 @@ def parse_resume(file):
         # Initialize session state if needed
         try:
             init_session_state_db()
-            if 'resumes' not in st.session_state:
-                st.session_state.resumes = []
         except:
             pass
             
@@ -159,6 +153,8 @@ def store_quiz_results(user_id, quiz_results):
     Args:
         user_id (str): The ID of the user taking the quiz.
         quiz_results (dict): A dictionary containing quiz details (e.g., score, total questions, wrong answers).
+            Wrong-answer question dicts are stored as question ids; a "per_skill" breakdown
+            (quiz_scoring) also updates the user's skill mastery table.
 
     Returns:
         bool: True if stored successfully, False otherwise
@@ -166,23 +162,37 @@ def store_quiz_results(user_id, quiz_results):
     try:
         init_session_state_db()
         
-        # Prepare the complete quiz record
-        quiz_record = {
-            "user_id": user_id,
-            "timestamp": datetime.now().isoformat(),
-            "date": datetime.now().strftime("%Y-%m-%d"),
-            **quiz_results  # Merge in the provided quiz data
-        }
+        now = datetime.now()
+        quiz_record = QuizRecord.from_results(user_id, now.isoformat(), now.strftime("%Y-%m-%d"), quiz_results)
         
         # Add to session state
         st.session_state.quiz_results.append(quiz_record)
+        if quiz_results.get("per_skill"):
+            get_skill_mastery(user_id).update(quiz_results["per_skill"])
+        record_event("quiz", user_id, quiz_record.as_dict())
         return True
         
     except Exception as e:
         print(f"Error storing quiz results: {e}")
         return False
 
-def store_roadmap(user_id, career_goal, roadmap):
+def get_skill_mastery(user_id):
+    """
+    The user's skill mastery table, updated incrementally by store_quiz_results.
+
+    Args:
+        user_id (str): The ID of the user.
+
+    Returns:
+        SkillMastery: Empty for users who have not finished a quiz
+    """
+    init_session_state_db()
+    mastery = st.session_state.skill_mastery.get(user_id)
+    if mastery is None:
+        mastery = st.session_state.skill_mastery[user_id] = SkillMastery()
+    return mastery
+
+def store_roadmap(user_id, career_goal, roadmap, skills=None):
     """
     Stores the generated roadmap in session state.
 
@@ -190,19 +200,19 @@ def store_roadmap(user_id, career_goal, roadmap):
         user_id (str): The ID of the user.
         career_goal (str): The career goal specified by the user.
         roadmap (list): A list of steps in the roadmap.
+        skills (list): The skills the career was predicted from; when given, the
+            roadmap counts as an accepted prediction for online learning.
 
     Returns:
         None
     """
     init_session_state_db()
     
-    roadmap_data = {
-        "user_id": user_id, 
-        "career_goal": career_goal, 
-        "roadmap": roadmap,
-        "created_at": datetime.now().isoformat()
-    }
-    st.session_state.roadmaps.append(roadmap_data)
+    st.session_state.roadmaps.append(
+        RoadmapRecord.from_roadmap(user_id, career_goal, roadmap, datetime.now().isoformat())
+    )
+    if skills:
+        record_event("accepted_prediction", user_id, {"career": career_goal, "skills": skills})
 
 def validate_email(email):
     """
@@ -271,18 +281,20 @@ def store_progress_achievement(user_email, user_name, achievement_data):
     try:
         init_session_state_db()
         
-        # Prepare the complete achievement record
-        achievement_record = {
+        # Prepare the complete achievement record (provided fields override the defaults)
+        now = datetime.now()
+        achievement_record = AchievementRecord.from_dict({
             "user_id": user_email,
             "user_name": user_name,
-            "date": datetime.now().isoformat(),
-            "week": datetime.now().strftime("%Y-W%U"),
-            "created_at": datetime.now().isoformat(),
-            **achievement_data  # Merge in the provided achievement data
-        }
+            "date": now.isoformat(),
+            "week": now.strftime("%Y-W%U"),
+            "created_at": now.isoformat(),
+            **achievement_data
+        })
         
         # Add to session state
         st.session_state.progress.append(achievement_record)
+        record_event("achievement", user_email, achievement_record.as_dict())
         return True
         
     except Exception as e:
@@ -431,7 +443,7 @@ def find_user_by_email(email):
 
 # Session State Database Statistics (for debugging)
 def get_session_stats():
-    """Get statistics about session state database"""
+    """Get statistics about session state database, including a per-collection memory report"""
     init_session_state_db()
     
     return {
@@ -439,5 +451,10 @@ def get_session_stats():
         "total_resumes": len(st.session_state.resumes),
         "total_quiz_results": len(st.session_state.quiz_results),
         "total_roadmaps": len(st.session_state.roadmaps),
-        "total_progress_entries": len(st.session_state.progress)
+        "total_progress_entries": len(st.session_state.progress),
+        "memory": memory_report({
+            "users": st.session_state.users,
+            "skill_mastery": list(st.session_state.skill_mastery.values()),
+            **{name: st.session_state[name] for name in SESSION_CAPACITIES},
+        })
     }
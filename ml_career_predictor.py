@@ -1,41 +1,114 @@
 # 🤖 Advanced ML-based Career Prediction System
 import numpy as np
 import pandas as pd
+from scipy import sparse
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 from sklearn.cluster import KMeans, DBSCAN
-from sklearn.decomposition import PCA
-from sklearn.neighbors import NearestNeighbors
+from sklearn.decomposition import TruncatedSVD
 from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
 import json
+import os
 import pickle
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from ann_index import IVFIndex, l2_normalize, top_k as top_k_indices
+from career_discovery import DISCOVERY_TABLE_PATH, DiscoveryTable, discover_career_paths, get_discovery_table
+from skill_normalizer import display_skills
 from typing import List, Dict, Tuple
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def _peak_rss_mb():
+    """Process peak resident memory in MB (None where unavailable)"""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is kilobytes on Linux, bytes on macOS
+    return round(rss / (1024 * 1024 if os.uname().sysname == "Darwin" else 1024), 1)
+
+
+def _timed(fit):
+    """
+    Run `fit` and return (result, stats). Peak RSS is process-wide: rss_growth_mb is
+    exact when models are fitted one at a time (n_jobs=1) and approximate when they overlap.
+    """
+    rss_before = _peak_rss_mb()
+    started = time.perf_counter()
+    result = fit()
+    peak = _peak_rss_mb()
+    return result, {
+        'fit_s': round(time.perf_counter() - started, 3),
+        'peak_rss_mb': peak,
+        'rss_growth_mb': None if peak is None else round(peak - rss_before, 1),
+    }
+
+
+def _print_fit_progress(name, stats):
+    memory = f", peak RSS {stats['peak_rss_mb']} MB" if stats['peak_rss_mb'] is not None else ""
+    print(f"   ⏱️ {name}: {stats['fit_s']:.2f}s{memory}")
+
 class DynamicCareerPredictor:
     """
     Advanced ML-based career prediction system that discovers dynamic career paths
     instead of using predefined categories.
     """
     
-    def __init__(self):
+    # Upper bound on rows DBSCAN sees (its memory grows with neighbourhood sizes)
+    DBSCAN_MAX_ROWS = 10000
+    # Features kept pre-sorted per career for get_skill_importance
+    CAREER_IMPORTANCE_TOP_K = 25
+    # Predictions (with their explanations) kept per normalized skill set
+    PREDICTION_CACHE_SIZE = 4096
+    # Layout of save_model pickles; bump when the saved keys change
+    # (1: pca/nn_model, 2: svd/nn_index/training_careers/fast_model and training profiles)
+    MODEL_FORMAT_VERSION = 2
+    # Saved keys prediction cannot run without
+    REQUIRED_MODEL_KEYS = ('tfidf_vectorizer', 'kmeans', 'nn_index', 'rf_classifier', 'training_careers')
+    # Terms listed per explanation
+    EXPLANATION_TERMS = 3
+    
+    def __init__(self, default_mode: str = "fast", n_jobs: int = -1):
         self.tfidf_vectorizer = TfidfVectorizer(
             max_features=1000,
             stop_words='english',
-            ngram_range=(1, 2)
+            ngram_range=(1, 2),
+            dtype=np.float32
         )
         self.kmeans = KMeans(n_clusters=15, random_state=42)  # More clusters than predefined
         self.dbscan = DBSCAN(eps=0.3, min_samples=3)
-        self.pca = PCA(n_components=10)
-        self.nn_model = NearestNeighbors(n_neighbors=5, metric='cosine')
+        self.svd = TruncatedSVD(n_components=10, random_state=42)  # PCA-like reduction that accepts sparse input
+        self.nn_index = IVFIndex(n_probe=8)  # Approximate cosine neighbours (exact below 2048 rows)
         self.rf_classifier = RandomForestClassifier(n_estimators=100, random_state=42)
+        self.fast_model = None  # Distilled LogisticRegression (see distill_fast_model)
+        self.model_version = 0  # Bumped when online_learning publishes a new fast model
+        self.default_mode = default_mode
+        self.n_jobs = n_jobs  # Training threads / forest cores (-1 = all cores)
+        self.training_report = {}
+        self.career_importances = None  # (n_careers, n_features), see _compute_career_importances
+        self.career_importance_index = {}
+        self.career_centroids = None  # (n_careers, n_features) mean TF-IDF profile, unit rows
+        self.career_top_features = {}
+        self.feature_names = None
         
         # Storage for learned patterns
         self.career_clusters = {}
         self.skill_embeddings = None
         self.career_names = []
+        self.training_careers = []
+        self.training_texts = []
         self.is_trained = False
+        self._prediction_cache = OrderedDict()
+        self._discovered_paths = None  # In-memory discovery when no materialized table exists
+        self._cache_lock = threading.Lock()
         
     def create_synthetic_dataset(self) -> pd.DataFrame:
         """
@@ -79,199 +152,506 @@ class DynamicCareerPredictor:
         
         return pd.DataFrame(training_data)
     
-    def train_models(self, df=None):
-        """Train all ML models on the dataset"""
+    def _fit_dbscan(self, embeddings):
+        # DBSCAN clustering; its neighbourhoods grow quadratically on dense regions,
+        # so large corpora are clustered on a fixed-size deterministic sample
+        dbscan_rows = embeddings
+        if dbscan_rows.shape[0] > self.DBSCAN_MAX_ROWS:
+            sample = np.random.default_rng(42).choice(dbscan_rows.shape[0], self.DBSCAN_MAX_ROWS, replace=False)
+            dbscan_rows = dbscan_rows[np.sort(sample)]
+        return self.dbscan.fit_predict(dbscan_rows)
+    
+    def _fit_svd(self, embeddings):
+        # Truncated SVD for dimensionality reduction (needs more features than components)
+        self.svd.n_components = max(1, min(10, embeddings.shape[1] - 1))
+        return self.svd.fit_transform(embeddings)
+    
+    def train_models(self, df=None, n_jobs: int = None, progress=None):
+        """
+        Train all ML models on the dataset
+        
+        The independent models (K-Means, DBSCAN, SVD, neighbour index, Random Forest)
+        are fitted concurrently on a thread pool. Every model has a fixed seed, so
+        results don't depend on n_jobs.
+        
+        n_jobs: worker threads, also passed to the forest (-1 = all cores, 1 = sequential);
+                defaults to the value given to the constructor
+        progress: callable(model_name, stats) invoked as each model finishes;
+                  defaults to printing a line per model
+        """
         if df is None:
             df = self.create_synthetic_dataset()
+        n_jobs = self.n_jobs if n_jobs is None else n_jobs
+        workers = (os.cpu_count() or 1) if n_jobs == -1 else max(1, n_jobs)
+        progress = progress or _print_fit_progress
+        started = time.perf_counter()
         
         # Prepare skill embeddings using TF-IDF
         skill_texts = df['skills'].tolist()
-        self.skill_embeddings = self.tfidf_vectorizer.fit_transform(skill_texts)
-        
-        # Train clustering models
-        skills_dense = self.skill_embeddings.toarray()
-        
-        # K-Means clustering
-        self.kmeans.fit(skills_dense)
+        embeddings, tfidf_stats = _timed(lambda: self.tfidf_vectorizer.fit_transform(skill_texts))
+        self.skill_embeddings = embeddings
+        progress('tfidf', tfidf_stats)
+        fit_stats = {'tfidf': tfidf_stats}
         
-        # DBSCAN clustering
-        dbscan_labels = self.dbscan.fit_predict(skills_dense)
-        
-        # PCA for dimensionality reduction
-        skills_pca = self.pca.fit_transform(skills_dense)
-        
-        # Nearest Neighbors for recommendations
-        self.nn_model.fit(skills_dense)
-        
-        # Random Forest for classification
-        self.rf_classifier.fit(skills_dense, df['career'])
+        # Everything below consumes the sparse float32 TF-IDF matrix directly;
+        # a dense copy would be n_rows x 1000 floats
+        self.rf_classifier.set_params(n_jobs=n_jobs)
+        careers = df['career'].tolist()
+        tasks = {
+            # Longest first so it starts immediately
+            'random_forest': lambda: self.rf_classifier.fit(embeddings, careers),
+            'kmeans': lambda: self.kmeans.fit(embeddings),
+            'dbscan': lambda: self._fit_dbscan(embeddings),
+            'svd': lambda: self._fit_svd(embeddings),
+            'nn_index': lambda: self.nn_index.fit(embeddings),
+        }
+        with ThreadPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            futures = {pool.submit(_timed, fit): name for name, fit in tasks.items()}
+            for future in as_completed(futures):
+                name = futures[future]
+                _, fit_stats[name] = future.result()
+                progress(name, fit_stats[name])
         
-        # Store career information
+        # Store career information (neighbour ids index into training_careers)
         self.career_names = df['career'].unique().tolist()
+        self.training_careers = careers
+        self.training_texts = skill_texts
         
         # Create cluster-to-career mapping
-        for i, career in enumerate(df['career']):
+        for i, career in enumerate(careers):
             cluster_id = self.kmeans.labels_[i]
             if cluster_id not in self.career_clusters:
                 self.career_clusters[cluster_id] = []
             self.career_clusters[cluster_id].append(career)
         
+        # Per-career skill importances, so lookups don't sort the vocabulary per call
+        _, fit_stats['career_importances'] = _timed(self._compute_career_importances)
+        progress('career_importances', fit_stats['career_importances'])
+        
+        # Distilled single-model fast path for interactive requests (needs every model above)
+        _, fit_stats['fast_model'] = _timed(self.distill_fast_model)
+        progress('fast_model', fit_stats['fast_model'])
+        
+        self.training_report = {
+            'n_jobs': n_jobs,
+            'workers': workers,
+            'total_s': round(time.perf_counter() - started, 3),
+            'peak_rss_mb': _peak_rss_mb(),
+            'models': fit_stats,
+        }
+        
         self.is_trained = True
+        self.clear_prediction_cache()
+        self._discovered_paths = None
         print(f"✅ Models trained successfully!")
         print(f"📊 Discovered {len(self.career_clusters)} career clusters")
         print(f"🎯 {len(self.career_names)} unique career paths identified")
     
-    def predict_dynamic_careers(self, user_skills: List[str], top_k: int = 5) -> List[Dict]:
+    def _ensemble_rankings(self, embeddings, top_k: int) -> List[Tuple]:
+        """
+        Combined ensemble scores for every row of `embeddings` (batched per model).
+        
+        Returns: list of (sorted (career, score) pairs, cluster careers, cluster id) per row
+        """
+        # Method 1: Clustering-based prediction
+        cluster_preds = self.kmeans.predict(embeddings)
+        
+        # Method 2: Random Forest classification
+        rf_probabilities = self.rf_classifier.predict_proba(embeddings)
+        
+        # Method 3: Similarity-based recommendations (top-k cosine neighbours from the ANN index)
+        similarities, neighbour_ids = self.nn_index.search(embeddings, k=top_k)
+        
+        rankings = []
+        for row in range(embeddings.shape[0]):
+            cluster_pred = cluster_preds[row]
+            cluster_careers = self.career_clusters.get(cluster_pred, [])
+            rf_predictions = [(self.rf_classifier.classes_[i], prob)
+                             for i, prob in enumerate(rf_probabilities[row])]
+            rf_predictions.sort(key=lambda x: x[1], reverse=True)
+            
+            # Combine results with confidence scores
+            career_scores = {}
+            
+            # Add clustering results
+            for career in cluster_careers:
+                career_scores[career] = career_scores.get(career, 0) + 0.3
+            
+            # Add RF results
+            for career, prob in rf_predictions[:top_k]:
+                career_scores[career] = career_scores.get(career, 0) + prob * 0.4
+            
+            # Add similarity results
+            for idx, similarity in zip(neighbour_ids[row], similarities[row]):
+                if idx < 0:
+                    break
+                career = self.training_careers[idx]
+                career_scores[career] = career_scores.get(career, 0) + float(similarity) * 0.3
+            
+            # Sort by combined score
+            sorted_careers = sorted(career_scores.items(), key=lambda x: x[1], reverse=True)
+            rankings.append((sorted_careers, cluster_careers, cluster_pred))
+        return rankings
+    
+    def _augmented_profiles(self, count: int, seed: int = 42) -> List[str]:
+        """Perturbed training profiles (dropped and borrowed skills) to query the teacher with"""
+        rng = np.random.default_rng(seed)
+        skill_lists = [[s.strip() for s in text.split(",") if s.strip()] for text in self.training_texts]
+        profiles = []
+        for _ in range(count):
+            base = skill_lists[rng.integers(len(skill_lists))]
+            kept = list(rng.choice(base, size=rng.integers(1, len(base) + 1), replace=False)) if base else []
+            if rng.random() < 0.5:
+                other = skill_lists[rng.integers(len(skill_lists))]
+                if other:
+                    kept += list(rng.choice(other, size=min(len(other), rng.integers(1, 3)), replace=False))
+            profiles.append(", ".join(kept))
+        return profiles
+    
+    def distill_fast_model(self, min_rows: int = 2000, max_rows: int = 20000):
+        """
+        Distill the ensemble into one multinomial logistic regression for interactive use.
+        
+        The student is trained on the same TF-IDF features with the ensemble's top
+        career as the label, so a prediction is a single sparse dot product. Small
+        training sets are topped up with perturbed profiles so the student sees
+        the partial, mixed skill lists real users enter.
+        """
+        self._require_training_data("distill the fast model")
+        embeddings = self.skill_embeddings
+        if embeddings.shape[0] > max_rows:
+            sample = np.random.default_rng(42).choice(embeddings.shape[0], max_rows, replace=False)
+            embeddings = embeddings[np.sort(sample)]
+        elif embeddings.shape[0] < min_rows:
+            augmented = self.tfidf_vectorizer.transform(self._augmented_profiles(min_rows - embeddings.shape[0]))
+            embeddings = sparse.vstack([embeddings, augmented]).tocsr()
+        
+        teacher_labels = [ranking[0][0][0] if ranking[0] else None
+                          for ranking in self._ensemble_rankings(embeddings, top_k=5)]
+        keep = [i for i, label in enumerate(teacher_labels) if label is not None]
+        labels = [teacher_labels[i] for i in keep]
+        if len(set(labels)) < 2:
+            self.fast_model = None
+            return None
+        
+        self.fast_model = LogisticRegression(C=10.0, max_iter=1000)
+        self.fast_model.fit(embeddings[keep], labels)
+        return self.fast_model
+    
+    def predict_dynamic_careers(self, user_skills: List[str], top_k: int = 5, mode: str = None,
+                                use_cache: bool = True) -> List[Dict]:
         """
         Predict dynamic career paths using multiple ML approaches
+        
+        mode: "fast" uses the distilled logistic model (interactive requests),
+              "full" runs the whole ensemble (batch / offline). Defaults to
+              self.default_mode, falling back to "full" if nothing was distilled.
+        use_cache: reuse results (explanations included) for the same normalized
+                   skill set, mode and model version
         """
         if not self.is_trained:
             self.train_models()
         
+        # Spellings are normalized first ("ml" -> "Machine Learning"), so every
+        # variant of the same skill set shares one embedding and one cache entry
+        skill_key = self._skill_key(user_skills)
+        mode = mode or self.default_mode
+        # Read the reference once: online_learning may swap in a new version mid-request
+        fast_model = self.fast_model
+        mode = "fast" if mode == "fast" and fast_model is not None else "full"
+        cache_key = (skill_key, top_k, mode, self.model_version)
+        cached = None
+        with self._cache_lock:
+            if use_cache:
+                cached = self._prediction_cache.get(cache_key)
+            if cached is not None:
+                self._prediction_cache.move_to_end(cache_key)
+        if cached is not None:
+            return [dict(result) for result in cached]
+        
         # Convert user skills to the same format
-        user_skills_text = ", ".join(user_skills)
-        user_embedding = self.tfidf_vectorizer.transform([user_skills_text])
-        user_dense = user_embedding.toarray()
+        user_embedding = self.tfidf_vectorizer.transform([", ".join(skill_key)])
         
-        results = []
+        if mode == "fast":
+            results = self._predict_fast(fast_model, user_embedding, top_k)
+        else:
+            sorted_careers, cluster_careers, cluster_pred = self._ensemble_rankings(user_embedding, top_k)[0]
+            
+            # Format results
+            results = []
+            for i, (career, score) in enumerate(sorted_careers[:top_k]):
+                confidence = min(score * 100, 100)  # Convert to percentage
+                results.append({
+                    'rank': i + 1,
+                    'career': career,
+                    'confidence': round(confidence, 1),
+                    'cluster_id': cluster_pred if career in cluster_careers else None
+                })
         
-        # Method 1: Clustering-based prediction
-        cluster_pred = self.kmeans.predict(user_dense)[0]
-        cluster_careers = self.career_clusters.get(cluster_pred, [])
+        # Explanations for all top-k careers in one vectorized pass
+        explanations = self._explain_matches(user_embedding, [r['career'] for r in results])
+        for result, (match_type, terms) in zip(results, explanations):
+            result['match_type'] = match_type
+            result['contributing_skills'] = terms
         
-        # Method 2: Random Forest classification
-        rf_probabilities = self.rf_classifier.predict_proba(user_dense)[0]
-        rf_predictions = [(self.rf_classifier.classes_[i], prob) 
-                         for i, prob in enumerate(rf_probabilities)]
-        rf_predictions.sort(key=lambda x: x[1], reverse=True)
-        
-        # Method 3: Similarity-based recommendations
-        distances, indices = self.nn_model.kneighbors(user_dense, n_neighbors=min(10, len(self.career_names)))
-        
-        # Method 4: Cosine similarity with all careers
-        all_similarities = cosine_similarity(user_embedding, self.skill_embeddings).flatten()
-        similar_indices = np.argsort(all_similarities)[::-1]
-        
-        # Combine results with confidence scores
-        career_scores = {}
-        
-        # Add clustering results
-        for career in cluster_careers:
-            career_scores[career] = career_scores.get(career, 0) + 0.3
-        
-        # Add RF results
-        for career, prob in rf_predictions[:top_k]:
-            career_scores[career] = career_scores.get(career, 0) + prob * 0.4
-        
-        # Add similarity results
-        training_df = self.create_synthetic_dataset()  # In production, use cached data
-        for idx in similar_indices[:top_k]:
-            career = training_df.iloc[idx]['career']
-            similarity = all_similarities[idx]
-            career_scores[career] = career_scores.get(career, 0) + similarity * 0.3
-        
-        # Sort by combined score
-        sorted_careers = sorted(career_scores.items(), key=lambda x: x[1], reverse=True)
-        
-        # Format results
-        for i, (career, score) in enumerate(sorted_careers[:top_k]):
-            confidence = min(score * 100, 100)  # Convert to percentage
+        with self._cache_lock:
+            self._prediction_cache[cache_key] = results
+            while len(self._prediction_cache) > self.PREDICTION_CACHE_SIZE:
+                self._prediction_cache.popitem(last=False)
+        return [dict(result) for result in results]
+    
+    @staticmethod
+    def _skill_key(user_skills: List[str]) -> Tuple[str, ...]:
+        """Order- and case-insensitive key of canonical skill names"""
+        return tuple(sorted({skill.casefold() for skill in display_skills(user_skills) if skill}))
+    
+    def clear_prediction_cache(self):
+        """Drop cached predictions (after retraining or loading a model)"""
+        with self._cache_lock:
+            self._prediction_cache.clear()
+    
+    def _predict_fast(self, fast_model, user_embedding, top_k: int) -> List[Dict]:
+        probabilities = fast_model.predict_proba(user_embedding)[0]
+        results = []
+        for i, class_idx in enumerate(top_k_indices(probabilities, top_k)):
+            career = fast_model.classes_[class_idx]
             results.append({
                 'rank': i + 1,
                 'career': career,
-                'confidence': round(confidence, 1),
-                'match_type': self._get_match_explanation(career, user_skills),
-                'cluster_id': cluster_pred if career in cluster_careers else None
+                'confidence': round(min(float(probabilities[class_idx]) * 100, 100), 1),
+                'cluster_id': None
             })
-        
         return results
     
-    def _get_match_explanation(self, career: str, user_skills: List[str]) -> str:
-        """Generate explanation for why this career was suggested"""
-        # This is a simplified version - could be enhanced with more sophisticated analysis
-        explanations = [
-            "Strong skill alignment",
-            "Emerging field match", 
-            "Cross-domain opportunity",
-            "Industry trend alignment",
-            "Skill gap opportunity"
-        ]
-        return np.random.choice(explanations)
-    
-    def discover_new_career_paths(self, min_cluster_size: int = 3) -> List[Dict]:
+    def agreement_report(self, skill_lists: List[List[str]] = None, top_k: int = 5) -> Dict:
         """
-        Discover new career paths by analyzing skill clusters
+        Compare the distilled fast path against the full ensemble.
+        
+        Returns: top-1 agreement, mean top-k overlap and per-call latency of both modes
         """
         if not self.is_trained:
             self.train_models()
+        if skill_lists is None:
+            skill_lists = [[s.strip() for s in text.split(",")] for text in self.training_texts[:500]]
         
-        new_paths = []
-        training_df = self.create_synthetic_dataset()
-        
-        # Analyze each cluster
-        for cluster_id, careers in self.career_clusters.items():
-            if len(set(careers)) >= min_cluster_size:
-                # Get representative skills for this cluster
-                cluster_mask = self.kmeans.labels_ == cluster_id
-                cluster_skills = training_df[cluster_mask]['skills'].tolist()
-                
-                # Find common skills in this cluster
-                all_skills = []
-                for skill_set in cluster_skills:
-                    all_skills.extend([s.strip() for s in skill_set.split(',')])
-                
-                from collections import Counter
-                skill_frequency = Counter(all_skills)
-                top_skills = [skill for skill, count in skill_frequency.most_common(5)]
-                
-                new_paths.append({
-                    'cluster_id': cluster_id,
-                    'suggested_name': f"Specialized {careers[0].split()[-1]}",
-                    'key_skills': top_skills,
-                    'related_careers': list(set(careers)),
-                    'emergence_score': len(set(careers)) / len(careers)
-                })
+        latencies = {"full": [], "fast": []}
+        predictions = {"full": [], "fast": []}
+        for skills in skill_lists:
+            for mode in ("full", "fast"):
+                started = time.perf_counter()
+                result = self.predict_dynamic_careers(skills, top_k=top_k, mode=mode, use_cache=False)
+                latencies[mode].append((time.perf_counter() - started) * 1000)
+                predictions[mode].append([r['career'] for r in result])
+        
+        top1 = [bool(f and g and f[0] == g[0]) for f, g in zip(predictions["full"], predictions["fast"])]
+        overlap = [len(set(f) & set(g)) / max(len(f), 1) for f, g in zip(predictions["full"], predictions["fast"])]
+        
+        def latency_stats(samples):
+            ordered = sorted(samples)
+            return {
+                'mean_ms': round(float(np.mean(ordered)), 3),
+                'p95_ms': round(ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))], 3),
+            }
+        
+        return {
+            'samples': len(skill_lists),
+            'fast_model_available': self.fast_model is not None,
+            'top1_agreement': round(float(np.mean(top1)), 4) if top1 else 0.0,
+            f'top{top_k}_overlap': round(float(np.mean(overlap)), 4) if overlap else 0.0,
+            'latency': {mode: latency_stats(samples) for mode, samples in latencies.items() if samples},
+        }
+    
+    def _explain_matches(self, user_embedding, careers: List[str]) -> List[Tuple[str, List[str]]]:
+        """
+        Explain why each career was suggested, from the skill features the user shares with it.
         
-        return new_paths
+        Each TF-IDF term the user shares with the career's profile contributes its weight
+        times (the career's mean TF-IDF weight for it + the forest's importance of it for
+        that career).
+        The match type follows the cosine overlap with the career's profile, and the
+        highest contributors are listed. Deterministic for a given embedding and model.
+        
+        Returns: (match type, top contributing terms) per career
+        """
+        if getattr(self, 'career_importances', None) is None:
+            self._compute_career_importances()
+        user_embedding = sparse.csr_matrix(user_embedding)
+        terms, weights = user_embedding.indices, user_embedding.data
+        rows = np.array([self.career_importance_index.get(career, -1) for career in careers], dtype=np.int64)
+        known = rows >= 0
+        rows = np.where(known, rows, 0)
+        
+        importance = self.career_importances[rows][:, terms] * known[:, None]
+        centroids = getattr(self, 'career_centroids', None)
+        if centroids is not None:
+            profile = centroids[rows][:, terms].toarray() * known[:, None]
+        else:
+            profile = np.zeros_like(importance)
+        overlap = profile @ weights / max(float(np.linalg.norm(weights)), 1e-12)
+        # Only shared terms are credited (forest importance alone is unsigned evidence)
+        contributions = (profile + importance) * weights * (profile > 0)
+        
+        explanations = []
+        for row in range(len(careers)):
+            best = top_k_indices(contributions[row], self.EXPLANATION_TERMS)
+            best = best[contributions[row, best] > 0]
+            if overlap[row] >= 0.5:
+                match_type = "Strong skill alignment"
+            elif overlap[row] >= 0.2:
+                match_type = "Partial skill overlap"
+            elif best.size:
+                match_type = "Cross-domain opportunity"
+            else:
+                match_type = "Skill gap opportunity"
+            explanations.append((match_type, [str(self.feature_names[terms[i]]) for i in best]))
+        return explanations
+    
+    def discover_new_career_paths(self, min_cluster_size: int = 3, table_path: str = None) -> List[Dict]:
+        """
+        Discover new career paths by analyzing skill clusters
+        
+        Reads the table materialized by the offline job in career_discovery.py.
+        Without one, discovery runs once in memory over the training profiles and
+        is reused until the models are retrained.
+        """
+        table = get_discovery_table(table_path or DISCOVERY_TABLE_PATH)
+        if table.mtime is None:
+            if not self.is_trained:
+                self.train_models()
+            if self._discovered_paths is None:
+                self._require_training_data("discover career paths without a materialized table", embeddings=False)
+                profiles = pd.DataFrame({'skills': self.training_texts, 'career': self.training_careers})
+                self._discovered_paths = DiscoveryTable(discover_career_paths(profiles, min_cluster_size=1))
+            table = self._discovered_paths
+        return [path for path in table.paths if len(path['related_careers']) >= min_cluster_size]
     
-    def get_skill_importance(self, career: str) -> Dict[str, float]:
-        """Get feature importance for a specific career"""
+    def _require_training_data(self, action: str, embeddings: bool = True):
+        """Raise a clear error when the training profiles are missing (e.g. an older saved model)"""
+        missing_embeddings = embeddings and self.skill_embeddings is None
+        if missing_embeddings or len(self.training_texts) != len(self.training_careers):
+            raise ValueError(f"Cannot {action}: this model has no training profiles "
+                             f"(saved before they were stored); retrain it with train_models()")
+    
+    def _compute_career_importances(self):
+        """
+        Per-career (class-conditional) feature importances from the fitted forest.
+        
+        For each career, every split's one-vs-rest Gini impurity decrease is credited
+        to its feature, weighted by the node's sample share and averaged over trees,
+        i.e. the forest's mean-decrease-impurity computed separately per class.
+        The top CAREER_IMPORTANCE_TOP_K features per career are kept pre-sorted.
+        """
+        self._require_training_data("compute career importances")
+        forest = self.rf_classifier
+        n_features = self.skill_embeddings.shape[1]
+        totals = np.zeros((n_features, len(forest.classes_)), dtype=np.float64)
+        for estimator in forest.estimators_:
+            tree = estimator.tree_
+            internal = np.flatnonzero(tree.children_left >= 0)
+            if internal.size == 0:
+                continue
+            values = tree.value[:, 0, :]
+            proportions = values / np.maximum(values.sum(axis=1, keepdims=True), 1e-12)
+            gini = 2 * proportions * (1 - proportions)
+            weighted = gini * tree.weighted_n_node_samples[:, None]
+            decrease = (weighted[internal]
+                        - weighted[tree.children_left[internal]]
+                        - weighted[tree.children_right[internal]]) / tree.weighted_n_node_samples[0]
+            np.add.at(totals, tree.feature[internal], np.clip(decrease, 0, None))
+        
+        importances = totals.T
+        row_sums = importances.sum(axis=1, keepdims=True)
+        importances = np.divide(importances, row_sums, out=np.zeros_like(importances), where=row_sums > 0)
+        self.career_importances = importances.astype(np.float32)
+        self.career_importance_index = {career: i for i, career in enumerate(forest.classes_)}
+        self.feature_names = self.tfidf_vectorizer.get_feature_names_out()
+        
+        # Mean TF-IDF profile per career (same row order), for match explanations
+        labels = np.array([self.career_importance_index[career] for career in self.training_careers])
+        membership = sparse.csr_matrix(
+            (np.ones(len(labels), dtype=np.float32), (labels, np.arange(len(labels)))),
+            shape=(len(forest.classes_), len(labels))
+        )
+        self.career_centroids = l2_normalize(sparse.csr_matrix(membership @ self.skill_embeddings))
+        self.career_top_features = {}
+        for career, row in self.career_importance_index.items():
+            best = top_k_indices(self.career_importances[row], self.CAREER_IMPORTANCE_TOP_K)
+            best = best[self.career_importances[row, best] > 0]
+            self.career_top_features[career] = (best, self.career_importances[row, best])
+    
+    def get_skill_importance(self, career: str, top_k: int = 10) -> Dict[str, float]:
+        """Get feature importance for a specific career (precomputed at training time)"""
         if not self.is_trained:
             self.train_models()
+        if getattr(self, 'career_importances', None) is None:
+            self._compute_career_importances()  # Models saved before importances were stored
         
-        try:
-            career_idx = list(self.rf_classifier.classes_).index(career)
-            feature_names = self.tfidf_vectorizer.get_feature_names_out()
-            importances = self.rf_classifier.feature_importances_
-            
-            skill_importance = dict(zip(feature_names, importances))
-            # Sort by importance
-            return dict(sorted(skill_importance.items(), key=lambda x: x[1], reverse=True)[:10])
-        except ValueError:
+        row = self.career_importance_index.get(career)
+        if row is None:
             return {}
+        if top_k <= self.CAREER_IMPORTANCE_TOP_K:
+            indices, values = self.career_top_features[career]
+            indices, values = indices[:top_k], values[:top_k]
+        else:
+            indices = top_k_indices(self.career_importances[row], top_k)
+            values = self.career_importances[row, indices]
+            indices, values = indices[values > 0], values[values > 0]
+        return {self.feature_names[i]: float(v) for i, v in zip(indices, values)}
     
     def save_model(self, filepath: str):
         """Save trained model to disk"""
         model_data = {
+            'format_version': self.MODEL_FORMAT_VERSION,
+            'model_version': self.model_version,
             'tfidf_vectorizer': self.tfidf_vectorizer,
             'kmeans': self.kmeans,
-            'pca': self.pca,
-            'nn_model': self.nn_model,
+            'svd': self.svd,
+            'nn_index': self.nn_index,
             'rf_classifier': self.rf_classifier,
             'career_clusters': self.career_clusters,
             'career_names': self.career_names,
+            'training_careers': self.training_careers,
+            'training_texts': self.training_texts,
+            'skill_embeddings': self.skill_embeddings,
+            'fast_model': self.fast_model,
+            'career_importances': self.career_importances,
+            'career_importance_index': self.career_importance_index,
+            'career_top_features': self.career_top_features,
+            'career_centroids': self.career_centroids,
+            'feature_names': self.feature_names,
             'is_trained': self.is_trained
         }
         with open(filepath, 'wb') as f:
             pickle.dump(model_data, f)
     
     def load_model(self, filepath: str):
-        """Load trained model from disk"""
+        """
+        Load trained model from disk
+        
+        Raises ValueError (leaving this predictor unchanged) for pickles in an older
+        or newer format that lack what prediction needs; those must be retrained.
+        """
         with open(filepath, 'rb') as f:
             model_data = pickle.load(f)
         
+        format_version = model_data.get('format_version', 1)
+        missing = [key for key in self.REQUIRED_MODEL_KEYS if key not in model_data]
+        if format_version > self.MODEL_FORMAT_VERSION or missing:
+            raise ValueError(
+                f"{filepath} is a format {format_version} model (this version reads format "
+                f"{self.MODEL_FORMAT_VERSION}; missing {missing or 'nothing'}): retrain required, "
+                f"run train_models() and save_model() again"
+            )
+        
         for key, value in model_data.items():
-            setattr(self, key, value)
+            if key != 'format_version':
+                setattr(self, key, value)
+        if 'training_texts' not in model_data:
+            self.training_texts = []
+        if 'skill_embeddings' not in model_data:
+            self.skill_embeddings = None
+        self.clear_prediction_cache()
+        self._discovered_paths = None
 
 # Usage example
 if __name__ == "__main__":
@@ -279,15 +659,21 @@ if __name__ == "__main__":
     predictor = DynamicCareerPredictor()
     predictor.train_models()
     
-    # Test with sample skills
+    # Test with sample skills (full ensemble)
     test_skills = ["Python", "Machine Learning", "TensorFlow", "Data Analysis"]
-    predictions = predictor.predict_dynamic_careers(test_skills)
+    predictions = predictor.predict_dynamic_careers(test_skills, mode="full")
     
     print("\n🎯 Dynamic Career Predictions:")
     for pred in predictions:
         print(f"{pred['rank']}. {pred['career']} ({pred['confidence']}% confidence)")
         print(f"   Match Type: {pred['match_type']}")
     
+    # Compare the distilled fast path with the full ensemble
+    report = predictor.agreement_report()
+    print(f"\n⚡ Fast path top-1 agreement: {report['top1_agreement']:.0%} over {report['samples']} profiles")
+    for mode, stats in report['latency'].items():
+        print(f"   {mode}: {stats['mean_ms']:.2f} ms mean, {stats['p95_ms']:.2f} ms p95")
+    
     # Discover new career paths
     new_paths = predictor.discover_new_career_paths()
     print(f"\n🚀 Discovered {len(new_paths)} potential new career paths!")
\ No newline at end of file
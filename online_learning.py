@@ -0,0 +1,390 @@
+"""
+Online Learning for AspirePath
+Feeds production signals (accepted predictions, quiz scores, logged achievements)
+back into DynamicCareerPredictor's interactive classifier with mini-batch
+`partial_fit` updates.
+
+Every update trains a *copy* of the serving model on a background thread and
+publishes it as a new immutable, versioned snapshot by swapping a single
+reference, so requests never wait on training and rollback is one assignment.
+Updates are coalesced and spaced at least `min_interval_s` apart, which bounds
+the CPU (and GIL) share training can take from serving under bursts of feedback.
+
+    learner = OnlineCareerLearner(predictor)
+    register_learner(learner)
+    record_event("accepted_prediction", user_id, {"skills": [...], "career": "Data Scientist"})
+    record_event("quiz", user_id, quiz_record)        # labelled with the user's accepted career
+    learner.rollback()                                # back to the previous version
+"""
+
+import copy
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from scipy import sparse
+from sklearn.linear_model import SGDClassifier
+
+# How much one signal counts relative to a replayed training profile
+EVENT_WEIGHTS = {
+    "accepted_prediction": 1.0,
+    "quiz": 1.0,          # scaled by the quiz percentage
+    "achievement": 0.5,
+}
+
+
+class ModelSnapshot:
+    """One published (or rejected) version of the interactive classifier"""
+
+    __slots__ = ("version", "model", "parent", "created_at", "samples", "metrics")
+
+    def __init__(self, version, model, parent=None, samples=0, metrics=None):
+        self.version = version
+        self.model = model
+        self.parent = parent
+        self.created_at = time.time()
+        self.samples = samples      # feedback examples this version was trained on
+        self.metrics = metrics or {}
+
+
+class OnlineCareerLearner:
+    """Mini-batch online learner with versioned snapshots for one DynamicCareerPredictor"""
+
+    def __init__(self, predictor, batch_size=32, replay_size=128, max_snapshots=10,
+                 max_agreement_drop=0.05, bootstrap_epochs=5, min_interval_s=0.5, seed=42,
+                 career_aliases=None):
+        """
+        Args:
+            predictor (DynamicCareerPredictor): Trained predictor whose fast path is updated
+            batch_size (int): Feedback examples per partial_fit update
+            replay_size (int): Training profiles mixed into each update (limits forgetting)
+            max_snapshots (int): Versions kept for rollback (version 0 is always kept)
+            max_agreement_drop (float): Updates whose holdout agreement with the trained
+                ensemble falls further than this below the serving version are not published
+            bootstrap_epochs (int): Passes used to seed the SGD model from the training data
+            min_interval_s (float): Minimum spacing between background updates; feedback
+                arriving in between is folded into the next mini-batch
+            seed (int): Seed for replay sampling and the SGD model
+            career_aliases (dict): App career name -> classifier career, for careers the
+                classifier was not trained on; defaults to map_taxonomy_careers(predictor)
+        """
+        if not predictor.is_trained:
+            predictor.train_models()
+        self.predictor = predictor
+        self.batch_size = batch_size
+        self.replay_size = replay_size
+        self.max_snapshots = max_snapshots
+        self.max_agreement_drop = max_agreement_drop
+        self.bootstrap_epochs = bootstrap_epochs
+        self.min_interval_s = min_interval_s
+        self.rng = np.random.default_rng(seed)
+        self.seed = seed
+
+        self.classes = np.array(sorted(set(predictor.training_careers)))
+        self._class_set = set(self.classes)
+        self.career_aliases = map_taxonomy_careers(predictor) if career_aliases is None else dict(career_aliases)
+        self.user_careers = {}     # user id -> last accepted career (labels quiz/achievement events)
+        self.stats = {"events": 0, "examples": 0, "skipped": 0, "updates": 0, "rejected": 0}
+
+        self._replay_X, self._replay_y = self._teacher_set(predictor.training_texts, seed)
+        holdout = predictor._augmented_profiles(min(500, max(100, len(predictor.training_texts))), seed=seed + 1)
+        self._holdout_X, self._holdout_y = self._teacher_set(holdout, seed)
+
+        # Version 0 is whatever the predictor serves right now
+        self.snapshots = {0: ModelSnapshot(0, predictor.fast_model,
+                                           metrics={"holdout_agreement": self._agreement(predictor.fast_model)})}
+        self.current = self.snapshots[0]
+        self._next_version = 1
+
+        self._buffer = []
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1)  # one writer keeps versions ordered
+        self._pending = []
+        self._scheduled = False
+        self._last_update = 0.0
+
+    # --- labels ---------------------------------------------------------------
+
+    def _teacher_set(self, texts, seed):
+        """TF-IDF rows labelled by the trained ensemble (the distillation teacher)"""
+        X = self.predictor.tfidf_vectorizer.transform(texts)
+        rankings = self.predictor._ensemble_rankings(X, top_k=5)
+        labels = [ranking[0][0][0] if ranking[0] else None for ranking in rankings]
+        keep = [i for i, label in enumerate(labels) if label is not None]
+        return X[keep], np.array([labels[i] for i in keep])
+
+    def _agreement(self, model):
+        if model is None or self._holdout_X.shape[0] == 0:
+            return None
+        return round(float(np.mean(model.predict(self._holdout_X) == self._holdout_y)), 4)
+
+    def _examples(self, kind, user_id, data):
+        """Turn one event into (skills, career, weight) training examples"""
+        if kind == "accepted_prediction":
+            career = data.get("career")
+            if user_id is not None and career:
+                self.user_careers[user_id] = career
+            return [(data.get("skills") or [], career, EVENT_WEIGHTS[kind])]
+        # Quiz scores and achievements say which skills a user is building; they
+        # count towards the career that user accepted
+        career = data.get("career") or self.user_careers.get(user_id)
+        if kind == "quiz":
+            weight = EVENT_WEIGHTS[kind] * float(data.get("percentage", 0)) / 100
+            return [(data.get("skills_tested") or [], career, weight)]
+        if kind == "achievement":
+            return [(data.get("skills") or [], career, EVENT_WEIGHTS[kind])]
+        return []
+
+    # --- feedback -------------------------------------------------------------
+
+    def record(self, kind, user_id, data):
+        """
+        Queue one production signal. Returns immediately; once a mini-batch is
+        full an update is scheduled on the background thread.
+
+        Args:
+            kind (str): "accepted_prediction", "quiz" or "achievement"
+            user_id (str): User the event belongs to
+            data (dict): The stored record (skills / skills_tested, career, percentage)
+
+        Returns:
+            int: Training examples queued from this event
+        """
+        queued = 0
+        with self._lock:
+            self.stats["events"] += 1
+            for skills, career, weight in self._examples(kind, user_id, data):
+                career = self.career_aliases.get(career, career)
+                if not skills or career not in self._class_set or weight <= 0:
+                    self.stats["skipped"] += 1
+                    continue
+                self._buffer.append((", ".join(skills), career, weight))
+                queued += 1
+            self.stats["examples"] += queued
+            self._schedule()
+        return queued
+
+    def _schedule(self):
+        # Caller holds the lock; at most one coalescing update is queued at a time
+        if len(self._buffer) >= self.batch_size and not self._scheduled:
+            self._scheduled = True
+            self._pending = [f for f in self._pending if not f.done()]
+            self._pending.append(self._executor.submit(self._drain))
+
+    def _drain(self):
+        wait = self._last_update + self.min_interval_s - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        with self._lock:
+            batch, self._buffer = self._buffer, []
+            self._scheduled = False
+        if batch:
+            self._update(batch)
+        with self._lock:
+            self._schedule()
+
+    def flush(self):
+        """Train on whatever is buffered now and wait for every queued update"""
+        with self._lock:
+            if self._buffer:
+                batch, self._buffer = self._buffer, []
+                self._pending.append(self._executor.submit(self._update, batch))
+            pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
+
+    def close(self):
+        """Finish queued updates and stop the background thread"""
+        self.flush()
+        self._executor.shutdown(wait=True)
+
+    # --- training -------------------------------------------------------------
+
+    def _bootstrap(self):
+        """SGD model seeded from the ensemble-labelled training profiles"""
+        model = SGDClassifier(loss="log_loss", alpha=1e-5, random_state=self.seed)
+        order_rng = np.random.default_rng(self.seed)
+        for _ in range(self.bootstrap_epochs):
+            order = order_rng.permutation(self._replay_X.shape[0])
+            model.partial_fit(self._replay_X[order], self._replay_y[order], classes=self.classes)
+        return model
+
+    def _update(self, batch):
+        """Train a copy of the serving model on one mini-batch and publish it as a new version"""
+        base = self.current
+        if isinstance(base.model, SGDClassifier):
+            model = copy.deepcopy(base.model)
+        else:
+            model = self._bootstrap()
+
+        texts, labels, weights = zip(*batch)
+        X = self.predictor.tfidf_vectorizer.transform(list(texts))
+        y = np.array(labels)
+        weights = np.array(weights, dtype=np.float64)
+        if self.replay_size and self._replay_X.shape[0]:
+            replay = self.rng.choice(self._replay_X.shape[0], min(self.replay_size, self._replay_X.shape[0]),
+                                     replace=False)
+            X = sparse.vstack([X, self._replay_X[replay]]).tocsr()
+            y = np.concatenate([y, self._replay_y[replay]])
+            weights = np.concatenate([weights, np.ones(len(replay))])
+        model.partial_fit(X, y, sample_weight=weights)
+        self._last_update = time.monotonic()
+
+        agreement = self._agreement(model)
+        with self._lock:
+            version = self._next_version
+            self._next_version += 1
+            snapshot = ModelSnapshot(version, model, parent=base.version, samples=base.samples + len(batch),
+                                     metrics={"holdout_agreement": agreement, "batch": len(batch)})
+            self.snapshots[version] = snapshot
+            self._evict()
+            baseline = self.current.metrics.get("holdout_agreement")
+            if baseline is not None and agreement < baseline - self.max_agreement_drop:
+                self.stats["rejected"] += 1
+                return snapshot
+            self.stats["updates"] += 1
+            self._publish(snapshot)
+        return snapshot
+
+    def _evict(self):
+        versions = sorted(v for v in self.snapshots if v not in (0, self.current.version))
+        while len(self.snapshots) > self.max_snapshots and versions:
+            del self.snapshots[versions.pop(0)]
+
+    def _publish(self, snapshot):
+        # A single attribute assignment: in-flight requests keep the model they read
+        self.current = snapshot
+        self.predictor.fast_model = snapshot.model
+        self.predictor.model_version = snapshot.version
+
+    # --- versions -------------------------------------------------------------
+
+    def rollback(self, version=None):
+        """
+        Serve an earlier snapshot again (instant: no retraining).
+
+        Args:
+            version (int): Version to restore; defaults to the serving version's parent
+
+        Returns:
+            ModelSnapshot: The snapshot now being served
+        """
+        with self._lock:
+            if version is None:
+                version = self.current.parent if self.current.parent is not None else 0
+            if version not in self.snapshots:
+                raise KeyError(f"Snapshot version {version} is not available")
+            self._publish(self.snapshots[version])
+            return self.current
+
+    def versions(self):
+        """Summary of every kept snapshot, oldest first"""
+        return [
+            {"version": s.version, "parent": s.parent, "samples": s.samples,
+             "serving": s is self.current, **s.metrics}
+            for s in sorted(self.snapshots.values(), key=lambda s: s.version)
+        ]
+
+
+def map_taxonomy_careers(predictor, templates=None):
+    """
+    Map the app's career names (skill_taxonomy templates) onto the classifier's careers.
+
+    Names the classifier knows map to themselves (case-insensitively); any other
+    career maps to the trained ensemble's top career for its template skills.
+
+    Args:
+        predictor (DynamicCareerPredictor): Trained predictor
+        templates (dict): career -> skills; defaults to config.SKILL_TEMPLATES
+
+    Returns:
+        dict: App career -> classifier career
+    """
+    if templates is None:
+        from config import SKILL_TEMPLATES as templates
+    known = {str(career).casefold(): career for career in set(predictor.training_careers)}
+    aliases, unknown = {}, []
+    for career, skills in templates.items():
+        if career.casefold() in known:
+            aliases[career] = known[career.casefold()]
+        elif skills:
+            unknown.append((career, ", ".join(skills)))
+    if unknown:
+        X = predictor.tfidf_vectorizer.transform([text for _, text in unknown])
+        for (career, _), ranking in zip(unknown, predictor._ensemble_rankings(X, top_k=5)):
+            if ranking[0]:
+                aliases[career] = ranking[0][0][0]
+    return aliases
+
+
+# --- event hooks ----------------------------------------------------------------
+# helpers_session forwards stored quiz results, achievements and accepted
+# roadmaps here; nothing happens until a learner is registered.
+
+_learners = []
+
+
+def register_learner(learner):
+    """Start sending recorded production events to `learner`"""
+    if learner not in _learners:
+        _learners.append(learner)
+    return learner
+
+
+def unregister_learner(learner):
+    """Stop sending events to `learner`"""
+    if learner in _learners:
+        _learners.remove(learner)
+
+
+def record_event(kind, user_id, data):
+    """Forward one production event to every registered learner (never raises)"""
+    for learner in list(_learners):
+        try:
+            learner.record(kind, user_id, data)
+        except Exception as e:
+            print(f"Error recording {kind} event for online learning: {e}")
+
+
+if __name__ == "__main__":
+    import contextlib
+    import io
+
+    from benchmarks.generators import generate_profile_rows
+    from ml_career_predictor import DynamicCareerPredictor
+
+    df = generate_profile_rows(3000, seed=0, skill_count=500, career_count=20)
+    predictor = DynamicCareerPredictor()
+    with contextlib.redirect_stdout(io.StringIO()):
+        predictor.train_models(df.iloc[:2000])
+    learner = register_learner(OnlineCareerLearner(predictor, batch_size=16, min_interval_s=0.1))
+    queries = [skills.split(", ") for skills in df["skills"].iloc[2000:2400]]
+    feedback = list(df.iloc[2400:].itertuples())
+
+    def latency_ms(with_feedback):
+        # Each request stores one accepted prediction, as the app does, then the
+        # next request arrives ~5 ms later; updates run on the learner's thread
+        samples = []
+        for i, skills in enumerate(queries):
+            if with_feedback:
+                row = feedback[i]
+                record_event("accepted_prediction", f"user{i}", {"skills": row.skills.split(", "), "career": row.career})
+            started = time.perf_counter()
+            predictor.predict_dynamic_careers(skills, mode="fast")
+            samples.append((time.perf_counter() - started) * 1000)
+            time.sleep(0.005)
+        samples.sort()
+        return np.mean(samples), samples[int(0.95 * len(samples))]
+
+    idle = latency_ms(with_feedback=False)
+    busy = latency_ms(with_feedback=True)
+    learner.close()
+
+    print(f"Serving latency, no updates:    {idle[0]:.3f} ms mean, {idle[1]:.3f} ms p95")
+    print(f"Serving latency, updates live:  {busy[0]:.3f} ms mean, {busy[1]:.3f} ms p95")
+    print(f"{learner.stats['updates']} updates published, {learner.stats['rejected']} rejected")
+    for version in learner.versions()[-4:]:
+        print(f"  v{version['version']} (parent {version['parent']}): "
+              f"holdout agreement {version['holdout_agreement']}, serving={version['serving']}")
+    print(f"Rolled back to v{learner.rollback().version}")
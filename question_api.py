@@ -0,0 +1,307 @@
+"""
+Remote Question Source for AspirePath
+Client for an HTTP question-bank API: one pooled keep-alive requests.Session,
+(connect, read) timeouts, retries with jittered exponential backoff, a circuit
+breaker that stops calling a failing upstream for a cool-down period, and an
+in-process cache of responses keyed by skill set. Each skill is requested
+concurrently; fetch_questions merges the answers into one deduplicated list.
+
+The API is expected to accept POST {"skills": [...]} and answer
+{"questions": [{"id", "question", "options", "answer", "skill", ...}]}.
+It is only used when configured (ASPIREPATH_QUESTION_API or an explicit URL).
+"""
+
+import os
+import random
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from records import Question
+
+API_URL_ENV = "ASPIREPATH_QUESTION_API"
+API_KEY_ENV = "ASPIREPATH_QUESTION_API_KEY"
+
+# (connect, read) timeouts in seconds - a slow question API must never hang a quiz page
+DEFAULT_TIMEOUT = (3.05, 5)
+
+# Upstream answers worth another attempt; other 4xx are the request's fault
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an upstream whose circuit is open"""
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    closed: calls go through; `failure_threshold` failures in a row open it.
+    open: calls are refused until `reset_timeout` seconds have passed.
+    half-open: one trial call is let through; success closes, failure re-opens.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.failures = 0
+        self.opened_at = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._state()
+
+    def _state(self):
+        if self.opened_at is None:
+            return "closed"
+        if self.clock() - self.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def allow(self):
+        """Whether a call may go out now (claims the single half-open trial)"""
+        with self._lock:
+            state = self._state()
+            if state == "closed":
+                return True
+            if state == "half-open" and not self._trial_running:
+                self._trial_running = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._trial_running or self.failures >= self.failure_threshold:
+                self.opened_at = self.clock()
+            self._trial_running = False
+
+
+def skill_set_key(skills):
+    """Cache key of a skill set: order, case and surrounding whitespace do not matter"""
+    return tuple(sorted({skill.strip().casefold() for skill in skills if skill and skill.strip()}))
+
+
+def clean_questions(questions):
+    """Well-formed question dicts from an API payload (see Question.from_dict; malformed entries dropped)"""
+    cleaned = []
+    for data in questions if isinstance(questions, list) else []:
+        if not isinstance(data, dict) or not data.get("question") or not data.get("options") or not data.get("answer"):
+            continue
+        if not isinstance(data.get("skill") or "", str):
+            data = dict(data, skill=str(data["skill"]))
+        cleaned.append(Question.from_dict(data).as_dict())
+    return cleaned
+
+
+class QuestionAPIClient:
+    """Pooled, retrying, circuit-broken and cached client for a remote question bank"""
+
+    def __init__(self, api_url, api_key=None, timeout=DEFAULT_TIMEOUT, retries=2, backoff_base=0.25,
+                 backoff_cap=4.0, failure_threshold=5, reset_timeout=30.0, cache_ttl=600,
+                 max_cache_items=256, max_workers=8):
+        """
+        Args:
+            api_url (str): Question API endpoint
+            api_key (str): Bearer token (None sends no Authorization header)
+            timeout (tuple): (connect, read) timeouts in seconds
+            retries (int): Extra attempts after a timeout, connection error or retryable status
+            backoff_base (float): First backoff ceiling in seconds (doubles per attempt)
+            backoff_cap (float): Largest backoff ceiling in seconds
+            failure_threshold (int): Consecutive failed requests that open the circuit
+            reset_timeout (float): Seconds the circuit stays open before a trial request
+            cache_ttl (int): Seconds a cached response is served without a new request
+            max_cache_items (int): Skill sets kept in the response cache
+            max_workers (int): Concurrent requests (also the keep-alive pool size)
+        """
+        self.api_url = api_url
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.cache_ttl = cache_ttl
+        self.max_cache_items = max_cache_items
+        self.max_workers = max_workers
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["Content-Type"] = "application/json"
+        if api_key:
+            self.session.headers["Authorization"] = f"Bearer {api_key}"
+
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor = None
+
+    # --- response cache ---
+    def _cache_get(self, key):
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache.move_to_end(key)
+            return entry
+
+    def _cache_put(self, key, questions):
+        with self._lock:
+            self._cache[key] = (time.monotonic(), questions)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_cache_items:
+                self._cache.popitem(last=False)
+
+    def clear_cache(self):
+        with self._lock:
+            self._cache.clear()
+
+    # --- transport ---
+    def _backoff(self, attempt):
+        """Full-jitter delay before retry `attempt` (1-based)"""
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1)))
+
+    def _send(self, skills):
+        """POST once per attempt until the upstream answers, retrying transient failures"""
+        attempt = 0
+        while True:
+            try:
+                response = self.session.post(self.api_url, json={"skills": list(skills)}, timeout=self.timeout)
+                if response.status_code not in RETRY_STATUSES:
+                    return response
+                raise requests.exceptions.HTTPError(f"status {response.status_code}", response=response)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                    requests.exceptions.HTTPError):
+                attempt += 1
+                if attempt > self.retries:
+                    raise
+                time.sleep(self._backoff(attempt))
+
+    def _post(self, skills):
+        """
+        POST one skill set through the circuit breaker.
+
+        The breaker admits the request once and records one outcome for it, after
+        its retries: a success when the upstream answered (even with a 4xx), a
+        failure on any other exception, so a half-open trial is always released.
+
+        Returns:
+            list: Cleaned questions
+
+        Raises:
+            CircuitOpenError: The circuit is open
+            requests.exceptions.RequestException, ValueError: The request failed for good
+        """
+        if not self.breaker.allow():
+            raise CircuitOpenError(f"circuit open for {self.api_url}")
+        response = None
+        try:
+            response = self._send(skills)
+        finally:
+            if response is None:
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+        response.raise_for_status()
+        return clean_questions(response.json().get("questions", []))
+
+    def fetch_skill_set(self, skills):
+        """
+        Questions for one skill set: fresh cache, then the API, then a stale cache entry.
+
+        Returns:
+            list or None: Question dicts, or None if the API is unavailable and nothing is cached
+        """
+        key = skill_set_key(skills)
+        if not key:
+            return []
+        entry = self._cache_get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.cache_ttl:
+            return entry[1]
+        try:
+            questions = self._post(key)
+        except CircuitOpenError:
+            return entry[1] if entry is not None else None
+        except (requests.exceptions.RequestException, ValueError, AttributeError) as e:
+            print(f"Question API request for {list(key)} failed: {e}")
+            return entry[1] if entry is not None else None
+        self._cache_put(key, questions)
+        return questions
+
+    def _pool(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="question-api")
+            return self._executor
+
+    def fetch_questions(self, skills):
+        """
+        Fetch every skill's questions concurrently and merge them.
+
+        Args:
+            skills (list): Skills to request, one API call (or cache hit) each
+
+        Returns:
+            list: Question dicts deduplicated by id, in skill order (empty when the
+                API is unavailable for every skill)
+        """
+        keys = list(dict.fromkeys(skill_set_key([skill]) for skill in skills if skill and skill.strip()))
+        if len(keys) == 1:
+            results = [self.fetch_skill_set(keys[0])]
+        else:
+            results = list(self._pool().map(self.fetch_skill_set, keys))
+
+        merged, seen = [], set()
+        for questions in results:
+            for question in questions or ():
+                if question["id"] not in seen:
+                    seen.add(question["id"])
+                    merged.append(question)
+        return merged
+
+    def close(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        self.session.close()
+
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_question_client(api_url=None, api_key=None):
+    """
+    Get or create the process-wide client for an endpoint.
+
+    Args:
+        api_url (str): Endpoint (defaults to $ASPIREPATH_QUESTION_API)
+        api_key (str): Bearer token (defaults to $ASPIREPATH_QUESTION_API_KEY)
+
+    Returns:
+        QuestionAPIClient or None: None when no endpoint is configured
+    """
+    api_url = api_url or os.environ.get(API_URL_ENV)
+    if not api_url:
+        return None
+    api_key = api_key or os.environ.get(API_KEY_ENV)
+    with _clients_lock:
+        client = _clients.get((api_url, api_key))
+        if client is None:
+            client = _clients[(api_url, api_key)] = QuestionAPIClient(api_url, api_key)
+        return client
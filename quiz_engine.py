@@ -1,7 +1,41 @@
 import json
-import random
-import requests
+import numpy as np
 import streamlit as st
+from question_api import get_question_client
+from records import get_question_bank
+from quiz_scoring import GradingKey
+from sampling import quiz_seed, reservoir_sample, stratified_sample
+
+def _matching_positions(bank, skills):
+    """Bank positions of questions matching any of the skills (case-insensitive, substring either way)"""
+    return bank.skill_candidates([skill.lower().strip() for skill in skills])
+
+def sample_questions(skills, count, seed=None, path="real_mcq_bank.json"):
+    """
+    Pick `count` questions for the skills, spread evenly across the matched skills.
+
+    Only the sampled questions are copied out of the bank; with the same seed the
+    same questions come back in the same order.
+
+    Args:
+        skills (list): Skills to draw questions for
+        count (int): Questions to return
+        seed (int): Per-user seed (see sampling.quiz_seed); None for a fresh draw
+        path (str): Path to the JSON file containing questions
+
+    Returns:
+        list: Up to `count` question dicts
+    """
+    try:
+        bank = get_question_bank(path)
+        matching = _matching_positions(bank, skills)
+        return bank.as_dicts(stratified_sample(matching, bank.skill_codes[matching], count, seed))
+    except FileNotFoundError:
+        print(f"Question bank file not found: {path}")
+        return []
+    except json.JSONDecodeError:
+        print(f"Invalid JSON format in: {path}")
+        return []
 
 def load_questions(skills, path="real_mcq_bank.json"):
     """
@@ -15,20 +49,8 @@ def load_questions(skills, path="real_mcq_bank.json"):
         list: Filtered questions matching the skills
     """
     try:
-        with open(path, "r", encoding='utf-8') as f:
-            all_qs = json.load(f)
-        
-        # Create case-insensitive skill matching
-        skills_lower = [skill.lower().strip() for skill in skills]
-        
-        # Find questions that match any of the user's skills
-        matching_questions = []
-        for q in all_qs:
-            question_skill = q.get("skill", "").lower().strip()
-            if any(skill in question_skill or question_skill in skill for skill in skills_lower):
-                matching_questions.append(q)
-        
-        return matching_questions
+        bank = get_question_bank(path)
+        return bank.as_dicts(_matching_positions(bank, skills))
         
     except FileNotFoundError:
         print(f"Question bank file not found: {path}")
@@ -40,49 +62,55 @@ def load_questions(skills, path="real_mcq_bank.json"):
         print(f"Error loading questions: {e}")
         return []
 
-def fetch_questions_from_api(skills, api_url="https://example.com/api/questions", api_key="your_api_key"):
+def _merged_sample(remote, skills, count, seed=None, path="real_mcq_bank.json"):
     """
-    Fetches questions from a real-time API based on the provided skills.
-    Falls back to local questions if API is unavailable.
+    Sample `count` questions from the local bank's matches plus remote questions.
+
+    Remote questions whose id is already among the local matches are dropped; the
+    merged pool is stratified by skill like sample_questions.
+    """
+    try:
+        bank = get_question_bank(path)
+        matching = _matching_positions(bank, skills)
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        print(f"Could not load question bank {path}: {e}")
+        return reservoir_sample(remote, count, seed)
+    local_ids = {bank.questions[i].id for i in matching}
+    extra = [q for q in remote if q["id"] not in local_ids]
+    strata = np.array([bank.skills[code] for code in bank.skill_codes[matching]]
+                      + [(q.get("skill") or "").lower().strip() for q in extra], dtype=str)
+    picks = stratified_sample(np.arange(len(strata)), strata, count, seed)
+    return [bank.questions[matching[p]].as_dict() if p < len(matching) else extra[p - len(matching)]
+            for p in picks.tolist()]
+
+def fetch_questions_from_api(skills, api_url=None, api_key=None, seed=None):
+    """
+    Fetches questions from a real-time API based on the provided skills and merges
+    them with the local bank. Falls back to local questions if the API is not
+    configured or unavailable.
 
     Args:
         skills (list): List of skills to generate questions for.
-        api_url (str): The API endpoint for fetching questions.
-        api_key (str): The API key for authentication.
+        api_url (str): The API endpoint for fetching questions (defaults to $ASPIREPATH_QUESTION_API).
+        api_key (str): The API key for authentication (defaults to $ASPIREPATH_QUESTION_API_KEY).
+        seed (int): Per-user seed so reruns get the same questions; None for a fresh draw.
 
     Returns:
         list: A list of questions in the format [{"id": ..., "question": ..., "options": [...], "answer": ...}].
     """
-    # Skip API call since it's a placeholder and go directly to local questions
-    # In a real implementation, you would uncomment the API code below
-    
-    """
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json"
-    }
-    payload = {"skills": skills}
+    client = get_question_client(api_url, api_key)
+    if client is not None:
+        # Per-skill requests go out concurrently; failures leave only the local bank
+        remote = client.fetch_questions(skills)
+        if remote:
+            return _merged_sample(remote, skills, 10, seed)
 
-    try:
-        response = requests.post(api_url, json=payload, headers=headers, timeout=10)
-        response.raise_for_status()
-        questions = response.json().get("questions", [])
-
-        if questions:
-            random.shuffle(questions)
-            return questions[:10]  # Limit to 10 questions max
-            
-    except requests.exceptions.RequestException as e:
-        print(f"API Error: {e}")
-    """
-    
     # Use local questions (primary method for now)
     try:
-        local_questions = load_questions(skills)
+        # Limit to reasonable number of questions
+        local_questions = sample_questions(skills, 10, seed)
         if local_questions:
-            # Limit to reasonable number of questions
-            random.shuffle(local_questions)
-            return local_questions[:min(10, len(local_questions))]
+            return local_questions
         else:
             # If no questions found for specific skills, try general questions
             print(f"No questions found for skills: {skills}")
@@ -91,46 +119,121 @@ def fetch_questions_from_api(skills, api_url="https://example.com/api/questions"
             fallback_skills = [skill for skill in common_skills if any(s.lower() in skill.lower() for s in skills)]
             
             if fallback_skills:
-                fallback_questions = load_questions(fallback_skills)
+                fallback_questions = sample_questions(fallback_skills, 5, seed)
                 if fallback_questions:
-                    random.shuffle(fallback_questions)
-                    return fallback_questions[:5]
+                    return fallback_questions
             
             return []
     except Exception as e:
         print(f"Error loading questions: {e}")
         return []
 
-def run_quiz(skills, num_qs=5):
-    questions = load_questions(skills)
-    random.shuffle(questions)
-    selected = questions[:num_qs]
+# Pinned quizzes kept per browser session (the oldest is dropped first)
+QUIZ_SESSIONS_KEPT = 8
+
+def quiz_session_id(user_id, skills, attempt=0):
+    """Deterministic quiz id for a user, skill set (any order/case) and attempt number"""
+    return f"{quiz_seed(user_id, skills, attempt):016x}"[:12]
+
+class QuizSession:
+    """One quiz attempt: a deterministic id and the question list pinned when it was created"""
+
+    __slots__ = ("quiz_id", "user_id", "skills", "attempt", "seed", "questions", "config", "grading")
+
+    def __init__(self, user_id, skills, questions, attempt=0, config=None):
+        self.quiz_id = quiz_session_id(user_id, skills, attempt)
+        self.user_id = user_id
+        self.skills = tuple(skills)
+        self.attempt = attempt
+        self.seed = quiz_seed(user_id, skills, attempt)
+        self.questions = tuple(questions)
+        self.config = config or {}
+        self.grading = GradingKey(self.questions)
+
+    @property
+    def form_key(self):
+        return f"quiz_form_{self.quiz_id}"
+
+    @property
+    def answer_key_prefix(self):
+        """Shared prefix of this quiz's answer widget keys"""
+        return f"quiz_{self.quiz_id}_"
+
+    def answer_key(self, question):
+        """Widget key of a question's answer, stable across reruns"""
+        return f"{self.answer_key_prefix}{question['id']}"
+
+    def answers(self, state):
+        """Question id -> answer read from widget state (None when unanswered)"""
+        return {q["id"]: state.get(self.answer_key(q)) for q in self.questions}
+
+    def grade(self, answers):
+        """Full grading of an answer sheet, including per-skill accuracy (see quiz_scoring)"""
+        return self.grading.grade(answers)
 
-    st.session_state["quiz_answers"] = st.session_state.get("quiz_answers", {})
+    def wrong_questions(self, result, answers):
+        """Copies of the missed questions from a grade() result, with "user_answer" added"""
+        return [dict(self.questions[i], user_answer=answers.get(self.questions[i]["id"], ""))
+                for i in result["wrong"]]
 
-    form_key = f"quiz_form_{random.randint(1, 10000)}"  # Generate a unique key for the form
-    with st.form(form_key):
-        for q in selected:
-            user_ans = st.radio(
+    def score(self, answers):
+        """
+        Grade answers against the pinned questions.
+
+        Args:
+            answers (dict): Question id -> chosen option
+
+        Returns:
+            tuple: (score, total, wrong) with wrong as question dicts plus "user_answer"
+        """
+        result = self.grade(answers)
+        return result["score"], result["total"], self.wrong_questions(result, answers)
+
+def get_quiz_session(skills, user_id=None, attempt=0, build=None, num_qs=5):
+    """
+    The pinned quiz for this user, skill set and attempt, created on first use.
+
+    Reruns get the stored session back, so questions are selected (and the bank
+    read) once per attempt rather than once per rerun.
+
+    Args:
+        skills (list): Quiz skills
+        user_id (str): User the quiz belongs to
+        attempt (int): Bump for a fresh set of questions
+        build (callable): seed -> (questions, config); defaults to sample_questions
+        num_qs (int): Questions per quiz for the default build
+
+    Returns:
+        QuizSession: Not stored when no questions were found, so a later rerun retries
+    """
+    sessions = st.session_state.setdefault("quiz_sessions", {})
+    quiz_id = quiz_session_id(user_id, skills, attempt)
+    quiz = sessions.get(quiz_id)
+    if quiz is None:
+        seed = quiz_seed(user_id, skills, attempt)
+        questions, config = build(seed) if build else (sample_questions(skills, num_qs, seed), None)
+        quiz = QuizSession(user_id, skills, questions, attempt, config)
+        if quiz.questions:
+            sessions[quiz_id] = quiz
+            while len(sessions) > QUIZ_SESSIONS_KEPT:
+                sessions.pop(next(iter(sessions)))
+    return quiz
+
+def run_quiz(skills, num_qs=5, user_id=None, attempt=0):
+    quiz = get_quiz_session(skills, user_id=user_id, attempt=attempt, num_qs=num_qs)
+
+    # The form and widget keys come from the quiz id, so answers survive reruns
+    with st.form(quiz.form_key):
+        for q in quiz.questions:
+            st.radio(
                 q["question"],
                 q["options"],
-                key=f"quiz_{q['id']}"
+                key=quiz.answer_key(q)
             )
-            st.session_state["quiz_answers"][q["id"]] = user_ans
 
         submitted = st.form_submit_button("✅ Submit Quiz")
 
-    score = 0
-    wrong = []
     if submitted:
-        for q in selected:
-            user_ans = st.session_state["quiz_answers"].get(q["id"], "")
-            if user_ans == q["answer"]:
-                score += 1
-            else:
-                q["user_answer"] = user_ans
-                wrong.append(q)
-
-        return score, len(selected), wrong
+        return quiz.score(quiz.answers(st.session_state))
 
-    return None, len(selected), []
+    return None, len(quiz.questions), []
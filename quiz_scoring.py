@@ -0,0 +1,146 @@
+"""
+Quiz Scoring and Skill Mastery for AspirePath
+Grades a whole answer sheet with array operations against a GradingKey built once
+per pinned quiz, computes per-skill accuracy, and folds each graded quiz into a
+per-user SkillMastery table so roadmaps and quiz selection can read mastery
+without rescanning stored quiz results.
+"""
+
+import numpy as np
+
+# Weight of the newest quiz in a skill's mastery (exponentially weighted accuracy)
+MASTERY_ALPHA = 0.4
+
+# Below this mastery a known skill is treated as needing review
+REVIEW_THRESHOLD = 0.6
+
+
+class GradingKey:
+    """Answer key of a fixed question list: ids, expected answers and skill codes as arrays"""
+
+    __slots__ = ("ids", "expected", "skills", "skill_codes")
+
+    def __init__(self, questions):
+        self.ids = tuple(q["id"] for q in questions)
+        self.expected = np.array([q["answer"] for q in questions] + [None], dtype=object)[:-1]
+        labels = np.array([q.get("skill") or "General" for q in questions], dtype=str)
+        self.skills, codes = np.unique(labels, return_inverse=True)
+        self.skill_codes = codes.reshape(-1)
+
+    def grade(self, answers):
+        """
+        Grade an answer sheet.
+
+        Args:
+            answers (dict): Question id -> chosen option (None / missing = unanswered)
+
+        Returns:
+            dict: score, total, percentage, answered, unanswered (1-based positions),
+                wrong (0-based positions) and per_skill {skill: {correct, total, accuracy}}
+        """
+        total = len(self.ids)
+        chosen = np.array([answers.get(question_id) for question_id in self.ids] + [None], dtype=object)[:-1]
+        answered = chosen != None  # noqa: E711  (elementwise on an object array)
+        correct = answered & (chosen == self.expected)
+        score = int(correct.sum())
+
+        skill_totals = np.bincount(self.skill_codes, minlength=len(self.skills))
+        skill_correct = np.bincount(self.skill_codes, weights=correct, minlength=len(self.skills))
+        per_skill = {
+            str(skill): {"correct": int(right), "total": int(count), "accuracy": round(float(right / count), 4)}
+            for skill, right, count in zip(self.skills, skill_correct, skill_totals) if count
+        }
+        return {
+            "score": score,
+            "total": total,
+            "percentage": score / total * 100 if total else 0.0,
+            "answered": int(answered.sum()),
+            "unanswered": (np.flatnonzero(~answered) + 1).tolist(),
+            "wrong": np.flatnonzero(~correct).tolist(),
+            "per_skill": per_skill,
+        }
+
+
+def grade(questions, answers):
+    """Grade answers against a question list (builds the GradingKey on the fly)"""
+    return GradingKey(questions).grade(answers)
+
+
+class SkillMastery:
+    """
+    One user's mastery table: per skill, cumulative correct/attempted counts and an
+    exponentially weighted accuracy that favours recent quizzes. Rows are array
+    slots; update() touches only the skills a quiz tested.
+    """
+
+    __slots__ = ("rows", "names", "correct", "attempts", "mastery", "quizzes")
+
+    def __init__(self, capacity=16):
+        self.rows = {}          # casefolded skill -> row
+        self.names = []         # row -> display name
+        self.correct = np.zeros(capacity)
+        self.attempts = np.zeros(capacity)
+        self.mastery = np.zeros(capacity)
+        self.quizzes = 0
+
+    def _row(self, skill):
+        key = skill.strip().casefold()
+        row = self.rows.get(key)
+        if row is None:
+            row = len(self.names)
+            if row == len(self.correct):
+                for name in ("correct", "attempts", "mastery"):
+                    setattr(self, name, np.concatenate([getattr(self, name), np.zeros(len(self.correct))]))
+            self.rows[key] = row
+            self.names.append(skill)
+        return row
+
+    def update(self, per_skill):
+        """
+        Fold one graded quiz into the table.
+
+        Args:
+            per_skill (dict): skill -> {"correct", "total"} (GradingKey.grade output)
+        """
+        per_skill = {skill: counts for skill, counts in per_skill.items() if counts.get("total")}
+        if not per_skill:
+            return
+        rows = np.array([self._row(skill) for skill in per_skill])
+        right = np.array([counts["correct"] for counts in per_skill.values()], dtype=float)
+        total = np.array([counts["total"] for counts in per_skill.values()], dtype=float)
+        first = self.attempts[rows] == 0
+        accuracy = right / total
+        self.mastery[rows] = np.where(first, accuracy,
+                                      (1 - MASTERY_ALPHA) * self.mastery[rows] + MASTERY_ALPHA * accuracy)
+        np.add.at(self.correct, rows, right)
+        np.add.at(self.attempts, rows, total)
+        self.quizzes += 1
+
+    def get(self, skill, default=None):
+        """Mastery (0-1) of a skill, or default when it was never tested"""
+        row = self.rows.get(skill.strip().casefold())
+        return default if row is None else float(self.mastery[row])
+
+    def lookup(self):
+        """Casefolded skill -> mastery, for callers that match skills themselves"""
+        return {key: float(self.mastery[row]) for key, row in self.rows.items()}
+
+    def weakest(self, count=3, threshold=REVIEW_THRESHOLD):
+        """Tested skills below the threshold, weakest first"""
+        size = len(self.names)
+        order = np.argsort(self.mastery[:size], kind="stable")
+        return [self.names[row] for row in order if self.mastery[row] < threshold][:count]
+
+    def as_dict(self):
+        return {
+            self.names[row]: {
+                "correct": int(self.correct[row]),
+                "attempts": int(self.attempts[row]),
+                "accuracy": round(float(self.correct[row] / self.attempts[row]), 4),
+                "mastery": round(float(self.mastery[row]), 4),
+            }
+            for row in range(len(self.names))
+        }
+
+    def __len__(self):
+        return len(self.names)
@@ -0,0 +1,349 @@
+"""
+Compact Records for AspirePath
+Frozen, slotted record types for questions, achievements, quiz results, resumes and
+roadmaps, with repeated string fields interned, plus QuestionBank: a columnar,
+array-backed view of a question bank that is loaded once per file version and
+scored with array operations instead of a dict per question per request.
+
+Records keep dict-style reads (`record.get("skill")`, `record["id"]`) for callers
+written against the old dicts, and `as_dict()` for JSON and session output.
+"""
+
+import dataclasses
+import hashlib
+import json
+import os
+import sys
+import threading
+from dataclasses import dataclass
+from typing import ClassVar
+
+import numpy as np
+
+
+def intern_text(value):
+    """sys.intern for strings, anything else unchanged"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class Record:
+    """Base for frozen records: interns the fields named in INTERNED, reads like a dict"""
+
+    __slots__ = ()
+    INTERNED: ClassVar[tuple] = ()
+
+    def __post_init__(self):
+        for name in self.INTERNED:
+            object.__setattr__(self, name, intern_text(getattr(self, name)))
+
+    def get(self, key, default=None):
+        # Unset optional fields are None; like a dict without the key, they read as `default`
+        value = getattr(self, key) if key in self.__dataclass_fields__ else None
+        return default if value is None else value
+
+    def __getitem__(self, key):
+        if key in self.__dataclass_fields__:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in self.__dataclass_fields__
+
+    def as_dict(self):
+        """Shallow dict copy, tuples as lists"""
+        return {field.name: _plain(getattr(self, field.name)) for field in dataclasses.fields(self)}
+
+
+def _plain(value):
+    return list(value) if isinstance(value, tuple) else value
+
+
+@dataclass(frozen=True, slots=True)
+class Question(Record):
+    """One multiple-choice question from the bank"""
+
+    id: str
+    question: str
+    options: tuple
+    answer: str
+    skill: str = ""
+    difficulty: str = None
+
+    INTERNED: ClassVar[tuple] = ("id", "answer", "skill", "difficulty")
+
+    @classmethod
+    def from_dict(cls, data):
+        # Questions without an id get the content-hash id question_ids() gives them,
+        # so widget keys built from ids stay unique
+        return cls(
+            id=question_ids([data])[0],
+            question=data.get("question", ""),
+            options=tuple(intern_text(option) for option in data.get("options", ())),
+            answer=data.get("answer", ""),
+            skill=data.get("skill") or "",
+            difficulty=data.get("difficulty"),
+        )
+
+    def as_dict(self):
+        data = Record.as_dict(self)
+        if self.difficulty is None:
+            del data["difficulty"]
+        return data
+
+
+@dataclass(frozen=True, slots=True)
+class ResumeRecord(Record):
+    """An uploaded resume, referenced by the hash of its extracted text"""
+
+    content_hash: str
+    file_name: str
+    file_type: str
+    file_size: int      # characters of extracted text
+    uploaded_at: str
+
+    INTERNED: ClassVar[tuple] = ("file_type",)
+
+
+@dataclass(frozen=True, slots=True)
+class QuizRecord(Record):
+    """One finished quiz; wrong answers are kept as question ids"""
+
+    user_id: str
+    timestamp: str
+    date: str
+    score: int = 0
+    total: int = 0
+    percentage: float = 0.0
+    quiz_type: str = None
+    skills_tested: tuple = ()
+    wrong_question_ids: tuple = ()
+    wrong_answers: int = 0
+
+    INTERNED: ClassVar[tuple] = ("user_id", "date", "quiz_type")
+
+    @classmethod
+    def from_results(cls, user_id, timestamp, date, quiz_results):
+        """
+        Build a record from a quiz results dict.
+
+        Args:
+            quiz_results (dict): score, total, percentage, skills_tested, quiz_type and the
+                wrong answers, either as a count ("wrong_answers") or as question dicts
+                ("wrong", "wrong_questions" or a list under "wrong_answers")
+
+        Returns:
+            QuizRecord
+        """
+        wrong = quiz_results.get("wrong_questions") or quiz_results.get("wrong") or []
+        wrong_answers = quiz_results.get("wrong_answers")
+        if isinstance(wrong_answers, (list, tuple)):
+            wrong, wrong_answers = wrong_answers, None
+        wrong_ids = question_ids(wrong)
+        return cls(
+            user_id, timestamp, date,
+            score=quiz_results.get("score", 0),
+            total=quiz_results.get("total", 0),
+            percentage=quiz_results.get("percentage", 0.0),
+            quiz_type=quiz_results.get("quiz_type"),
+            skills_tested=tuple(intern_text(s) for s in quiz_results.get("skills_tested") or ()),
+            wrong_question_ids=wrong_ids,
+            wrong_answers=len(wrong_ids) if wrong_answers is None else wrong_answers,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class RoadmapRecord(Record):
+    """A generated roadmap, referenced by the hash of its steps"""
+
+    user_id: str
+    career_goal: str
+    roadmap_hash: str
+    steps: int
+    created_at: str
+
+    INTERNED: ClassVar[tuple] = ("user_id", "career_goal")
+
+    @classmethod
+    def from_roadmap(cls, user_id, career_goal, roadmap, created_at):
+        steps = len(roadmap) if hasattr(roadmap, "__len__") else 0
+        return cls(user_id, career_goal, content_hash(repr(roadmap)), steps, created_at)
+
+
+@dataclass(frozen=True, slots=True)
+class AchievementRecord(Record):
+    """One logged progress achievement"""
+
+    user_id: str
+    user_name: str = ""
+    date: object = None
+    week: str = ""
+    created_at: object = None
+    category: str = "Other"
+    description: str = ""
+    skills: tuple = ()
+    time_spent: float = 0
+    difficulty: str = None
+    quiz_score: float = None
+
+    INTERNED: ClassVar[tuple] = ("user_id", "user_name", "week", "category", "difficulty")
+
+    @classmethod
+    def from_dict(cls, data):
+        known = {name: data[name] for name in cls.__dataclass_fields__ if name in data}
+        known["skills"] = tuple(intern_text(s) for s in known.get("skills") or ())
+        return cls(**known)
+
+
+def content_hash(text):
+    """sha256 hex digest of a text payload, used as its reference"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def question_ids(questions):
+    """Ids of questions (a content hash for questions without one)"""
+    return tuple(
+        intern_text(str(q["id"])) if q.get("id") not in (None, "") else content_hash(q.get("question", ""))[:16]
+        for q in questions
+    )
+
+
+DIFFICULTY_WEIGHTS = {"medium": 1.0, "hard": 0.5}
+
+# Question-text substring hits cached per search term (cleared when full)
+TERM_CACHE_SIZE = 4096
+
+
+class QuestionBank:
+    """
+    Columnar question bank: a tuple of Question records plus parallel arrays
+    (skill code, difficulty weight, lowercased text) that whole-bank scoring
+    runs over. Skill matching is computed once per distinct skill, not per question.
+
+    For per-request selection the bank also keeps postings (question positions per
+    skill and per text search term), a difficulty ranking and, once rank_careers has
+    run, per-career rankings, so a request only scores a small candidate set.
+    """
+
+    __slots__ = ("questions", "skills", "skill_codes", "difficulty_weights", "texts_lower",
+                 "skill_postings", "difficulty_ranking", "career_rankings", "_ranked_for", "_term_hits")
+
+    def __init__(self, questions):
+        self.questions = tuple(questions)
+        codes = {}
+        self.skill_codes = np.fromiter(
+            (codes.setdefault(intern_text(q.skill.lower().strip()), len(codes)) for q in self.questions),
+            dtype=np.int32, count=len(self.questions))
+        self.skills = tuple(codes)          # code -> lowercased skill
+        self.difficulty_weights = np.fromiter(
+            (DIFFICULTY_WEIGHTS.get((q.difficulty or "medium").lower(), 0.0) for q in self.questions),
+            dtype=np.float32, count=len(self.questions))
+        self.texts_lower = tuple(q.question.lower() for q in self.questions)
+
+        by_skill = np.argsort(self.skill_codes, kind="stable")
+        bounds = np.searchsorted(self.skill_codes[by_skill], np.arange(len(self.skills) + 1))
+        self.skill_postings = tuple(by_skill[bounds[c]:bounds[c + 1]] for c in range(len(self.skills)))
+        self.difficulty_ranking = np.argsort(-self.difficulty_weights, kind="stable")
+        self.career_rankings = {}
+        self._ranked_for = None
+        self._term_hits = {}
+
+    @classmethod
+    def from_dicts(cls, questions):
+        return cls(Question.from_dict(q) for q in questions)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dicts(json.load(f))
+
+    def __len__(self):
+        return len(self.questions)
+
+    def __getitem__(self, index):
+        return self.questions[index]
+
+    def _skill_mask(self, skill_matches):
+        """Boolean mask over questions whose skill code satisfies skill_matches(skill)"""
+        matching = np.fromiter((skill_matches(skill) for skill in self.skills), dtype=bool, count=len(self.skills))
+        return matching[self.skill_codes] if len(self.questions) else np.zeros(0, dtype=bool)
+
+    def skill_mask(self, skills_lower):
+        """Questions whose skill contains, or is contained in, any of the lowercased skills"""
+        return self._skill_mask(lambda q_skill: any(s in q_skill or q_skill in s for s in skills_lower))
+
+    def skill_contains_mask(self, terms):
+        """Questions whose skill contains any of the terms"""
+        return self._skill_mask(lambda q_skill: any(term in q_skill for term in terms))
+
+    def text_counts(self, terms):
+        """Per question, how many of the terms appear in its lowercased text"""
+        counts = np.zeros(len(self.questions), dtype=np.float32)
+        for term in terms:
+            counts += np.fromiter((term in text for text in self.texts_lower), dtype=bool, count=len(counts))
+        return counts
+
+    def skill_candidates(self, skills_lower):
+        """Sorted positions of the questions skill_mask would select, from the skill postings"""
+        matched = [self.skill_postings[code] for code, q_skill in enumerate(self.skills)
+                   if any(s in q_skill or q_skill in s for s in skills_lower)]
+        return np.sort(np.concatenate(matched)) if matched else np.zeros(0, dtype=np.intp)
+
+    def text_hits(self, term):
+        """Sorted positions of questions whose lowercased text contains `term` (cached per term)"""
+        hits = self._term_hits.get(term)
+        if hits is None:
+            hits = np.fromiter((i for i, text in enumerate(self.texts_lower) if term in text), dtype=np.intp)
+            if len(self._term_hits) >= TERM_CACHE_SIZE:
+                self._term_hits.clear()
+            self._term_hits[term] = hits
+        return hits
+
+    def rank_careers(self, priorities):
+        """
+        Precompute, per career, which questions get its priority boost and in which order.
+
+        Args:
+            priorities (dict): career -> skill terms (skill_taxonomy quiz_priorities);
+                a no-op when the bank is already ranked for this mapping
+
+        Each career maps to (mask, ranking, skill_leaders): the boosted questions as
+        a mask and ordered by difficulty weight (bank order on ties), and the first
+        of those per skill.
+        """
+        if self._ranked_for is priorities:
+            return
+        rankings = {}
+        for career, terms in priorities.items():
+            mask = self.skill_contains_mask(terms)
+            ranking = self.difficulty_ranking[mask[self.difficulty_ranking]]
+            _, first = np.unique(self.skill_codes[ranking], return_index=True)
+            rankings[career] = (mask, ranking, ranking[np.sort(first)])
+        self.career_rankings = rankings
+        self._ranked_for = priorities
+
+    def as_dicts(self, indices):
+        """Fresh question dicts for the given positions (callers may mutate them)"""
+        return [self.questions[i].as_dict() for i in indices]
+
+
+_banks = {}
+_banks_lock = threading.Lock()
+
+
+def get_question_bank(path):
+    """
+    Load a question bank file once and reuse it until the file changes.
+
+    Raises:
+        FileNotFoundError, json.JSONDecodeError: As json loading would
+    """
+    mtime = os.path.getmtime(path)
+    cached = _banks.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with _banks_lock:
+        cached = _banks.get(path)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, QuestionBank.load(path))
+            _banks[path] = cached
+    return cached[1]
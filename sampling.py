@@ -0,0 +1,120 @@
+"""
+Seeded Question Sampling for AspirePath
+Selects k items in O(k) memory instead of shuffling whole candidate lists:
+random.sample over index ranges when the size is known, reservoir sampling for
+streams, and a skill-stratified variant so every matched skill gets its share
+of a quiz. With a per-user seed (quiz_seed) the same user and skills get the
+same quiz on every rerun without storing the question list.
+"""
+
+import hashlib
+import math
+import random
+from itertools import islice
+
+import numpy as np
+
+
+def quiz_seed(user_id, skills, salt=""):
+    """
+    Stable seed for one user's quiz over a skill set.
+
+    Args:
+        user_id (str): User identifier (email)
+        skills (list): Quiz skills; order and case do not matter
+        salt (str): Changes the quiz for the same user/skills (e.g. an attempt number)
+
+    Returns:
+        int: 64-bit seed, identical across reruns and processes
+    """
+    key = "\x1f".join([str(user_id or ""), str(salt)] + sorted({s.strip().lower() for s in skills}))
+    return int.from_bytes(hashlib.sha256(key.encode("utf-8")).digest()[:8], "big")
+
+
+def _rng(seed):
+    return seed if isinstance(seed, random.Random) else random.Random(seed)
+
+
+def _open_uniform(rng):
+    """Uniform draw in (0, 1)"""
+    u = 0.0
+    while u == 0.0:
+        u = rng.random()
+    return u
+
+
+_END = object()
+
+
+def reservoir_sample(items, k, seed=None):
+    """
+    Uniform sample of k items from an iterable of unknown length (Algorithm L).
+
+    Returns:
+        list: Up to k items, in random order
+    """
+    rng = _rng(seed)
+    iterator = iter(items)
+    reservoir = list(islice(iterator, k))
+    if len(reservoir) == k and k:
+        weight = math.exp(math.log(_open_uniform(rng)) / k)
+        while True:
+            # Jump straight to the next item that enters the reservoir
+            skip = int(math.log(_open_uniform(rng)) / math.log1p(-weight))
+            item = next(islice(iterator, skip, skip + 1), _END)
+            if item is _END:
+                break
+            reservoir[rng.randrange(k)] = item
+            weight *= math.exp(math.log(_open_uniform(rng)) / k)
+    rng.shuffle(reservoir)
+    return reservoir
+
+
+def sample_indices(indices, k, seed=None):
+    """Random order sample of k entries of an index array, touching only k positions"""
+    rng = _rng(seed)
+    picks = rng.sample(range(len(indices)), min(k, len(indices)))
+    return np.asarray(indices)[picks] if picks else np.zeros(0, dtype=np.intp)
+
+
+def stratified_sample(indices, strata, k, seed=None):
+    """
+    Sample k of `indices` spread evenly over their strata (e.g. skill codes).
+
+    Every stratum gets floor(k / strata) items, capped by its size; slots left over
+    go to randomly chosen strata that still have items.
+
+    Args:
+        indices (array): Candidate positions
+        strata (array): Stratum label of each candidate
+        k (int): Items to return
+        seed (int | random.Random): Seed for a reproducible sample
+
+    Returns:
+        np.ndarray: Up to k positions, in random order
+    """
+    rng = _rng(seed)
+    indices = np.asarray(indices)
+    if len(indices) <= k:
+        picks = indices.copy()
+        rng.shuffle(picks)
+        return picks
+    strata = np.asarray(strata)
+    order = np.argsort(strata, kind="stable")
+    labels, starts, sizes = np.unique(strata[order], return_index=True, return_counts=True)
+
+    quota = np.minimum(sizes, k // len(labels))
+    remaining = k - int(quota.sum())
+    while remaining:
+        open_strata = np.flatnonzero(quota < sizes)
+        chosen = rng.sample(open_strata.tolist(), min(remaining, len(open_strata)))
+        quota[chosen] += 1
+        remaining -= len(chosen)
+
+    picks = []
+    for start, size, count in zip(starts.tolist(), sizes.tolist(), quota.tolist()):
+        if count:
+            picks.extend(start + offset for offset in rng.sample(range(size), count))
+    selected = indices[order[picks]]
+    rng.shuffle(selected)
+    return selected
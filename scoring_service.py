@@ -0,0 +1,257 @@
+"""
+Headless Scoring Service for AspirePath
+Exposes the career prediction, skill extraction, roadmap and quiz selection engines
+over a local JSON HTTP API, without the Streamlit UI.
+
+    python scoring_service.py --port 8765 --workers 4
+
+Endpoints (all POST, JSON body):
+    /assess_skills            {"text": "..."}
+    /predict_career_enhanced  {"skills": [...]}
+    /get_career_matches       {"skills": [...]}
+    /generate_roadmap         {"skills": [...], "goal": "Data Analyst"}
+    /load_smart_questions     {"skills": [...], "career": "Data Analyst", "max_questions": 10}
+
+Any endpoint also accepts {"batch": [body, body, ...]} and answers {"results": [...]}.
+GET /health reports readiness. Connections are HTTP/1.1 keep-alive. Engines are
+imported and warmed once in the parent process, then workers are forked so they
+share the warmed models copy-on-write.
+"""
+
+import argparse
+import json
+import os
+import signal
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+MAX_BODY_BYTES = 5 * 1024 * 1024
+MAX_BATCH_SIZE = 1000
+
+
+def _require_list(body, field):
+    value = body.get(field, [])
+    if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+        raise ValueError(f"'{field}' must be a list of strings")
+    return value
+
+
+def _assess_skills(body):
+    from core import assess_skills
+    text = body.get("text", "")
+    if not isinstance(text, str):
+        raise ValueError("'text' must be a string")
+    return {"skills": sorted(assess_skills(text))}
+
+
+def _predict_career_enhanced(body):
+    from enhanced_prediction import predict_career_enhanced
+    result = predict_career_enhanced(_require_list(body, "skills"))
+    # numpy floats in similarity_score aren't JSON serializable
+    for prediction in result.get("all_predictions", []):
+        prediction["similarity_score"] = float(prediction.get("similarity_score", 0))
+    return result
+
+
+def _get_career_matches(body):
+    from core import get_career_matches
+    return {"matches": get_career_matches(_require_list(body, "skills"))}
+
+
+def _generate_roadmap(body):
+    from core import generate_roadmap
+    goal = body.get("goal")
+    if not isinstance(goal, str) or not goal:
+        raise ValueError("'goal' is required")
+    roadmap, required = generate_roadmap(_require_list(body, "skills"), goal)
+    return {"roadmap": roadmap, "required": required}
+
+
+def _load_smart_questions(body):
+    from smart_quiz import load_smart_questions
+    max_questions = body.get("max_questions", 10)
+    if not isinstance(max_questions, int) or max_questions < 1:
+        raise ValueError("'max_questions' must be a positive integer")
+    questions = load_smart_questions(_require_list(body, "skills"), body.get("career"),
+                                     max_questions=max_questions)
+    return {"questions": questions}
+
+
+ENDPOINTS = {
+    "/assess_skills": _assess_skills,
+    "/predict_career_enhanced": _predict_career_enhanced,
+    "/get_career_matches": _get_career_matches,
+    "/generate_roadmap": _generate_roadmap,
+    "/load_smart_questions": _load_smart_questions,
+}
+
+# Representative requests used to warm every engine before serving
+WARMUP_REQUESTS = {
+    "/assess_skills": {"text": "Python, SQL and Machine Learning with TensorFlow"},
+    "/predict_career_enhanced": {"skills": ["Python", "SQL", "Statistics"]},
+    "/get_career_matches": {"skills": ["Python", "SQL", "Statistics"]},
+    "/generate_roadmap": {"skills": ["Python"], "goal": "Data Analyst"},
+    "/load_smart_questions": {"skills": ["Python", "SQL"], "career": "Data Analyst"},
+}
+
+_ready = False
+
+
+def warm_up():
+    """Warm every engine (see warmup.py) and run one request through each endpoint"""
+    global _ready
+    started = time.perf_counter()
+    from warmup import warm_up as warm_engines
+    warm_engines()
+    for path, body in WARMUP_REQUESTS.items():
+        ENDPOINTS[path](dict(body))
+    _ready = True
+    return time.perf_counter() - started
+
+
+def handle_request(path, body):
+    """
+    Dispatch a decoded JSON body to an endpoint, fanning out batches.
+
+    Returns:
+        tuple: (HTTP status, JSON-serializable response)
+    """
+    handler = ENDPOINTS.get(path)
+    if handler is None:
+        return 404, {"error": f"Unknown endpoint: {path}"}
+    if not isinstance(body, dict):
+        return 400, {"error": "Request body must be a JSON object"}
+
+    try:
+        if "batch" in body:
+            batch = body["batch"]
+            if not isinstance(batch, list) or not all(isinstance(item, dict) for item in batch):
+                return 400, {"error": "'batch' must be a list of JSON objects"}
+            if len(batch) > MAX_BATCH_SIZE:
+                return 413, {"error": f"Batch larger than {MAX_BATCH_SIZE} items"}
+            results = []
+            for position, item in enumerate(batch):
+                # One failing item never discards the other items' results
+                try:
+                    results.append(handler(item))
+                except ValueError as e:
+                    results.append({"error": str(e)})
+                except Exception as e:
+                    print(f"Scoring service error on {path} batch item {position}: {e}")
+                    results.append({"error": "Internal error"})
+            return 200, {"results": results}
+        return 200, handler(body)
+    except ValueError as e:
+        return 400, {"error": str(e)}
+    except Exception as e:
+        print(f"Scoring service error on {path}: {e}")
+        return 500, {"error": "Internal error"}
+
+
+class ScoringRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    server_version = "AspirePathScoring/1.0"
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(200 if _ready else 503, {"ready": _ready, "pid": os.getpid()})
+        else:
+            self._send_json(404, {"error": f"Unknown endpoint: {self.path}"})
+
+    def do_POST(self):
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            length = -1
+        if length < 0 or length > MAX_BODY_BYTES:
+            self.close_connection = True
+            self._send_json(413, {"error": "Missing or oversized request body"})
+            return
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send_json(400, {"error": "Invalid JSON"})
+            return
+        status, payload = handle_request(self.path, body)
+        self._send_json(status, payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def create_server(host="127.0.0.1", port=8765):
+    """Bind the listening socket (port 0 picks a free port)"""
+    server = ThreadingHTTPServer((host, port), ScoringRequestHandler)
+    server.daemon_threads = True
+    return server
+
+
+def serve(host="127.0.0.1", port=8765, workers=1):
+    """
+    Warm the engines, then serve on `workers` pre-forked processes sharing one socket.
+
+    Args:
+        host (str): Interface to bind
+        port (int): Port to bind
+        workers (int): Worker processes (fork is POSIX-only; falls back to 1 elsewhere)
+    """
+    elapsed = warm_up()
+    server = create_server(host, port)
+    print(f"Scoring service warmed in {elapsed:.2f}s, listening on http://{host}:{server.server_address[1]}")
+
+    if workers <= 1 or not hasattr(os, "fork"):
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+        return
+
+    children = []
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            try:
+                server.serve_forever()
+            finally:
+                os._exit(0)
+        children.append(pid)
+    print(f"Started {workers} workers: {children}")
+
+    try:
+        for pid in children:
+            os.waitpid(pid, 0)
+    except KeyboardInterrupt:
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+    finally:
+        server.server_close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="AspirePath headless scoring service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+    serve(args.host, args.port, args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Bounded Session Collections for AspirePath
+Capacity-bounded ring buffers and compact slotted records for the per-session
+history kept in st.session_state. Records hold references (resume content hashes,
+question ids, roadmap hashes) instead of full payloads, and the oldest entries are
+evicted once a collection is full, so a long session stays within a fixed budget.
+"""
+
+import sys
+from collections import deque
+
+from records import (  # noqa: F401  (record types live in records.py)
+    AchievementRecord, QuizRecord, ResumeRecord, RoadmapRecord, content_hash, question_ids
+)
+
+# Entries kept per session collection before the oldest are evicted
+SESSION_CAPACITIES = {
+    "resumes": 20,
+    "quiz_results": 200,
+    "roadmaps": 50,
+    "progress": 500,
+}
+
+
+def deep_sizeof(obj, seen=None):
+    """Approximate bytes held by an object graph (containers, dicts and slotted records)"""
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(key, seen) + deep_sizeof(value, seen) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    elif hasattr(obj, "__slots__"):
+        names = [name for cls in type(obj).__mro__ for name in getattr(cls, "__slots__", ())]
+        size += sum(deep_sizeof(getattr(obj, name), seen) for name in names if hasattr(obj, name))
+    elif hasattr(obj, "__dict__"):
+        size += deep_sizeof(vars(obj), seen)
+    return size
+
+
+class BoundedLog:
+    """Ring buffer of session records: iterates oldest first, evicts the oldest when full"""
+
+    __slots__ = ("name", "capacity", "dropped", "_items")
+
+    def __init__(self, capacity, name="", items=()):
+        self.name = name
+        self.capacity = capacity
+        self.dropped = 0
+        self._items = deque(maxlen=capacity)
+        self.extend(items)
+
+    def append(self, item):
+        if len(self._items) == self.capacity:
+            self.dropped += 1
+        self._items.append(item)
+
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+
+    def latest(self):
+        """Most recent record, or None"""
+        return self._items[-1] if self._items else None
+
+    def clear(self):
+        self._items.clear()
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def memory_report(self):
+        """Entries, capacity, evictions and approximate bytes held"""
+        return {
+            "entries": len(self._items),
+            "capacity": self.capacity,
+            "dropped": self.dropped,
+            "bytes": deep_sizeof(self._items),
+        }
+
+
+def bounded(collection, name):
+    """`collection` as a BoundedLog with the configured capacity (plain lists are converted)"""
+    if isinstance(collection, BoundedLog):
+        return collection
+    return BoundedLog(SESSION_CAPACITIES[name], name, collection or ())
+
+
+def memory_report(collections):
+    """
+    Per-collection memory of a session.
+
+    Args:
+        collections (dict): name -> BoundedLog or plain list
+
+    Returns:
+        dict: name -> report, plus "total_bytes"
+    """
+    report = {}
+    for name, collection in collections.items():
+        if isinstance(collection, BoundedLog):
+            report[name] = collection.memory_report()
+        else:
+            items = collection or []
+            report[name] = {"entries": len(items), "capacity": None, "dropped": 0, "bytes": deep_sizeof(items)}
+    report["total_bytes"] = sum(entry["bytes"] for entry in report.values())
+    return report
@@ -0,0 +1,406 @@
+"""
+Shared Model Artifacts for AspirePath
+Exports the immutable parts of a trained DynamicCareerPredictor (TF-IDF vocabulary,
+forest tree arrays, career matrices, neighbour index, distilled model) and the
+question bank index as plain .npy files, and loads them back memory-mapped.
+
+Every worker process that loads the same directory maps the same page-cache pages,
+so N workers share one physical copy instead of unpickling N private ones.
+
+    export_artifacts(predictor, "artifacts/")           # once, after training
+    predictor = load_predictor("artifacts/")            # in every worker
+    questions = QuestionIndex.load("artifacts/")
+"""
+
+import json
+import os
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from ann_index import IVFIndex, top_k
+from skill_normalizer import normalize_skill
+
+MANIFEST = "manifest.json"
+# TfidfVectorizer settings needed to rebuild the analyzer (tokenizer + n-grams)
+ANALYZER_PARAMS = ("lowercase", "token_pattern", "ngram_range", "stop_words", "analyzer", "strip_accents")
+
+
+def _save(directory, name, array):
+    np.save(os.path.join(directory, f"{name}.npy"), np.ascontiguousarray(array), allow_pickle=False)
+
+
+def _load(directory, name, mmap_mode="r"):
+    return np.load(os.path.join(directory, f"{name}.npy"), mmap_mode=mmap_mode, allow_pickle=False)
+
+
+def _save_csr(directory, name, matrix):
+    matrix = sparse.csr_matrix(matrix)
+    # sparsetools wants indices and indptr of the same integer type
+    index_dtype = np.int64 if matrix.nnz > np.iinfo(np.int32).max else np.int32
+    _save(directory, f"{name}_data", matrix.data)
+    _save(directory, f"{name}_indices", matrix.indices.astype(index_dtype))
+    _save(directory, f"{name}_indptr", matrix.indptr.astype(index_dtype))
+    _save(directory, f"{name}_shape", np.array(matrix.shape, dtype=np.int64))
+
+
+def _load_csr(directory, name, mmap_mode="r"):
+    shape = tuple(int(v) for v in _load(directory, f"{name}_shape", None))
+    # Built from the mapped buffers directly (no copy, no re-validation pass)
+    matrix = sparse.csr_matrix(shape, dtype=_load(directory, f"{name}_data", mmap_mode).dtype)
+    matrix.data = _load(directory, f"{name}_data", mmap_mode)
+    matrix.indices = _load(directory, f"{name}_indices", mmap_mode)
+    matrix.indptr = _load(directory, f"{name}_indptr", mmap_mode)
+    return matrix
+
+
+class MappedTfidfVectorizer:
+    """TfidfVectorizer.transform over a mapped, sorted vocabulary array and idf vector"""
+
+    def __init__(self, params, terms, idf):
+        self.params = params
+        self.terms = terms      # sorted feature names, position == column
+        self.idf_ = idf
+        self._analyze = TfidfVectorizer(**params).build_analyzer()
+
+    def get_feature_names_out(self):
+        return self.terms
+
+    def transform(self, documents):
+        rows, cols, values = [], [], []
+        for row, document in enumerate(documents):
+            tokens = np.array(self._analyze(document), dtype=self.terms.dtype)
+            if tokens.size == 0:
+                continue
+            positions = np.minimum(np.searchsorted(self.terms, tokens), len(self.terms) - 1)
+            found = positions[self.terms[positions] == tokens]
+            columns, counts = np.unique(found, return_counts=True)
+            weights = counts * self.idf_[columns]
+            norm = np.linalg.norm(weights)
+            rows.extend([row] * len(columns))
+            cols.extend(columns)
+            values.extend(weights / norm if norm else weights)
+        return sparse.csr_matrix((np.array(values, dtype=np.float32), (rows, cols)),
+                                 shape=(len(documents), len(self.terms)), dtype=np.float32)
+
+
+class MappedForest:
+    """Random forest predict_proba over flattened, mapped tree arrays"""
+
+    def __init__(self, classes, roots, left, right, feature, threshold, leaf_proba):
+        self.classes_ = classes
+        self.roots = roots            # global node id of each tree's root
+        self.left = left              # global child ids, -1 at leaves
+        self.right = right
+        self.feature = feature
+        self.threshold = threshold
+        self.leaf_proba = leaf_proba  # CSR (n_nodes x n_classes), rows only at leaves
+
+    def apply(self, X):
+        """Global leaf id reached in every tree: (n_rows, n_trees)"""
+        X = X.toarray() if sparse.issparse(X) else np.asarray(X)
+        X = X.astype(np.float32, copy=False)
+        nodes = np.broadcast_to(self.roots, (X.shape[0], len(self.roots))).copy()
+        rows = np.arange(X.shape[0])[:, None]
+        active = self.left[nodes] >= 0
+        while active.any():
+            current = nodes[active]
+            goes_left = X[np.broadcast_to(rows, nodes.shape)[active], self.feature[current]] <= self.threshold[current]
+            nodes[active] = np.where(goes_left, self.left[current], self.right[current])
+            active = self.left[nodes] >= 0
+        return nodes
+
+    def predict_proba(self, X):
+        leaves = self.apply(X)
+        n_rows, n_trees = leaves.shape
+        summed = sparse.csr_matrix(
+            (np.ones(leaves.size, dtype=np.float64), (np.repeat(np.arange(n_rows), n_trees), leaves.ravel())),
+            shape=(n_rows, self.leaf_proba.shape[0])
+        ) @ self.leaf_proba
+        return np.asarray(summed.todense()) / n_trees
+
+
+class MappedLinearModel:
+    """Multinomial / one-vs-rest linear classifier predict_proba over mapped coefficients"""
+
+    def __init__(self, classes, coef, intercept, multinomial):
+        self.classes_ = classes
+        self.coef_ = coef
+        self.intercept_ = intercept
+        self.multinomial = multinomial
+
+    def decision_function(self, X):
+        return np.asarray(X @ self.coef_.T) + self.intercept_
+
+    def predict_proba(self, X):
+        scores = self.decision_function(X)
+        if scores.shape[1] == 1:  # binary: one column for the positive class
+            positive = 1 / (1 + np.exp(-scores))
+            return np.hstack([1 - positive, positive])
+        if self.multinomial:
+            scores = np.exp(scores - scores.max(axis=1, keepdims=True))
+        else:
+            scores = 1 / (1 + np.exp(-scores))
+        return scores / scores.sum(axis=1, keepdims=True)
+
+    def predict(self, X):
+        return self.classes_[self.predict_proba(X).argmax(axis=1)]
+
+
+class MappedKMeans:
+    """KMeans.predict (nearest centre) over mapped cluster centres"""
+
+    def __init__(self, cluster_centers):
+        self.cluster_centers_ = cluster_centers
+        self._squared_norms = (np.asarray(cluster_centers, dtype=np.float64) ** 2).sum(axis=1)
+
+    def predict(self, X):
+        distances = self._squared_norms - 2 * np.asarray(X @ self.cluster_centers_.T)
+        return distances.argmin(axis=1)
+
+
+class _LabelView:
+    """Sequence of career names backed by a mapped int32 label array"""
+
+    def __init__(self, labels, names):
+        self.labels = labels
+        self.names = names
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __getitem__(self, i):
+        return self.names[self.labels[i]]
+
+    def __iter__(self):
+        return (self.names[label] for label in self.labels)
+
+
+class QuestionIndex:
+    """Question bank as one mapped UTF-8 blob plus a skill -> question postings index"""
+
+    def __init__(self, blob, offsets, skill_keys, skill_offsets, postings):
+        self.blob = blob                    # uint8, questions as concatenated JSON
+        self.offsets = offsets              # question i spans blob[offsets[i]:offsets[i + 1]]
+        self.skill_keys = skill_keys        # sorted normalized skills
+        self.skill_offsets = skill_offsets  # skill j owns postings[skill_offsets[j]:skill_offsets[j + 1]]
+        self.postings = postings
+
+    @staticmethod
+    def export(questions, directory):
+        """Write the index for a list of question dicts"""
+        encoded = [json.dumps(q, ensure_ascii=False).encode("utf-8") for q in questions]
+        offsets = np.concatenate(([0], np.cumsum([len(e) for e in encoded]))).astype(np.int64)
+        by_skill = {}
+        for i, question in enumerate(questions):
+            by_skill.setdefault(normalize_skill(question.get("skill", "")), []).append(i)
+        keys = sorted(key for key in by_skill if key)
+        postings = [by_skill[key] for key in keys]
+        _save(directory, "questions_blob", np.frombuffer(b"".join(encoded), dtype=np.uint8))
+        _save(directory, "questions_offsets", offsets)
+        _save(directory, "questions_skill_keys", np.array(keys, dtype=str) if keys else np.array([], dtype="U1"))
+        _save(directory, "questions_skill_offsets",
+              np.concatenate(([0], np.cumsum([len(p) for p in postings]))).astype(np.int64))
+        _save(directory, "questions_postings",
+              np.array([i for p in postings for i in p], dtype=np.int32))
+
+    @classmethod
+    def load(cls, directory, mmap_mode="r"):
+        return cls(*(_load(directory, f"questions_{name}", mmap_mode)
+                     for name in ("blob", "offsets", "skill_keys", "skill_offsets", "postings")))
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def get(self, i):
+        """Decode question i (only its bytes are touched)"""
+        return json.loads(self.blob[self.offsets[i]:self.offsets[i + 1]].tobytes().decode("utf-8"))
+
+    def question_ids(self, skill):
+        """Ids of the questions tagged with a skill (any spelling the normalizer knows)"""
+        key = normalize_skill(skill)
+        position = np.searchsorted(self.skill_keys, key)
+        if position >= len(self.skill_keys) or self.skill_keys[position] != key:
+            return self.postings[:0]
+        return self.postings[self.skill_offsets[position]:self.skill_offsets[position + 1]]
+
+    def questions_for_skills(self, skills):
+        """Questions for any of the skills, in bank order without duplicates"""
+        ids = np.unique(np.concatenate([self.question_ids(skill) for skill in skills] or [self.postings[:0]]))
+        return [self.get(i) for i in ids]
+
+
+def _export_forest(forest, directory):
+    lefts, rights, features, thresholds, probas, roots = [], [], [], [], [], []
+    offset = 0
+    for estimator in forest.estimators_:
+        tree = estimator.tree_
+        leaf = tree.children_left < 0
+        roots.append(offset)
+        lefts.append(np.where(leaf, -1, tree.children_left + offset))
+        rights.append(np.where(leaf, -1, tree.children_right + offset))
+        features.append(np.where(leaf, 0, tree.feature))
+        thresholds.append(tree.threshold)
+        values = tree.value[:, 0, :] * leaf[:, None]
+        totals = values.sum(axis=1, keepdims=True)
+        probas.append(sparse.csr_matrix(np.divide(values, totals, out=np.zeros_like(values), where=totals > 0)))
+        offset += tree.node_count
+    _save(directory, "forest_roots", np.array(roots, dtype=np.int64))
+    _save(directory, "forest_left", np.concatenate(lefts).astype(np.int64))
+    _save(directory, "forest_right", np.concatenate(rights).astype(np.int64))
+    _save(directory, "forest_feature", np.concatenate(features).astype(np.int32))
+    _save(directory, "forest_threshold", np.concatenate(thresholds).astype(np.float64))
+    _save_csr(directory, "forest_leaf_proba", sparse.vstack(probas).tocsr())
+
+
+def export_artifacts(predictor, directory, question_bank_path="real_mcq_bank.json"):
+    """
+    Write a trained predictor's immutable arrays (and the question index) to `directory`.
+
+    Args:
+        predictor (DynamicCareerPredictor): Trained predictor
+        directory (str): Output directory (created if missing)
+        question_bank_path (str): Question bank JSON to index, None to skip
+
+    Returns:
+        str: The directory
+    """
+    if not predictor.is_trained:
+        raise ValueError("Train the predictor before exporting its artifacts")
+    if getattr(predictor, 'career_importances', None) is None:
+        predictor._compute_career_importances()
+    os.makedirs(directory, exist_ok=True)
+
+    vectorizer = predictor.tfidf_vectorizer
+    terms = np.asarray(vectorizer.get_feature_names_out(), dtype=str)
+    if not np.all(terms[:-1] < terms[1:]):
+        raise ValueError("Vectorizer vocabulary is not in sorted column order")
+    _save(directory, "vocabulary", terms)
+    _save(directory, "idf", vectorizer.idf_.astype(np.float64))
+    _export_forest(predictor.rf_classifier, directory)
+    _save(directory, "kmeans_centers", predictor.kmeans.cluster_centers_)
+    _save(directory, "career_importances", predictor.career_importances)
+    _save_csr(directory, "career_centroids", predictor.career_centroids)
+
+    index = predictor.nn_index
+    _save(directory, "nn_centroids", index.centroids)
+    _save(directory, "nn_ids", index.ids)
+    _save(directory, "nn_offsets", index.offsets)
+    _save_csr(directory, "nn_vectors", index.vectors)
+
+    careers = sorted(set(predictor.training_careers))
+    career_ids = {career: i for i, career in enumerate(careers)}
+    _save(directory, "training_labels", np.array([career_ids[c] for c in predictor.training_careers], dtype=np.int32))
+    # Replay/teacher data for online_learning in the serving process
+    _save(directory, "training_texts", np.asarray(predictor.training_texts, dtype=str))
+
+    fast_model = predictor.fast_model
+    if fast_model is not None:
+        _save(directory, "fast_coef", np.asarray(fast_model.coef_, dtype=np.float32))
+        _save(directory, "fast_intercept", np.asarray(fast_model.intercept_, dtype=np.float32))
+
+    if question_bank_path:
+        with open(question_bank_path, encoding="utf-8") as f:
+            QuestionIndex.export(json.load(f), directory)
+
+    manifest = {
+        "version": 1,
+        "analyzer": {name: vectorizer.get_params()[name] for name in ANALYZER_PARAMS},
+        "forest_classes": [str(c) for c in predictor.rf_classifier.classes_],
+        "careers": careers,
+        "career_names": list(predictor.career_names),
+        "career_clusters": {str(k): v for k, v in predictor.career_clusters.items()},
+        "nn_params": {"n_probe": predictor.nn_index.n_probe, "seed": predictor.nn_index.seed,
+                      "exact_threshold": predictor.nn_index.exact_threshold,
+                      "chunk_size": predictor.nn_index.chunk_size},
+        "fast_model": None if fast_model is None else {
+            "classes": [str(c) for c in fast_model.classes_],
+            # LogisticRegression is multinomial for 3+ classes; SGD (online_learning) is one-vs-rest
+            "multinomial": type(fast_model).__name__ == "LogisticRegression",
+        },
+        "model_version": predictor.model_version,
+        "has_questions": bool(question_bank_path),
+    }
+    manifest["analyzer"]["ngram_range"] = list(manifest["analyzer"]["ngram_range"])
+    with open(os.path.join(directory, MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    return directory
+
+
+def load_predictor(directory, mmap_mode="r"):
+    """
+    Rebuild a serving-ready DynamicCareerPredictor whose large arrays are mapped from `directory`.
+
+    Only small per-career lookups (cluster lists, top-feature tables) are built in
+    process memory; predict_dynamic_careers, explanations and get_skill_importance
+    work as on the original predictor.
+    """
+    from ml_career_predictor import DynamicCareerPredictor
+
+    with open(os.path.join(directory, MANIFEST), encoding="utf-8") as f:
+        manifest = json.load(f)
+    analyzer = dict(manifest["analyzer"], ngram_range=tuple(manifest["analyzer"]["ngram_range"]))
+
+    predictor = DynamicCareerPredictor()
+    predictor.tfidf_vectorizer = MappedTfidfVectorizer(analyzer, _load(directory, "vocabulary", mmap_mode),
+                                                       _load(directory, "idf", mmap_mode))
+    predictor.rf_classifier = MappedForest(
+        np.array(manifest["forest_classes"], dtype=object),
+        *(_load(directory, f"forest_{name}", mmap_mode) for name in ("roots", "left", "right", "feature", "threshold")),
+        _load_csr(directory, "forest_leaf_proba", mmap_mode),
+    )
+    predictor.kmeans = MappedKMeans(_load(directory, "kmeans_centers", mmap_mode))
+
+    index = IVFIndex(**manifest["nn_params"])
+    index.centroids = _load(directory, "nn_centroids", mmap_mode)
+    index.ids = _load(directory, "nn_ids", mmap_mode)
+    index.offsets = _load(directory, "nn_offsets", mmap_mode)
+    index.vectors = _load_csr(directory, "nn_vectors", mmap_mode)
+    index.n_lists = len(index.offsets) - 1
+    predictor.nn_index = index
+
+    fast = manifest["fast_model"]
+    if fast is not None:
+        predictor.fast_model = MappedLinearModel(np.array(fast["classes"], dtype=object),
+                                                 _load(directory, "fast_coef", mmap_mode),
+                                                 _load(directory, "fast_intercept", mmap_mode),
+                                                 fast["multinomial"])
+
+    predictor.career_names = manifest["career_names"]
+    predictor.career_clusters = {int(k): v for k, v in manifest["career_clusters"].items()}
+    predictor.training_careers = _LabelView(_load(directory, "training_labels", mmap_mode), manifest["careers"])
+    if os.path.exists(os.path.join(directory, "training_texts.npy")):
+        predictor.training_texts = _load(directory, "training_texts", mmap_mode)
+    predictor.career_importances = _load(directory, "career_importances", mmap_mode)
+    predictor.career_importance_index = {career: i for i, career in enumerate(manifest["forest_classes"])}
+    predictor.career_centroids = _load_csr(directory, "career_centroids", mmap_mode)
+    predictor.feature_names = predictor.tfidf_vectorizer.terms
+    predictor.career_top_features = {}
+    for career, row in predictor.career_importance_index.items():
+        importances = predictor.career_importances[row]
+        best = top_k(importances, predictor.CAREER_IMPORTANCE_TOP_K)
+        best = best[importances[best] > 0]
+        predictor.career_top_features[career] = (best, np.asarray(importances[best]))
+    predictor.model_version = manifest["model_version"]
+    predictor.is_trained = True
+    return predictor
+
+
+if __name__ == "__main__":
+    import contextlib
+    import io
+    import tempfile
+
+    from ml_career_predictor import DynamicCareerPredictor
+
+    predictor = DynamicCareerPredictor()
+    with contextlib.redirect_stdout(io.StringIO()):
+        predictor.train_models()
+    directory = export_artifacts(predictor, tempfile.mkdtemp(prefix="aspirepath_artifacts_"))
+    shared = load_predictor(directory)
+    skills = ["Python", "Machine Learning", "TensorFlow", "Data Analysis"]
+    for mode in ("full", "fast"):
+        print(mode, [p["career"] for p in shared.predict_dynamic_careers(skills, mode=mode)])
+    print(f"{len(QuestionIndex.load(directory).questions_for_skills(['Python', 'SQL']))} Python/SQL questions "
+          f"from {directory}")
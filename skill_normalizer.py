@@ -0,0 +1,273 @@
+"""
+Skill Normalization for AspirePath
+Maps free-form skill spellings ("PowerBI", "ML", "JS", "node.js") onto the canonical
+skills of the compiled taxonomy. Spellings are reduced to a compact key (casefolded,
+whitespace and punctuation stripped) and resolved through a hash lookup over every
+skill name and alias, so matching never falls back to substring scans.
+
+    canonical_skill("PowerBI")      -> "Power BI"
+    canonical_skill("ml")           -> "Machine Learning"
+    extract_skill_ids(resume_text)  -> taxonomy skill ids mentioned in the text
+"""
+
+import re
+from functools import lru_cache
+
+from skill_taxonomy import get_taxonomy, register_reload_hook
+
+# Word-ish tokens that keep "C++", "C#", ".NET", "node.js" and "scikit-learn" whole
+_TOKEN_RE = re.compile(r"\.?[^\W_][\w+#]*(?:[.\-][\w+#]+)*")
+
+# Spellings this short ("R", "ML", "JS") are only extracted from prose when the
+# casing matches, so "r" or "ds" inside ordinary text doesn't count as a skill.
+# The same holds for all-caps acronym aliases ("ANN", "OOP") and the taxonomy's
+# case_sensitive_aliases ("Node", "Torch"), which are common words in lowercase.
+_CASE_SENSITIVE_MAX_LEN = 2
+
+
+def _is_case_sensitive(spelling, is_alias, listed):
+    if len(spelling) <= _CASE_SENSITIVE_MAX_LEN and spelling.isalpha():
+        return True
+    return is_alias and (spelling in listed or (spelling.isalnum() and spelling.isupper()))
+
+
+def tokenize(text):
+    """Split text into casefolded skill tokens"""
+    return _TOKEN_RE.findall(text.casefold())
+
+
+def _compact_token(token):
+    # Keep a leading dot (".net") but drop hyphens and inner dots ("node.js" -> "nodejs")
+    lead = "." if token.startswith(".") else ""
+    return lead + token.replace("-", "").replace(".", "")
+
+
+def canonical_key(text):
+    """
+    Reduce a skill spelling to its lookup key.
+
+    "Power BI", "PowerBI" and "power-bi" all become "powerbi".
+    """
+    return "".join(_compact_token(token) for token in tokenize(text))
+
+
+def canonical_phrase(text):
+    """Casefold a skill and collapse whitespace/punctuation to single spaces"""
+    return " ".join(tokenize(text))
+
+
+class SkillIndex:
+    """Hash indexes over one compiled taxonomy"""
+
+    def __init__(self, taxonomy):
+        self.taxonomy = taxonomy
+        self.key_index = {}
+        # key -> exact spelling required when extracting from prose
+        self.case_sensitive = {}
+        self.max_tokens = 1
+
+        # Names first so an alias can never shadow another skill's own name
+        spellings = [(i, name, False) for i, name in enumerate(taxonomy.skill_names)]
+        spellings += [(i, alias, True) for i, aliases in enumerate(taxonomy.skill_aliases) for alias in aliases]
+        listed = getattr(taxonomy, "skill_case_sensitive_aliases", None)
+        for i, spelling, is_alias in spellings:
+            key = canonical_key(spelling)
+            if not key or key in self.key_index:
+                continue
+            self.key_index[key] = i
+            if _is_case_sensitive(spelling, is_alias, listed[i] if listed else ()):
+                self.case_sensitive[key] = spelling
+            self.max_tokens = max(self.max_tokens, len(tokenize(spelling)))
+
+        # Inverted indexes over the career vocabulary (values are career positions):
+        # required skill -> careers requiring it, and every contiguous word run
+        # inside a required skill -> careers with such a skill (partial matches)
+        skill_careers = {}
+        ngram_careers = {}
+        for position, career in enumerate(taxonomy.career_names):
+            for skill in taxonomy.career_skill_lower[career]:
+                skill_careers.setdefault(skill, set()).add(position)
+                for ngram in word_ngrams(skill):
+                    ngram_careers.setdefault(ngram, set()).add(position)
+        self.skill_careers = {skill: frozenset(careers) for skill, careers in skill_careers.items()}
+        self.ngram_careers = {ngram: frozenset(careers) for ngram, careers in ngram_careers.items()}
+
+    def match_careers(self, skill):
+        """
+        Careers a normalized skill matches, in one pass over the inverted indexes.
+
+        Returns:
+            tuple: (career positions with an exact match, positions with only a partial match)
+        """
+        exact = self.skill_careers.get(skill, frozenset())
+        partial = set(self.ngram_careers.get(skill, ()))
+        for ngram in word_ngrams(skill):
+            partial.update(self.skill_careers.get(ngram, ()))
+        partial.difference_update(exact)
+        return exact, partial
+
+    def match_counts(self, normalized_skills):
+        """
+        Exact and partial match counts for every career at once.
+
+        Equivalent to calling count_matches() per career, without visiting careers
+        the skills don't touch.
+
+        Returns:
+            tuple: (exact counts, partial counts), lists aligned with taxonomy.career_names
+        """
+        career_count = len(self.taxonomy.career_names)
+        exact_counts = [0] * career_count
+        partial_counts = [0] * career_count
+        for skill in normalized_skills:
+            exact, partial = self.match_careers(skill)
+            for position in exact:
+                exact_counts[position] += 1
+            for position in partial:
+                partial_counts[position] += 1
+        return exact_counts, partial_counts
+
+
+def word_ngrams(phrase):
+    """All contiguous word runs of a canonical phrase ("data analysis" -> data, analysis, data analysis)"""
+    words = phrase.replace("-", " ").split()
+    return {
+        " ".join(words[start:end])
+        for start in range(len(words))
+        for end in range(start + 1, len(words) + 1)
+    }
+
+
+_index = None
+
+
+def get_skill_index():
+    """Return the index for the current taxonomy, rebuilding it after a reload"""
+    global _index
+    taxonomy = get_taxonomy()
+    index = _index
+    if index is None or index.taxonomy is not taxonomy:
+        index = _index = SkillIndex(taxonomy)
+    return index
+
+
+@lru_cache(maxsize=8192)
+def canonical_skill_id(skill):
+    """
+    Resolve a single skill spelling to its taxonomy skill id.
+
+    Args:
+        skill (str): Skill as typed or parsed ("PowerBI", " ml ", "Node.js")
+
+    Returns:
+        int or None: Index into the taxonomy's skill tables, None if unknown
+    """
+    return get_skill_index().key_index.get(canonical_key(skill))
+
+
+def canonical_skill(skill):
+    """
+    Resolve a skill spelling to its canonical display name.
+
+    Returns:
+        str or None: Canonical name ("Power BI"), None if the skill is unknown
+    """
+    skill_id = canonical_skill_id(skill)
+    return None if skill_id is None else get_taxonomy().skill_names[skill_id]
+
+
+@lru_cache(maxsize=8192)
+def normalize_skill(skill):
+    """Lowercased canonical name for known skills, canonical phrase otherwise"""
+    skill_id = canonical_skill_id(skill)
+    if skill_id is not None:
+        return get_taxonomy().skill_names_lower[skill_id]
+    return canonical_phrase(skill)
+
+
+def normalize_skills(user_skills):
+    """Normalize a skill list, dropping blanks and duplicates (order preserved)"""
+    seen = {}
+    for skill in user_skills:
+        normalized = normalize_skill(skill)
+        if normalized:
+            seen.setdefault(normalized, None)
+    return list(seen)
+
+
+def display_skills(user_skills):
+    """Canonical display names for known skills, original (stripped) text otherwise"""
+    return [canonical_skill(skill) or skill.strip() for skill in user_skills]
+
+
+def count_matches(normalized_skills, career_skill_set, career_ngrams):
+    """
+    Count exact and partial matches of normalized skills against one career.
+    Used for ad-hoc career dictionaries; taxonomy careers go through
+    SkillIndex.match_counts().
+
+    A partial match is a whole-word overlap: the user skill is a word run inside a
+    required skill ("data" ~ "data analysis") or a required skill is a word run
+    inside the user skill ("advanced python" ~ "python"), so "r" no longer
+    matches every skill that happens to contain the letter.
+
+    Returns:
+        tuple: (exact matches, partial matches)
+    """
+    exact = 0
+    partial = 0
+    for skill in normalized_skills:
+        if skill in career_skill_set:
+            exact += 1
+        elif skill in career_ngrams or not career_skill_set.isdisjoint(word_ngrams(skill)):
+            partial += 1
+    return exact, partial
+
+
+def extract_skill_ids(text):
+    """
+    Find every taxonomy skill mentioned in free text.
+
+    Scans word tokens left to right and takes the longest run of up to
+    `max_tokens` words whose compact key is a known name or alias.
+
+    Returns:
+        list: Skill ids in first-mention order (no duplicates)
+    """
+    index = get_skill_index()
+    raw_tokens = _TOKEN_RE.findall(text)
+    keys = [_compact_token(token.casefold()) for token in raw_tokens]
+    found = {}
+    position = 0
+    while position < len(keys):
+        matched = 0
+        for length in range(min(index.max_tokens, len(keys) - position), 0, -1):
+            key = "".join(keys[position:position + length])
+            skill_id = index.key_index.get(key)
+            if skill_id is None:
+                continue
+            required = index.case_sensitive.get(key)
+            if required is not None and (length != 1 or raw_tokens[position] != required):
+                continue
+            found.setdefault(skill_id, None)
+            matched = length
+            break
+        position += matched or 1
+    return list(found)
+
+
+def _clear_caches(taxonomy):
+    global _index
+    _index = None
+    canonical_skill_id.cache_clear()
+    normalize_skill.cache_clear()
+
+
+register_reload_hook(_clear_caches)
+
+
+if __name__ == "__main__":
+    for spelling in ["PowerBI", "ml", "JS", "node.js", "scikit-learn", "C#", "Rust"]:
+        print(f"{spelling!r:16} -> {canonical_skill(spelling)}")
+    text = "Built ML pipelines in Python and PowerBI dashboards; React.js and Node frontends."
+    print([get_taxonomy().skill_names[i] for i in extract_skill_ids(text)])
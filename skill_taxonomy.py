@@ -0,0 +1,184 @@
+"""
+Unified Skill Taxonomy for AspirePath
+Single source of truth for skills, aliases and career requirements, loaded from
+skill_taxonomy.json and compiled once into interned integer-id arrays and lookup
+tables shared by every engine (core, enhanced_prediction, smart_quiz, config).
+
+Call reload_taxonomy() to pick up edits to the JSON file without restarting.
+"""
+
+import json
+import os
+import sys
+import threading
+
+import numpy as np
+
+DEFAULT_TAXONOMY_PATH = os.environ.get(
+    "ASPIREPATH_TAXONOMY",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "skill_taxonomy.json")
+)
+
+
+class CompiledTaxonomy:
+    """Immutable, pre-parsed view of a taxonomy source document"""
+
+    def __init__(self, source, path=None, mtime=None):
+        self.path = path
+        self.mtime = mtime
+        self.version = source.get("version", 1)
+
+        # --- skills: string id <-> integer id ---
+        skills = source.get("skills", {})
+        self.skill_ids = tuple(sys.intern(skill_id) for skill_id in skills)
+        self.skill_index = {skill_id: i for i, skill_id in enumerate(self.skill_ids)}
+        self.skill_names = tuple(sys.intern(skills[skill_id]["name"]) for skill_id in self.skill_ids)
+        self.skill_names_lower = tuple(sys.intern(name.lower()) for name in self.skill_names)
+        # Case-sensitive aliases are ordinary words ("Node", "Torch") that only name the
+        # skill when spelled exactly so in prose; skill lists resolve them like any alias
+        self.skill_case_sensitive_aliases = tuple(
+            frozenset(sys.intern(alias) for alias in skills[skill_id].get("case_sensitive_aliases", []))
+            for skill_id in self.skill_ids
+        )
+        self.skill_aliases = tuple(
+            tuple(sys.intern(alias) for alias in skills[skill_id].get("aliases", []))
+            + tuple(sorted(self.skill_case_sensitive_aliases[i]))
+            for i, skill_id in enumerate(self.skill_ids)
+        )
+
+        # Lowercased display names and aliases -> integer skill id
+        self.name_index = {lower: i for i, lower in enumerate(self.skill_names_lower)}
+        self.alias_index = dict(self.name_index)
+        for i, aliases in enumerate(self.skill_aliases):
+            for alias in aliases:
+                self.alias_index.setdefault(sys.intern(alias.lower()), i)
+
+        # --- careers ---
+        careers = source.get("careers", {})
+        self.career_names = tuple(sys.intern(career) for career in careers)
+        self.career_index = {career: i for i, career in enumerate(self.career_names)}
+
+        career_skill_ids = {}
+        career_weights = {}
+        for career in self.career_names:
+            weighted = careers[career].get("skills", {})
+            unknown = [skill_id for skill_id in weighted if skill_id not in self.skill_index]
+            if unknown:
+                raise ValueError(f"Career '{career}' references unknown skills: {unknown}")
+            career_skill_ids[career] = np.array([self.skill_index[s] for s in weighted], dtype=np.int32)
+            career_weights[career] = np.array(list(weighted.values()), dtype=np.float32)
+            career_skill_ids[career].setflags(write=False)
+            career_weights[career].setflags(write=False)
+        self.career_skill_ids = career_skill_ids
+        self.career_weights = career_weights
+
+        self.career_skill_lists = {
+            career: tuple(self.skill_names[i] for i in ids) for career, ids in career_skill_ids.items()
+        }
+        self.career_skill_lower = {
+            career: tuple(self.skill_names_lower[i] for i in ids) for career, ids in career_skill_ids.items()
+        }
+        self.career_skill_sets = {
+            career: frozenset(skills_lower) for career, skills_lower in self.career_skill_lower.items()
+        }
+        # Comma-joined requirement strings (TF-IDF documents for enhanced_prediction)
+        self.career_documents = tuple(", ".join(self.career_skill_lists[c]) for c in self.career_names)
+
+        # Career x skill weight matrix for vectorized scoring
+        self.incidence = np.zeros((len(self.career_names), len(self.skill_ids)), dtype=np.float32)
+        for row, career in enumerate(self.career_names):
+            self.incidence[row, career_skill_ids[career]] = career_weights[career]
+        self.incidence.setflags(write=False)
+
+        # Skills that appear in at least one career, in first-appearance order
+        seen = {}
+        for career in self.career_names:
+            for i in career_skill_ids[career]:
+                seen.setdefault(int(i), None)
+        self.career_skill_vocabulary = tuple(seen)
+
+        self.quiz_priorities = {
+            career: tuple(careers[career].get("quiz_priorities", [])) for career in self.career_names
+        }
+        self.focus_areas = {
+            career: tuple(careers[career].get("focus_areas", [])) for career in self.career_names
+        }
+        # Keyword fallback keeps its own career order: ties resolve to the first career listed
+        self.keyword_fallback = {
+            sys.intern(career): tuple(keywords)
+            for career, keywords in source.get("keyword_fallback", {}).items()
+        }
+
+    def skill_templates(self):
+        """Career -> list of skill display names (the config.SKILL_TEMPLATES shape)"""
+        return {career: list(skills) for career, skills in self.career_skill_lists.items()}
+
+    def career_skill_strings(self):
+        """Career -> comma-separated skill string (the core.CAREER_SKILLS shape)"""
+        return dict(zip(self.career_names, self.career_documents))
+
+
+def load_taxonomy(path=DEFAULT_TAXONOMY_PATH):
+    """Read and compile a taxonomy JSON file"""
+    with open(path, "r", encoding="utf-8") as f:
+        source = json.load(f)
+    return CompiledTaxonomy(source, path=path, mtime=os.path.getmtime(path))
+
+
+_lock = threading.Lock()
+_taxonomy = None
+_reload_hooks = []
+
+
+def get_taxonomy():
+    """Return the compiled taxonomy, compiling it on first use"""
+    global _taxonomy
+    taxonomy = _taxonomy
+    if taxonomy is None:
+        with _lock:
+            if _taxonomy is None:
+                _taxonomy = load_taxonomy()
+            taxonomy = _taxonomy
+    return taxonomy
+
+
+def register_reload_hook(callback):
+    """Call `callback(taxonomy)` whenever a new taxonomy is swapped in"""
+    _reload_hooks.append(callback)
+
+
+def reload_taxonomy(path=None, force=False):
+    """
+    Recompile the taxonomy if its source file changed (hot reload).
+
+    Args:
+        path (str): Taxonomy file to load (defaults to the current one)
+        force (bool): Recompile even if the file's mtime is unchanged
+
+    Returns:
+        bool: True if a new taxonomy was swapped in
+    """
+    global _taxonomy
+    with _lock:
+        current = _taxonomy
+        path = path or (current.path if current else DEFAULT_TAXONOMY_PATH)
+        if not force and current is not None and current.path == path:
+            try:
+                if os.path.getmtime(path) == current.mtime:
+                    return False
+            except OSError:
+                return False
+        try:
+            taxonomy = load_taxonomy(path)
+        except (OSError, ValueError, KeyError) as e:
+            # Keep serving the last good taxonomy if the edited file is broken
+            print(f"Failed to reload skill taxonomy from {path}: {e}")
+            return False
+        _taxonomy = taxonomy
+
+    for callback in list(_reload_hooks):
+        try:
+            callback(taxonomy)
+        except Exception as e:
+            print(f"Skill taxonomy reload hook failed: {e}")
+    return True
@@ -2,10 +2,24 @@
 
 import json
 import random
+import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
+from skill_taxonomy import get_taxonomy
+from records import get_question_bank
+from tracing import traced
 
-def load_smart_questions(user_skills, predicted_career=None, path="real_mcq_bank.json", max_questions=10):
+# Most extra relevance a question gets for a skill the user has not mastered yet
+MASTERY_BOOST = 3
+
+def _ranking_head(ranking, exclude, count):
+    """The first `count` positions of a precomputed ranking that are not in `exclude`"""
+    head = ranking[:count + len(exclude)]
+    return head[~np.isin(head, exclude)][:count]
+
+@traced("load_smart_questions")
+def load_smart_questions(user_skills, predicted_career=None, path="real_mcq_bank.json", max_questions=10,
+                         seed=None, mastery=None):
     """
     Enhanced question loading with ML-based relevance scoring.
     
@@ -14,95 +28,92 @@ def load_smart_questions(user_skills, predicted_career=None, path="real_mcq_bank
         predicted_career (str): Predicted career path (optional)
         path (str): Path to question bank
         max_questions (int): Maximum questions to return
+        seed (int): Per-user seed (sampling.quiz_seed) so reruns keep the same order
+        mastery (dict): Casefolded skill -> quiz mastery 0-1 (SkillMastery.lookup()); questions
+            on the user's weaker skills get up to MASTERY_BOOST extra relevance
     
     Returns:
         list: Optimally selected questions based on user profile
     """
     try:
-        with open(path, "r", encoding='utf-8') as f:
-            all_questions = json.load(f)
+        bank = get_question_bank(path)
         
-        if not all_questions:
+        if not len(bank):
             return []
         
-        # Career-specific skill priorities
-        CAREER_SKILL_PRIORITIES = {
-            "Data Analyst": ["sql", "python", "excel", "statistics", "tableau", "powerbi"],
-            "Web Developer": ["javascript", "html", "css", "react", "node", "mongodb"],
-            "ML Engineer": ["python", "machine learning", "tensorflow", "pytorch", "pandas"],
-            "AI Engineer": ["python", "tensorflow", "neural networks", "deep learning", "nlp"],
-            "Cybersecurity Analyst": ["security", "network", "firewall", "encryption", "linux"],
-            "Software Developer": ["java", "python", "algorithms", "data structures", "programming"],
-            "Game Developer": ["unity", "c#", "game development", "3d", "physics"]
-        }
+        # Career-specific skill priorities (from the compiled skill taxonomy); the bank
+        # keeps a precomputed ranking per career, built once per bank/taxonomy version
+        CAREER_SKILL_PRIORITIES = get_taxonomy().quiz_priorities
+        bank.rank_careers(CAREER_SKILL_PRIORITIES)
         
         user_skills_lower = [skill.lower().strip() for skill in user_skills]
+        keywords = [skill for skill in user_skills_lower if len(skill) > 2]
         
-        # Score each question based on relevance
-        scored_questions = []
+        # Candidates: every question the user's skills or keywords touch, plus the head of
+        # the career and difficulty rankings - nothing outside can outrank them
+        skill_matches = bank.skill_candidates(user_skills_lower)
+        keyword_hits = [bank.text_hits(keyword) for keyword in keywords]
+        candidates = np.unique(np.concatenate([skill_matches, *keyword_hits]))
+        parts = [candidates, _ranking_head(bank.difficulty_ranking, candidates, max_questions)]
+        career = predicted_career and predicted_career in CAREER_SKILL_PRIORITIES
+        if career:
+            career_mask, career_ranking, skill_leaders = bank.career_rankings[predicted_career]
+            parts += [_ranking_head(career_ranking, candidates, max_questions), skill_leaders]
+        pool = np.unique(np.concatenate(parts))
         
-        for question in all_questions:
-            question_skill = question.get("skill", "").lower().strip()
-            question_text = question.get("question", "").lower()
-            
-            relevance_score = 0
-            
-            # 1. Direct skill match (highest priority)
-            if any(skill in question_skill or question_skill in skill for skill in user_skills_lower):
-                relevance_score += 10
-            
-            # 2. Career-specific relevance boost
-            if predicted_career and predicted_career in CAREER_SKILL_PRIORITIES:
-                priority_skills = CAREER_SKILL_PRIORITIES[predicted_career]
-                if any(priority_skill in question_skill for priority_skill in priority_skills):
-                    relevance_score += 5
-            
-            # 3. Keyword matching in question text
-            keyword_matches = sum(1 for skill in user_skills_lower 
-                                if skill in question_text and len(skill) > 2)
-            relevance_score += keyword_matches * 2
-            
-            # 4. Question difficulty alignment (prefer medium difficulty for assessment)
-            difficulty = question.get("difficulty", "medium").lower()
-            if difficulty == "medium":
-                relevance_score += 1
-            elif difficulty == "hard":
-                relevance_score += 0.5
-            
-            scored_questions.append({
-                **question,
-                'relevance_score': relevance_score
-            })
+        # 1. Direct skill match (highest priority)
+        relevance_scores = np.where(np.isin(pool, skill_matches), 10.0, 0.0)
+        
+        # 2. Career-specific relevance boost
+        if career:
+            relevance_scores += 5 * career_mask[pool]
+        
+        # 3. Keyword matching in question text
+        for hits in keyword_hits:
+            relevance_scores += 2 * np.isin(pool, hits)
+        
+        # 4. Question difficulty alignment (prefer medium difficulty for assessment)
+        relevance_scores += bank.difficulty_weights[pool]
         
-        # Sort by relevance score
-        scored_questions.sort(key=lambda x: x['relevance_score'], reverse=True)
+        # 5. Weak skills from earlier quizzes (only on questions for the user's own skills)
+        if mastery:
+            gaps = np.array([1 - mastery[skill] if skill in mastery else 0.0 for skill in bank.skills])
+            relevance_scores += MASTERY_BOOST * gaps[bank.skill_codes[pool]] * np.isin(pool, skill_matches)
+        
+        # Sort by relevance score (ties keep bank order)
+        order = np.lexsort((pool, -relevance_scores))
+        ranked = pool[order]
+        scores = dict(zip(ranked.tolist(), relevance_scores[order].tolist()))
         
         # Select top questions with diversity
-        selected_questions = []
+        selected = []
         used_skills = set()
         
         # First pass: High relevance questions
-        for q in scored_questions:
-            if len(selected_questions) >= max_questions:
+        for i in ranked:
+            if len(selected) >= max_questions or scores[i] < 5:
                 break
             
-            q_skill = q.get("skill", "").lower()
-            if q['relevance_score'] >= 5 and q_skill not in used_skills:
-                selected_questions.append(q)
+            q_skill = bank.skill_codes[i]
+            if q_skill not in used_skills:
+                selected.append(i)
                 used_skills.add(q_skill)
         
         # Second pass: Fill remaining slots with diverse questions
-        remaining_slots = max_questions - len(selected_questions)
-        for q in scored_questions:
-            if remaining_slots <= 0:
+        chosen = set(selected)
+        for i in ranked:
+            if len(selected) >= max_questions:
                 break
             
-            if q not in selected_questions:
-                selected_questions.append(q)
-                remaining_slots -= 1
+            if i not in chosen:
+                selected.append(i)
+        
+        selected_questions = [
+            dict(bank[i].as_dict(), relevance_score=scores[i]) for i in selected
+        ]
         
-        # Shuffle to avoid predictable order
-        random.shuffle(selected_questions)
+        # Shuffle to avoid predictable order (only the selected questions; seeded when a seed is given)
+        (random if seed is None else random.Random(seed)).shuffle(selected_questions)
         
         return selected_questions[:max_questions]
         
@@ -116,13 +127,15 @@ def load_smart_questions(user_skills, predicted_career=None, path="real_mcq_bank
         print(f"Error loading smart questions: {e}")
         return []
 
-def adaptive_quiz_flow(user_skills, initial_questions_count=10):
+def adaptive_quiz_flow(user_skills, initial_questions_count=10, seed=None, mastery=None):
     """
     Adaptive quiz that adjusts based on user performance.
     
     Args:
         user_skills (list): User's skills
         initial_questions_count (int): Starting number of questions
+        seed (int): Per-user quiz seed, see load_smart_questions
+        mastery (dict): Skill mastery lookup, see load_smart_questions
     
     Returns:
         dict: Adaptive quiz configuration
@@ -136,7 +149,9 @@ def adaptive_quiz_flow(user_skills, initial_questions_count=10):
     questions = load_smart_questions(
         user_skills, 
         predicted_career, 
-        max_questions=initial_questions_count
+        max_questions=initial_questions_count,
+        seed=seed,
+        mastery=mastery
     )
     
     # Create adaptive flow
@@ -161,15 +176,7 @@ def adaptive_quiz_flow(user_skills, initial_questions_count=10):
 def get_focus_areas(user_skills, predicted_career):
     """Identify areas that need more assessment based on career prediction"""
     
-    CAREER_FOCUS_AREAS = {
-        "Data Analyst": ["Statistics", "SQL", "Data Visualization", "Excel"],
-        "Web Developer": ["JavaScript", "Frontend Frameworks", "Backend Development", "Databases"],
-        "ML Engineer": ["Machine Learning Algorithms", "Python Libraries", "Model Deployment", "Statistics"],
-        "AI Engineer": ["Deep Learning", "Neural Networks", "Computer Vision", "NLP"],
-        "Cybersecurity Analyst": ["Network Security", "Cryptography", "Incident Response", "Risk Assessment"],
-        "Software Developer": ["Programming Languages", "Algorithms", "System Design", "Testing"],
-        "Game Developer": ["Game Engines", "Graphics Programming", "Game Physics", "3D Mathematics"]
-    }
+    CAREER_FOCUS_AREAS = get_taxonomy().focus_areas
     
     focus_areas = CAREER_FOCUS_AREAS.get(predicted_career, [])
     user_skills_lower = [skill.lower() for skill in user_skills]
@@ -183,12 +190,12 @@ def get_focus_areas(user_skills, predicted_career):
     return missing_areas
 
 # Integration function for your existing app
-def integrate_smart_quiz_in_app(user_skills):
+def integrate_smart_quiz_in_app(user_skills, seed=None, mastery=None):
     """
     Drop-in replacement for your existing quiz logic in app.py
     """
     # Get adaptive quiz configuration
-    quiz_config = adaptive_quiz_flow(user_skills)
+    quiz_config = adaptive_quiz_flow(user_skills, seed=seed, mastery=mastery)
     
     # Return questions in the format your app expects
     return quiz_config['questions'], quiz_config
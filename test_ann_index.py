@@ -0,0 +1,49 @@
+"""
+Tests for the IVF approximate nearest-neighbour index
+"""
+
+import os
+import sys
+
+import numpy as np
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+from ann_index import IVFIndex, top_k
+from benchmarks.generators import generate_profile_texts
+
+
+def test_top_k_is_sorted_with_stable_ties():
+    scores = np.array([0.1, 0.9, 0.5, 0.9, 0.0])
+    assert top_k(scores, 3).tolist() == [1, 3, 2]
+    assert top_k(scores, 10).tolist() == [1, 3, 2, 0, 4]
+
+
+def test_small_corpus_search_is_exact():
+    matrix = TfidfVectorizer().fit_transform(generate_profile_texts(300, seed=1))
+    index = IVFIndex().fit(matrix)
+    similarities, ids = index.search(matrix[:5], k=4)
+    expected = cosine_similarity(matrix[:5], matrix)
+    for row in range(5):
+        assert np.allclose(similarities[row], np.sort(expected[row])[::-1][:4], atol=1e-5)
+
+
+def test_recall_tradeoff_and_persistence(tmp_path):
+    matrix = TfidfVectorizer().fit_transform(generate_profile_texts(6000, seed=2))
+    index = IVFIndex(n_probe=4, exact_threshold=0).fit(matrix)
+    assert len(index.offsets) - 1 > 1
+
+    curve = index.recall_latency(matrix[:50], k=10, n_probes=(1, 4, 1000))
+    recalls = [row["recall"] for row in curve]
+    assert recalls == sorted(recalls)
+    assert recalls[1] >= 0.9 and recalls[-1] == 1.0
+
+    path = tmp_path / "index.npz"
+    index.save(path)
+    loaded = IVFIndex.load(path)
+    for before, after in zip(index.search(matrix[:10], k=5), loaded.search(matrix[:10], k=5)):
+        assert np.array_equal(before, after)
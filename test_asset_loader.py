@@ -0,0 +1,111 @@
+"""
+Tests for the cached, timeout-bounded asset loader against a local HTTP stand-in server
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from asset_loader import AssetLoader
+
+ANIMATION = {"v": "5.7.4", "fr": 30, "ip": 0, "op": 60, "w": 100, "h": 100, "layers": []}
+ETAG = '"anim-v1"'
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    hits = {"full": 0, "not_modified": 0}
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        if path == "/slow.json":
+            time.sleep(1.0)
+        if path in ("/anim.json", "/slow.json"):
+            if self.headers.get("If-None-Match") == ETAG:
+                StandInHandler.hits["not_modified"] += 1
+                self.send_response(304)
+                self.send_header("ETag", ETAG)
+                self.end_headers()
+                return
+            StandInHandler.hits["full"] += 1
+            body = json.dumps(ANIMATION).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", ETAG)
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        self.send_response(404)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def test_memory_cache_and_etag_revalidation(tmp_path):
+    server, base = start_server()
+    StandInHandler.hits = {"full": 0, "not_modified": 0}
+    try:
+        loader = AssetLoader(cache_dir=str(tmp_path), fallback_dir=None, max_age=60)
+        assert loader.load_json(f"{base}/anim.json") == ANIMATION
+        assert loader.load_json(f"{base}/anim.json") == ANIMATION
+        assert StandInHandler.hits == {"full": 1, "not_modified": 0}
+
+        # A fresh process only has the disk tier, so it revalidates with the stored ETag
+        cold_loader = AssetLoader(cache_dir=str(tmp_path), fallback_dir=None, max_age=60)
+        assert cold_loader.load_json(f"{base}/anim.json") == ANIMATION
+        assert StandInHandler.hits == {"full": 1, "not_modified": 1}
+    finally:
+        server.shutdown()
+
+
+def test_read_timeout_falls_back_to_bundled_animation(tmp_path):
+    server, base = start_server()
+    fallback_dir = tmp_path / "bundle"
+    fallback_dir.mkdir()
+    (fallback_dir / "career.json").write_text(json.dumps({"nm": "bundled"}))
+    try:
+        loader = AssetLoader(cache_dir=None, fallback_dir=str(fallback_dir), timeout=(1, 0.2))
+        started = time.perf_counter()
+        data = loader.load_json(f"{base}/slow.json", fallback="career")
+        assert time.perf_counter() - started < 0.9
+        assert data == {"nm": "bundled"}
+    finally:
+        server.shutdown()
+
+
+def test_offline_serves_stale_disk_cache(tmp_path):
+    server, base = start_server()
+    url = f"{base}/anim.json"
+    loader = AssetLoader(cache_dir=str(tmp_path), fallback_dir=None, max_age=0)
+    assert loader.load_json(url) == ANIMATION
+    server.shutdown()
+    server.server_close()
+
+    offline_loader = AssetLoader(cache_dir=str(tmp_path), fallback_dir=None, timeout=(0.2, 0.2))
+    assert offline_loader.load_json(url) == ANIMATION
+    assert offline_loader.load_json("http://127.0.0.1:9/missing.json") is None
+
+
+def test_lru_capacity_is_bounded(tmp_path):
+    server, base = start_server()
+    try:
+        loader = AssetLoader(cache_dir=None, fallback_dir=None, max_memory_items=2)
+        for name in ("a", "b", "c"):
+            loader.load_json(f"{base}/anim.json?{name}")
+        assert list(loader._memory) == [f"{base}/anim.json?b", f"{base}/anim.json?c"]
+    finally:
+        server.shutdown()
@@ -0,0 +1,57 @@
+"""
+Tests for the offline career discovery job and its materialized table
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmarks.generators import generate_profile_rows
+from career_discovery import get_discovery_table, run_discovery_job
+from ml_career_predictor import DynamicCareerPredictor
+
+
+def test_job_materializes_table_that_readers_index(tmp_path):
+    output = str(tmp_path / "paths.json")
+    profiles = generate_profile_rows(2000, seed=3, skill_count=300, career_count=15)
+    table = run_discovery_job(profiles, output, n_clusters=12, min_cluster_size=2)
+
+    with open(output, encoding="utf-8") as f:
+        assert json.load(f)["paths"] == table["paths"]
+    assert not os.path.exists(output + ".tmp")
+    assert table["profiles"] == 2000 and table["paths"]
+    for path in table["paths"]:
+        assert len(path["related_careers"]) >= 2
+        assert 0 < len(path["key_skills"]) <= 5
+        assert path["related_careers"][0] in profiles["career"].values
+
+    reader = get_discovery_table(output)
+    assert get_discovery_table(output) is reader
+    path = table["paths"][0]
+    assert reader.path_for_cluster(path["cluster_id"]) == path
+    assert path in reader.paths_for_career(path["related_careers"][-1])
+    assert reader.paths_for_career("Astronaut") == []
+
+    # Re-running the job is picked up without restarting readers
+    run_discovery_job(profiles, output, n_clusters=4, min_cluster_size=2)
+    os.utime(output, (reader.mtime + 5, reader.mtime + 5))
+    assert get_discovery_table(output) is not reader
+    assert get_discovery_table(str(tmp_path / "missing.json")).paths == []
+
+
+def test_predictor_reads_table_or_discovers_in_memory(tmp_path):
+    predictor = DynamicCareerPredictor(n_jobs=1)
+    with contextlib.redirect_stdout(io.StringIO()):
+        predictor.train_models()
+
+    in_memory = predictor.discover_new_career_paths(min_cluster_size=2, table_path=str(tmp_path / "none.json"))
+    assert in_memory and all(len(p["related_careers"]) >= 2 for p in in_memory)
+
+    output = str(tmp_path / "paths.json")
+    table = run_discovery_job(predictor.create_synthetic_dataset(), output, min_cluster_size=1)
+    assert predictor.discover_new_career_paths(min_cluster_size=1, table_path=output) == table["paths"]
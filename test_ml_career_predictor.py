@@ -0,0 +1,164 @@
+"""
+Tests for the sparse DynamicCareerPredictor training and prediction path
+"""
+
+import os
+import pickle
+import sys
+
+import numpy as np
+import pytest
+from scipy import sparse
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from ml_career_predictor import DynamicCareerPredictor
+from benchmarks.generators import generate_profile_rows
+
+
+def test_trains_sparse_float32_on_custom_data():
+    df = generate_profile_rows(400, seed=5, skill_count=300, career_count=12)
+    predictor = DynamicCareerPredictor()
+    predictor.train_models(df)
+
+    assert sparse.issparse(predictor.skill_embeddings)
+    assert predictor.skill_embeddings.dtype == np.float32
+
+    skills = df.iloc[0]["skills"].split(", ")
+    predictions = predictor.predict_dynamic_careers(skills, top_k=3)
+    assert len(predictions) == 3
+    # Neighbours come from the custom training rows, not the built-in dataset
+    assert set(p["career"] for p in predictions) <= set(df["career"])
+    assert df.iloc[0]["career"] in [p["career"] for p in predictions]
+
+
+def test_fast_path_agrees_with_full_ensemble():
+    df = generate_profile_rows(1200, seed=6, skill_count=300, career_count=12)
+    predictor = DynamicCareerPredictor()
+    predictor.train_models(df.iloc[:1000])
+    assert predictor.fast_model is not None
+
+    held_out = [skills.split(", ") for skills in df.iloc[1000:]["skills"]]
+    report = predictor.agreement_report(held_out, top_k=3)
+    assert report["samples"] == 200
+    assert report["top1_agreement"] >= 0.9
+    assert set(report["latency"]) == {"full", "fast"}
+
+    fast = predictor.predict_dynamic_careers(held_out[0], top_k=3, mode="fast")
+    full = predictor.predict_dynamic_careers(held_out[0], top_k=3, mode="full")
+    assert len(fast) == len(full) == 3
+
+
+def test_parallel_training_is_deterministic_and_reports_fits():
+    df = generate_profile_rows(600, seed=7, skill_count=300, career_count=12)
+    sequential = DynamicCareerPredictor(n_jobs=1)
+    sequential.train_models(df)
+    finished = []
+    parallel = DynamicCareerPredictor(n_jobs=4)
+    parallel.train_models(df, progress=lambda name, stats: finished.append(name))
+
+    assert sorted(finished) == sorted(parallel.training_report["models"])
+    assert {"random_forest", "kmeans", "nn_index", "fast_model"} <= set(finished)
+    assert all(stats["fit_s"] >= 0 for stats in parallel.training_report["models"].values())
+
+    for skills in df["skills"].head(20):
+        skills = skills.split(", ")
+        for mode in ("full", "fast"):
+            assert ([p["career"] for p in sequential.predict_dynamic_careers(skills, mode=mode)]
+                    == [p["career"] for p in parallel.predict_dynamic_careers(skills, mode=mode)])
+
+
+def test_skill_importance_is_career_specific():
+    predictor = DynamicCareerPredictor(n_jobs=1)
+    predictor.train_models()
+
+    game = predictor.get_skill_importance("Game Developer", top_k=5)
+    blockchain = predictor.get_skill_importance("Blockchain Developer", top_k=5)
+    assert len(game) == 5 and game != blockchain
+    assert "blockchain" in blockchain
+    assert list(game.values()) == sorted(game.values(), reverse=True)
+    # Beyond the precomputed top-k the full per-career vector is used
+    assert abs(sum(predictor.get_skill_importance("Game Developer", top_k=5000).values()) - 1) < 1e-4
+    assert predictor.get_skill_importance("Astronaut") == {}
+
+
+def test_explanations_are_deterministic_and_cached_per_skill_set():
+    predictor = DynamicCareerPredictor(n_jobs=1)
+    predictor.train_models()
+
+    skills = ["Unity", "C#", "3D Modeling"]
+    first = predictor.predict_dynamic_careers(skills, mode="full")
+    assert first[0]["career"] == "Game Developer"
+    assert first[0]["match_type"] == "Strong skill alignment"
+    assert "unity" in first[0]["contributing_skills"]
+    # Recomputed from scratch the explanations are identical
+    assert predictor.predict_dynamic_careers(skills, mode="full", use_cache=False) == first
+
+    # Order and spelling variants share the cache entry; callers get copies
+    first[0]["career"] = "mutated"
+    respelled = predictor.predict_dynamic_careers([" 3d modeling", "UNITY", "c#", "Unity"], mode="full")
+    assert respelled[0]["career"] == "Game Developer"
+    assert len(predictor._prediction_cache) == 1
+
+    # Careers sharing no skill features are explained as gaps
+    unrelated = predictor.predict_dynamic_careers(["Cooking"], mode="fast")
+    assert all(r["match_type"] == "Skill gap opportunity" and not r["contributing_skills"] for r in unrelated)
+
+    predictor.model_version += 1
+    predictor.predict_dynamic_careers(skills, mode="full")
+    assert len(predictor._prediction_cache) == 3
+
+
+def test_saved_model_keeps_training_profiles(tmp_path):
+    df = generate_profile_rows(300, seed=9, skill_count=200, career_count=8)
+    predictor = DynamicCareerPredictor(n_jobs=1)
+    predictor.train_models(df)
+    path = str(tmp_path / "model.pkl")
+    predictor.save_model(path)
+
+    loaded = DynamicCareerPredictor()
+    loaded.load_model(path)
+    assert loaded.discover_new_career_paths(min_cluster_size=1, table_path=str(tmp_path / "missing.json"))
+    assert loaded.distill_fast_model() is not None
+    loaded.career_importances = None
+    assert loaded.get_skill_importance(df.iloc[0]["career"])
+
+    # Pickles from before the profiles were stored fail with a clear message
+    with open(path, "rb") as f:
+        old = pickle.load(f)
+    del old["training_texts"], old["skill_embeddings"], old["career_importances"]
+    with open(path, "wb") as f:
+        pickle.dump(old, f)
+    stale = DynamicCareerPredictor()
+    stale.load_model(path)
+    with pytest.raises(ValueError, match="retrain"):
+        stale.distill_fast_model()
+    with pytest.raises(ValueError, match="retrain"):
+        stale.get_skill_importance(df.iloc[0]["career"])
+
+
+def test_old_format_pickle_asks_for_retraining(tmp_path):
+    df = generate_profile_rows(200, seed=4, skill_count=150, career_count=6)
+    predictor = DynamicCareerPredictor(n_jobs=1)
+    predictor.train_models(df)
+    predictor.model_version = 3
+    path = str(tmp_path / "model.pkl")
+    predictor.save_model(path)
+
+    loaded = DynamicCareerPredictor()
+    loaded.load_model(path)
+    assert loaded.model_version == 3
+    skills = df.iloc[0]["skills"].split(", ")
+    assert loaded.predict_dynamic_careers(skills, mode="full") == predictor.predict_dynamic_careers(skills, mode="full")
+
+    # The layout saved before this series: pca / nn_model, no index, labels or version
+    with open(path, "wb") as f:
+        pickle.dump({"tfidf_vectorizer": predictor.tfidf_vectorizer, "kmeans": predictor.kmeans,
+                     "pca": None, "nn_model": None, "rf_classifier": predictor.rf_classifier,
+                     "career_clusters": predictor.career_clusters, "career_names": predictor.career_names,
+                     "is_trained": True}, f)
+    stale = DynamicCareerPredictor()
+    with pytest.raises(ValueError, match="retrain required"):
+        stale.load_model(path)
+    assert not stale.is_trained
@@ -0,0 +1,107 @@
+"""
+Tests for online partial_fit updates and snapshot rollback
+"""
+
+import contextlib
+import io
+import os
+import sys
+import threading
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmarks.generators import generate_profile_rows
+from ml_career_predictor import DynamicCareerPredictor
+from online_learning import OnlineCareerLearner, record_event, register_learner, unregister_learner
+
+
+def _trained_predictor():
+    df = generate_profile_rows(900, seed=11, skill_count=300, career_count=10)
+    predictor = DynamicCareerPredictor(n_jobs=1)
+    with contextlib.redirect_stdout(io.StringIO()):
+        predictor.train_models(df.iloc[:600])
+    return predictor, df.iloc[600:]
+
+
+def test_feedback_updates_publish_versions_and_roll_back():
+    predictor, feedback = _trained_predictor()
+    original = predictor.fast_model
+    learner = register_learner(OnlineCareerLearner(predictor, batch_size=16, min_interval_s=0))
+    try:
+        skills = feedback.iloc[0]["skills"].split(", ")
+        stop = threading.Event()
+        served = []
+
+        def serve():
+            while not stop.is_set():
+                served.append(predictor.predict_dynamic_careers(skills, top_k=3, mode="fast"))
+
+        server = threading.Thread(target=serve)
+        server.start()
+        for i, row in enumerate(feedback.itertuples()):
+            record_event("accepted_prediction", f"user{i % 5}", {"skills": row.skills.split(", "), "career": row.career})
+        # Quiz results are labelled with the career that user accepted
+        record_event("quiz", "user0", {"skills_tested": skills, "percentage": 80.0})
+        record_event("quiz", "stranger", {"skills_tested": skills, "percentage": 80.0})
+        learner.flush()
+        stop.set()
+        server.join()
+    finally:
+        unregister_learner(learner)
+        learner.close()
+
+    assert all(len(result) == 3 for result in served)
+    assert learner.stats["skipped"] == 1
+    assert learner.stats["examples"] == len(feedback) + 1
+    # Bursts are coalesced, so there are fewer updates than full mini-batches
+    assert learner.stats["updates"] + learner.stats["rejected"] >= 1
+    assert predictor.fast_model is learner.current.model is not original
+    assert predictor.model_version == learner.current.version > 0
+    assert learner.current.metrics["holdout_agreement"] >= 0.8
+
+    parent = learner.current.parent
+    assert learner.rollback().version == parent
+    assert learner.rollback(0).model is original
+    assert predictor.fast_model is original and predictor.model_version == 0
+    assert len(learner.versions()) <= learner.max_snapshots
+
+
+def test_app_events_reach_the_learner_registered_at_startup(tmp_path, monkeypatch):
+    import warmup
+    from helpers_session import store_quiz_results, store_roadmap
+    from online_learning import SGDClassifier
+    from shared_artifacts import export_artifacts
+
+    predictor = DynamicCareerPredictor(n_jobs=1)
+    with contextlib.redirect_stdout(io.StringIO()):
+        predictor.train_models()
+    export_artifacts(predictor, str(tmp_path), question_bank_path=None)
+    monkeypatch.setenv("ASPIREPATH_ARTIFACTS", str(tmp_path))
+    monkeypatch.setattr(warmup, "_career_models", {})
+
+    fitted = []
+    partial_fit = SGDClassifier.partial_fit
+
+    def counting_partial_fit(self, X, y, classes=None, sample_weight=None):
+        if sample_weight is not None:
+            fitted.append(list(y))
+        return partial_fit(self, X, y, classes=classes, sample_weight=sample_weight)
+
+    monkeypatch.setattr(SGDClassifier, "partial_fit", counting_partial_fit)
+    warmup._warm_career_models()
+    learner = warmup.get_online_learner()
+    try:
+        assert learner is not None
+        # "Web Developer" is a taxonomy career the classifier was not trained on
+        assert learner.career_aliases["Web Developer"] in learner.classes
+        store_roadmap("learner@example.com", "Web Developer", ["Learn React"], skills=["HTML", "CSS", "React"])
+        store_quiz_results("learner@example.com", {"score": 4, "total": 5, "percentage": 80.0,
+                                                   "skills_tested": ["JavaScript", "React"]})
+        learner.flush()
+    finally:
+        unregister_learner(learner)
+        learner.close()
+
+    assert learner.stats["examples"] == 2 and learner.stats["skipped"] == 0
+    assert fitted and fitted[0][:2] == [learner.career_aliases["Web Developer"]] * 2
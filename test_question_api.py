@@ -0,0 +1,223 @@
+"""
+Tests for the remote question-bank client against a local HTTP stand-in server
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from question_api import CircuitBreaker, QuestionAPIClient, skill_set_key
+
+
+def _question(skill, number):
+    return {"id": f"remote-{skill.lower()}-{number}", "question": f"{skill} question {number}?",
+            "options": ["a", "b", "c", "d"], "answer": "a", "skill": skill}
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"   # keep-alive
+    mode = "ok"                     # ok | flaky | down | slow | null_skill | truncated
+    requests_seen = []
+    failures_left = 0
+    lock = threading.Lock()
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with StandInHandler.lock:
+            StandInHandler.requests_seen.append((tuple(body["skills"]), self.headers.get("Authorization"),
+                                                 time.monotonic()))
+            fail = StandInHandler.mode == "down" or (StandInHandler.mode == "flaky"
+                                                     and StandInHandler.failures_left > 0)
+            if StandInHandler.mode == "flaky" and fail:
+                StandInHandler.failures_left -= 1
+        if StandInHandler.mode == "slow":
+            time.sleep(0.3)
+        if fail:
+            self._send(503, {"error": "unavailable"})
+            return
+        if StandInHandler.mode == "truncated":
+            # Promise more body than is sent, then hang up (requests: ChunkedEncodingError)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", "1000")
+            self.end_headers()
+            self.wfile.write(b'{"questions": [')
+            self.close_connection = True
+            return
+        questions = [_question(skill, n) for skill in body["skills"] for n in range(3)]
+        if StandInHandler.mode == "null_skill":
+            for question in questions:
+                question["skill"] = None
+        questions.append({"id": "shared-1", "question": "Shared?", "options": ["x", "y"], "answer": "x",
+                          "skill": "General"})
+        questions.append({"question": "", "options": [], "answer": ""})   # malformed, dropped
+        self._send(200, {"questions": questions})
+
+    def _send(self, status, payload):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    StandInHandler.mode = "ok"
+    StandInHandler.requests_seen = []
+    StandInHandler.failures_left = 0
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/questions"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _client(url, **kwargs):
+    options = {"timeout": (1, 1), "retries": 2, "backoff_base": 0.01, "reset_timeout": 0.2}
+    options.update(kwargs)
+    return QuestionAPIClient(url, api_key="secret", **options)
+
+
+def test_skills_are_fetched_concurrently_merged_and_cached(server):
+    StandInHandler.mode = "slow"
+    client = _client(server)
+    started = time.perf_counter()
+    questions = client.fetch_questions(["Python", "SQL", "Docker", "python "])
+    elapsed = time.perf_counter() - started
+
+    assert len(StandInHandler.requests_seen) == 3          # "python " is the same skill set as "Python"
+    assert elapsed < 0.75                                   # three 0.3 s requests overlapped
+    assert all(auth == "Bearer secret" for _, auth, _ in StandInHandler.requests_seen)
+    ids = [q["id"] for q in questions]
+    assert len(ids) == len(set(ids)) == 3 * 3 + 1           # shared question kept once, malformed dropped
+
+    again = client.fetch_questions(["sql", "Python", "Docker"])
+    assert len(StandInHandler.requests_seen) == 3           # served from the cache
+    assert {q["id"] for q in again} == set(ids)
+    client.close()
+
+
+def test_transient_failures_are_retried_with_backoff(server):
+    StandInHandler.mode = "flaky"
+    StandInHandler.failures_left = 2
+    client = _client(server)
+
+    questions = client.fetch_skill_set(["Python"])
+
+    assert len(questions) == 4
+    assert len(StandInHandler.requests_seen) == 3
+    assert client.breaker.state == "closed" and client.breaker.failures == 0
+    client.close()
+
+
+def test_circuit_opens_serves_stale_cache_and_recovers(server):
+    client = _client(server, retries=0, failure_threshold=2, cache_ttl=0)
+    assert client.fetch_skill_set(["Python"])
+
+    StandInHandler.mode = "down"
+    assert client.fetch_skill_set(["Python"])               # failure 1: stale copy served
+    assert client.fetch_skill_set(["SQL"]) is None          # failure 2: opens the circuit
+    assert client.breaker.state == "open"
+    seen = len(StandInHandler.requests_seen)
+    assert client.fetch_skill_set(["SQL"]) is None
+    assert len(StandInHandler.requests_seen) == seen        # open circuit: no request sent
+
+    StandInHandler.mode = "ok"
+    time.sleep(0.25)
+    assert client.breaker.state == "half-open"
+    assert client.fetch_skill_set(["SQL"])
+    assert client.breaker.state == "closed"
+    client.close()
+
+
+def test_failure_threshold_counts_requests_not_attempts(server):
+    StandInHandler.mode = "down"
+    client = _client(server, retries=2, failure_threshold=3)
+
+    assert client.fetch_skill_set(["Python"]) is None
+    assert client.fetch_skill_set(["SQL"]) is None
+    assert client.breaker.failures == 2 and client.breaker.state == "closed"
+    assert len(StandInHandler.requests_seen) == 6           # 3 attempts per request
+    assert client.fetch_skill_set(["Docker"]) is None
+    assert client.breaker.state == "open"
+    client.close()
+
+
+def test_unexpected_error_on_half_open_trial_releases_it(server):
+    client = _client(server, retries=0, failure_threshold=1)
+    StandInHandler.mode = "down"
+    assert client.fetch_skill_set(["Python"]) is None
+    assert client.breaker.state == "open"
+
+    time.sleep(0.25)
+    StandInHandler.mode = "truncated"
+    assert client.fetch_skill_set(["Python"]) is None       # trial fails with ChunkedEncodingError
+    assert client.breaker.state == "open"
+
+    StandInHandler.mode = "ok"
+    time.sleep(0.25)
+    assert client.fetch_skill_set(["Python"])
+    assert client.breaker.state == "closed"
+    client.close()
+
+
+def test_half_open_failure_reopens_immediately():
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10, clock=lambda: now[0])
+    for _ in range(3):
+        breaker.record_failure()
+    assert not breaker.allow()
+    now[0] = 10
+    assert breaker.allow() and not breaker.allow()          # a single trial call
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+
+def test_unreachable_api_falls_back_to_the_local_bank():
+    from quiz_engine import fetch_questions_from_api
+
+    # Nothing listens on port 9 (discard); connection errors leave only local questions
+    questions = fetch_questions_from_api(["Python", "SQL"], api_url="http://127.0.0.1:9/questions", seed=3)
+    assert questions and all(not q["id"].startswith("remote-") for q in questions)
+
+
+def test_remote_questions_are_merged_with_the_local_bank(server):
+    from quiz_engine import fetch_questions_from_api
+
+    skills = ["Python", "SQL", "Kotlin"]
+    first = fetch_questions_from_api(skills, api_url=server, seed=11)
+    again = fetch_questions_from_api(skills, api_url=server, seed=11)
+
+    assert [q["id"] for q in first] == [q["id"] for q in again]
+    assert len(first) == 10
+    assert any(q["id"].startswith("remote-") for q in first)
+    assert any(not q["id"].startswith("remote-") and q["id"] != "shared-1" for q in first)
+    assert len(StandInHandler.requests_seen) == 3           # second quiz came from the cache
+
+
+def test_questions_with_a_null_skill_are_merged(server):
+    from quiz_engine import fetch_questions_from_api
+
+    StandInHandler.mode = "null_skill"
+    questions = fetch_questions_from_api(["Kotlin", "Rust"], api_url=server, seed=5)
+
+    remote = [q for q in questions if q["id"].startswith("remote-")]
+    assert len(remote) == 6 and all(q["skill"] == "" for q in remote)
+
+
+def test_skill_set_key_ignores_order_case_and_blanks():
+    assert skill_set_key(["SQL", " python", ""]) == skill_set_key(["Python", "sql", "SQL"]) == ("python", "sql")
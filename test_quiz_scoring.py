@@ -0,0 +1,62 @@
+"""
+Tests for vectorized quiz grading and the per-user skill mastery table
+"""
+
+import os
+import sys
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from quiz_scoring import MASTERY_ALPHA, GradingKey, SkillMastery
+
+QUESTIONS = [
+    {"id": "p1", "answer": "a", "skill": "Python"},
+    {"id": "p2", "answer": "b", "skill": "Python"},
+    {"id": "s1", "answer": ["x"], "skill": "SQL"},
+    {"id": "g1", "answer": "c"},
+]
+
+
+def test_grading_matches_per_question_comparison():
+    answers = {"p1": "a", "p2": "a", "s1": ["x"]}
+    result = GradingKey(QUESTIONS).grade(answers)
+
+    expected = [answers.get(q["id"]) == q["answer"] for q in QUESTIONS]
+    assert result["score"] == sum(expected) == 2
+    assert result["wrong"] == [i for i, ok in enumerate(expected) if not ok]
+    assert result["unanswered"] == [4] and result["answered"] == 3
+    assert result["per_skill"]["Python"] == {"correct": 1, "total": 2, "accuracy": 0.5}
+    assert result["per_skill"]["General"]["total"] == 1
+
+
+def test_mastery_updates_incrementally_with_recency_weighting():
+    mastery = SkillMastery(capacity=1)
+    mastery.update({"Python": {"correct": 1, "total": 2}})
+    mastery.update({"python": {"correct": 2, "total": 2}, "SQL": {"correct": 0, "total": 1}})
+
+    assert mastery.get("PYTHON") == (1 - MASTERY_ALPHA) * 0.5 + MASTERY_ALPHA * 1.0
+    assert mastery.as_dict()["Python"]["attempts"] == 4 and mastery.quizzes == 2
+    assert mastery.weakest() == ["SQL"]
+    assert mastery.weakest(threshold=1.0) == ["SQL", "Python"]
+    assert mastery.get("Go") is None
+
+
+def test_stored_quiz_feeds_roadmap_and_question_selection():
+    from core import generate_roadmap
+    from helpers_session import get_skill_mastery, store_quiz_results
+    from smart_quiz import load_smart_questions
+
+    store_quiz_results("mastery@example.com", {"score": 1, "total": 4, "percentage": 25.0,
+                                               "per_skill": {"SQL": {"correct": 0, "total": 2},
+                                                             "Python": {"correct": 1, "total": 2}}})
+    mastery = get_skill_mastery("mastery@example.com")
+    assert mastery.get("sql") == 0.0
+
+    roadmap, _ = generate_roadmap(["Python", "SQL", "Excel"], "Data Analyst", mastery=mastery)
+    assert any(step.startswith("Review SQL") for step in roadmap)
+
+    plain = load_smart_questions(["Python", "SQL"], max_questions=20, seed=1)
+    focused = load_smart_questions(["Python", "SQL"], max_questions=20, seed=1, mastery=mastery.lookup())
+    sql_score = {q["id"]: q["relevance_score"] for q in plain if q["skill"] == "SQL"}
+    assert all(q["relevance_score"] > sql_score[q["id"]] for q in focused if q["id"] in sql_score)
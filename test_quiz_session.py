@@ -0,0 +1,68 @@
+"""
+Tests for pinned quiz sessions and run_quiz's stable form identity
+"""
+
+import os
+import sys
+
+from streamlit.testing.v1 import AppTest
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from quiz_engine import QuizSession, quiz_session_id
+
+QUESTIONS = [
+    {"id": "q1", "question": "One?", "options": ["a", "b"], "answer": "a", "skill": "Python"},
+    {"id": "q2", "question": "Two?", "options": ["a", "b"], "answer": "b", "skill": "SQL"},
+]
+
+
+def test_quiz_id_is_deterministic_and_scoring_uses_pinned_list():
+    quiz = QuizSession("u@x.com", ["SQL", "Python"], QUESTIONS)
+
+    assert quiz.quiz_id == quiz_session_id("u@x.com", ["python", "sql"])
+    assert quiz.quiz_id != quiz_session_id("u@x.com", ["python", "sql"], attempt=1)
+    score, total, wrong = quiz.score({"q1": "a", "q2": "a"})
+    assert (score, total) == (1, 2)
+    assert wrong[0]["id"] == "q2" and wrong[0]["user_answer"] == "a"
+    assert "user_answer" not in QUESTIONS[1]
+
+
+def test_local_questions_without_ids_get_distinct_widget_keys(tmp_path):
+    import json
+    from records import get_question_bank
+
+    path = tmp_path / "bank.json"
+    path.write_text(json.dumps([{k: v for k, v in q.items() if k != "id"} for q in QUESTIONS]))
+    bank = get_question_bank(str(path))
+    quiz = QuizSession("u@x.com", ["Python", "SQL"], bank.as_dicts(range(len(bank))))
+
+    keys = [quiz.answer_key(q) for q in quiz.questions]
+    assert len(set(keys)) == 2 and all(q["id"] for q in quiz.questions)
+    assert bank.as_dicts([0])[0]["id"] == quiz.questions[0]["id"]   # stable across loads
+
+
+def _quiz_app():
+    import streamlit as st
+    from quiz_engine import run_quiz
+    result = run_quiz(["Python", "SQL"], num_qs=4, user_id="u@x.com")
+    st.session_state["result"] = result
+
+
+def test_run_quiz_keeps_form_and_questions_across_reruns():
+    app = AppTest.from_function(_quiz_app).run()
+    labels = [radio.label for radio in app.radio]
+    keys = [radio.key for radio in app.radio]
+    assert len(labels) == 4
+
+    app.run()
+    assert [radio.label for radio in app.radio] == labels
+    assert [radio.key for radio in app.radio] == keys
+
+    for radio in app.radio:
+        radio.set_value(radio.options[0])
+    app.button[0].click().run()
+    score, total, wrong = app.session_state["result"]
+    assert total == 4 and score + len(wrong) == 4
+    assert len(app.session_state["quiz_sessions"]) == 1
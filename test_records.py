@@ -0,0 +1,101 @@
+"""
+Tests for the frozen records and the columnar question bank
+"""
+
+import dataclasses
+import json
+import os
+import sys
+
+import pytest
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmarks.generators import generate_question_bank
+from records import AchievementRecord, Question, QuestionBank, get_question_bank
+
+
+def test_records_are_frozen_slotted_and_read_like_dicts():
+    raw = {"id": "python_1", "question": "Q?", "options": ["a", "b"], "answer": "a", "skill": "Python"}
+    question = Question.from_dict(raw)
+
+    assert not hasattr(question, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        question.skill = "SQL"
+    assert question["id"] == "python_1" and question.get("difficulty", "medium") == "medium"
+    assert question.as_dict() == raw
+    # Repeated fields share one interned string
+    other = Question.from_dict(dict(raw, id="python_2"))
+    assert other.skill is question.skill
+
+    achievement = AchievementRecord.from_dict({"user_id": "u", "skills": ["Python"], "time_spent": 2})
+    assert achievement.get("skills") == ("Python",) and achievement.get("missing", 0) == 0
+
+
+def test_unset_optional_fields_fall_back_to_the_callers_default():
+    # A quiz-generated achievement has no difficulty; the progress charts read it with a default
+    achievement = AchievementRecord.from_dict({"user_id": "u", "category": "Assessment", "quiz_score": 80.0})
+
+    assert achievement.get("difficulty", "Intermediate") == "Intermediate"
+    assert achievement.get("difficulty", "Unknown") == "Unknown" and achievement.get("difficulty") is None
+    assert achievement.get("quiz_score", 0) == 80.0 and achievement.get("time_spent", 1) == 0
+
+
+def test_bank_skill_mask_matches_per_question_check():
+    raw = generate_question_bank(500, seed=4)
+    bank = QuestionBank.from_dicts(raw)
+    skills = ["python", "sql", "react"]
+
+    expected = [any(s in q["skill"].lower() or q["skill"].lower() in s for s in skills) for q in raw]
+    assert bank.skill_mask(skills).tolist() == expected
+    assert bank.as_dicts([0, 1]) == raw[:2]
+
+
+def test_question_bank_is_cached_until_the_file_changes(tmp_path):
+    path = str(tmp_path / "bank.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(generate_question_bank(10, seed=1), f)
+    bank = get_question_bank(path)
+    assert get_question_bank(path) is bank
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(generate_question_bank(12, seed=2), f)
+    os.utime(path, (0, os.path.getmtime(path) + 5))
+    assert len(get_question_bank(path)) == 12
+
+
+def test_smart_questions_are_plain_dicts_with_scores():
+    from smart_quiz import load_smart_questions
+    questions = load_smart_questions(["Python", "SQL"], "Data Analyst", max_questions=5)
+
+    assert len(questions) == 5
+    assert all(isinstance(q, dict) and q["relevance_score"] >= 0 for q in questions)
+    assert len({q["id"] for q in questions}) == 5
+
+
+def test_career_rankings_select_what_full_bank_scoring_would(tmp_path):
+    import random
+    from benchmarks.generators import generate_skills
+    from skill_taxonomy import get_taxonomy
+    from smart_quiz import load_smart_questions
+
+    path = str(tmp_path / "bank.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(generate_question_bank(1500, seed=5), f)
+    bank = get_question_bank(path)
+    priorities = get_taxonomy().quiz_priorities
+
+    for seed in range(5):
+        skills = generate_skills(4, seed)
+        lower = [s.lower() for s in skills]
+        scores = (10 * bank.skill_mask(lower) + 5 * bank.skill_contains_mask(priorities["Data Analyst"])
+                  + 2 * bank.text_counts([s for s in lower if len(s) > 2]) + bank.difficulty_weights)
+        random.seed(seed)
+        selected = load_smart_questions(skills, "Data Analyst", path=path, max_questions=8)
+        by_id = {q.id: i for i, q in enumerate(bank.questions)}
+        picked = sorted(scores[by_id[q["id"]]] for q in selected)
+        # The best-scoring question is always picked and every score is the full-bank score
+        assert max(picked) == scores.max()
+        assert all(abs(q["relevance_score"] - scores[by_id[q["id"]]]) < 1e-6 for q in selected)
+    assert "Data Analyst" in bank.career_rankings
@@ -0,0 +1,77 @@
+"""
+Tests for the headless scoring service over a local keep-alive HTTP connection
+"""
+
+import http.client
+import json
+import os
+import sys
+import threading
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import scoring_service
+from core import get_career_matches, generate_roadmap
+
+
+def _post(conn, path, body):
+    conn.request("POST", path, body=json.dumps(body), headers={"Content-Type": "application/json"})
+    response = conn.getresponse()
+    return response.status, json.loads(response.read())
+
+
+def test_endpoints_match_engines_over_keep_alive():
+    scoring_service.warm_up()
+    server = scoring_service.create_server(port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=10)
+
+        conn.request("GET", "/health")
+        health = conn.getresponse()
+        assert health.status == 200 and json.loads(health.read())["ready"] is True
+
+        skills = ["Python", "SQL", "Statistics"]
+        status, payload = _post(conn, "/get_career_matches", {"skills": skills})
+        assert status == 200
+        assert payload["matches"] == get_career_matches(skills)
+
+        status, payload = _post(conn, "/generate_roadmap", {"skills": skills, "goal": "Data Analyst"})
+        roadmap, required = generate_roadmap(skills, "Data Analyst")
+        assert status == 200
+        assert sorted(payload["roadmap"]) == sorted(roadmap) and payload["required"] == required
+
+        status, payload = _post(conn, "/predict_career_enhanced", {"batch": [{"skills": skills}, {"skills": []}]})
+        assert status == 200
+        assert payload["results"][1]["primary_career"] == "Generalist"
+
+        status, payload = _post(conn, "/assess_skills", {"text": "Worked with Python and SQL"})
+        assert status == 200 and {"Python", "SQL"} <= set(payload["skills"])
+
+        status, payload = _post(conn, "/load_smart_questions", {"skills": ["Python"], "max_questions": 3})
+        assert status == 200 and len(payload["questions"]) == 3
+
+        status, payload = _post(conn, "/generate_roadmap", {"skills": "Python"})
+        assert status == 400
+
+        status, payload = _post(conn, "/unknown", {})
+        assert status == 404
+        conn.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_failing_batch_item_keeps_the_other_results(monkeypatch):
+    def flaky(body):
+        if body.get("explode"):
+            raise KeyError("boom")
+        return {"ok": body["n"]}
+
+    monkeypatch.setitem(scoring_service.ENDPOINTS, "/flaky", flaky)
+    status, payload = scoring_service.handle_request("/flaky", {"batch": [{"n": 1}, {"explode": True}, {"n": 3}]})
+
+    assert status == 200
+    assert payload["results"] == [{"ok": 1}, {"error": "Internal error"}, {"ok": 3}]
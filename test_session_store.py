@@ -0,0 +1,64 @@
+"""
+Tests for the bounded session collections and the session memory report
+"""
+
+import io
+import os
+import sys
+
+import streamlit as st
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from session_store import SESSION_CAPACITIES, BoundedLog, QuizRecord, bounded
+
+
+def test_bounded_log_evicts_oldest_and_counts_drops():
+    log = BoundedLog(3, "demo", range(5))
+
+    assert list(log) == [2, 3, 4]
+    assert log.latest() == 4 and log.dropped == 2
+    report = log.memory_report()
+    assert report["entries"] == 3 and report["capacity"] == 3 and report["bytes"] > 0
+
+
+def test_plain_lists_are_converted_with_configured_capacity():
+    log = bounded([{"x": 1}], "progress")
+
+    assert isinstance(log, BoundedLog) and log.capacity == SESSION_CAPACITIES["progress"]
+    assert bounded(log, "progress") is log
+
+
+def test_quiz_record_keeps_question_ids_not_payloads():
+    wrong = [{"id": 7, "question": "Q" * 500, "options": ["a", "b"], "answer": "a"},
+             {"question": "no id", "options": [], "answer": "b"}]
+    record = QuizRecord.from_results("u", "t", "d", {"score": 3, "total": 5, "percentage": 60.0,
+                                                     "skills_tested": ["Python"], "wrong": wrong})
+
+    assert record.wrong_question_ids[0] == "7" and len(record.wrong_question_ids) == 2
+    assert record.wrong_answers == 2
+    assert record.as_dict()["skills_tested"] == ["Python"]
+
+
+def test_session_history_stays_bounded_and_is_reported():
+    from helpers_session import get_session_stats, init_session_state_db, parse_resume, store_quiz_results
+
+    st.session_state.resumes = []
+    st.session_state.quiz_results = []
+    init_session_state_db()
+    for _ in range(3):  # reruns re-parse the same upload
+        upload = io.BytesIO(("Python SQL " * 5000).encode("utf-8"))
+        upload.name = "resume.txt"
+        parse_resume(upload)
+    for i in range(SESSION_CAPACITIES["quiz_results"] + 10):
+        store_quiz_results("u", {"score": 1, "total": 2, "percentage": 50.0, "wrong_answers": 1})
+
+    stats = get_session_stats()
+    assert stats["total_resumes"] == 1
+    assert stats["total_quiz_results"] == SESSION_CAPACITIES["quiz_results"]
+    assert stats["memory"]["quiz_results"]["dropped"] == 10
+    # The resume is referenced by hash, not stored: far below the 55 KB of text
+    assert stats["memory"]["resumes"]["bytes"] < 2000
+    assert stats["memory"]["total_bytes"] == sum(
+        entry["bytes"] for name, entry in stats["memory"].items() if name != "total_bytes")
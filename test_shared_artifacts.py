@@ -0,0 +1,53 @@
+"""
+Tests for the memory-mapped model artifacts and question index
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+
+import numpy as np
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmarks.generators import generate_profile_rows
+from ml_career_predictor import DynamicCareerPredictor
+from shared_artifacts import QuestionIndex, export_artifacts, load_predictor
+
+
+def test_mapped_predictor_matches_trained_predictor(tmp_path):
+    df = generate_profile_rows(1500, seed=8, skill_count=300, career_count=12)
+    predictor = DynamicCareerPredictor(n_jobs=1)
+    with contextlib.redirect_stdout(io.StringIO()):
+        predictor.train_models(df)
+    shared = load_predictor(export_artifacts(predictor, str(tmp_path)))
+
+    assert isinstance(shared.career_importances, np.memmap)
+    X = predictor.tfidf_vectorizer.transform(df["skills"][:200])
+    assert abs(shared.tfidf_vectorizer.transform(df["skills"][:200]) - X).max() < 1e-6
+    assert np.allclose(shared.rf_classifier.predict_proba(X), predictor.rf_classifier.predict_proba(X))
+    assert np.allclose(shared.fast_model.predict_proba(X), predictor.fast_model.predict_proba(X), atol=1e-5)
+
+    for skills in df["skills"][:50]:
+        skills = skills.split(", ")
+        for mode in ("full", "fast"):
+            assert (shared.predict_dynamic_careers(skills, mode=mode)
+                    == predictor.predict_dynamic_careers(skills, mode=mode))
+    career = predictor.career_names[0]
+    assert shared.get_skill_importance(career) == predictor.get_skill_importance(career)
+
+
+def test_question_index_reads_single_questions(tmp_path):
+    with open("real_mcq_bank.json", encoding="utf-8") as f:
+        bank = json.load(f)
+    QuestionIndex.export(bank, str(tmp_path))
+    index = QuestionIndex.load(str(tmp_path))
+
+    assert len(index) == len(bank)
+    assert index.get(len(bank) - 1) == bank[-1]
+    python = [q for q in bank if q["skill"].lower() == "python"]
+    assert index.questions_for_skills(["python", " Python "]) == python
+    assert index.questions_for_skills(["Underwater Basket Weaving"]) == []
@@ -0,0 +1,76 @@
+"""
+Tests for skill alias normalization and whole-word skill matching
+"""
+
+import os
+import sys
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from skill_normalizer import canonical_skill, normalize_skills
+from core import assess_skills, get_career_matches, predict_career
+from benchmarks.skill_eval import evaluate, load_sample
+
+
+def test_canonical_skill_resolves_aliases_and_spelling():
+    assert canonical_skill("PowerBI") == "Power BI"
+    assert canonical_skill(" power-bi ") == "Power BI"
+    assert canonical_skill("ML") == "Machine Learning"
+    assert canonical_skill("js") == "JavaScript"
+    assert canonical_skill("node.js") == "Node.js"
+    assert canonical_skill("C#") == "C#"
+    assert canonical_skill("Rust") is None
+    assert normalize_skills(["ML", "Machine Learning", " Rust  Lang "]) == ["machine learning", "rust lang"]
+
+
+def test_aliases_score_like_canonical_names():
+    assert get_career_matches(["PowerBI", "JS"]) == get_career_matches(["Power BI", "JavaScript"])
+    assert predict_career(["ml", "sklearn", "pandas", "numpy"]) == "ML Engineer"
+
+
+def test_short_skills_match_whole_words_only():
+    # "r" used to partially match every skill containing the letter
+    matches = get_career_matches(["R"])
+    assert matches["Data Analyst"] > 0
+    assert matches["Web Developer"] == matches["Game Developer"] == 0
+
+    found = assess_skills("Built JavaScript dashboards with a small r&d team.")
+    assert "JavaScript" in found
+    assert "Java" not in found and "R" not in found
+
+
+def test_word_and_acronym_aliases_need_exact_case_in_prose():
+    found = assess_skills("Worked with Ann on network node design, torch relay, used Excel and R. Java and JavaScript.")
+    assert sorted(found) == ["Excel", "Java", "JavaScript", "R"]
+    assert set(assess_skills("Trained an ANN in Torch on Node services.")) == {"Neural Networks", "PyTorch", "Node.js"}
+    # Skill lists still resolve them regardless of case
+    assert canonical_skill("node") == "Node.js" and canonical_skill("ann") == "Neural Networks"
+    # Related tools are not synonyms
+    assert canonical_skill("Keras") is None and canonical_skill("OpenGL") is None
+    assert canonical_skill("Image Processing") is None
+
+
+def test_extraction_quality_on_labelled_sample():
+    result = evaluate(assess_skills, load_sample())
+    assert result["precision"] >= 0.95
+    assert result["recall"] >= 0.95
+
+
+def test_index_counts_match_pairwise_counts():
+    from benchmarks.generators import generate_taxonomy, sample_taxonomy_skills
+    from skill_normalizer import SkillIndex, count_matches, word_ngrams
+    from skill_taxonomy import CompiledTaxonomy
+
+    source = generate_taxonomy(2000, 120, seed=3)
+    index = SkillIndex(CompiledTaxonomy(source))
+    skills = normalize_skills(sample_taxonomy_skills(source, 60, seed=3))
+    taxonomy = index.taxonomy
+
+    exact_counts, partial_counts = index.match_counts(skills)
+    for position, career in enumerate(taxonomy.career_names):
+        required = taxonomy.career_skill_lower[career]
+        ngrams = {ngram for skill in required for ngram in word_ngrams(skill)}
+        expected = count_matches(skills, taxonomy.career_skill_sets[career], ngrams)
+        assert (exact_counts[position], partial_counts[position]) == expected
+    assert sum(partial_counts) > 0
@@ -0,0 +1,51 @@
+"""
+Tests for the compiled skill taxonomy and its hot reload
+"""
+
+import json
+import os
+import sys
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import skill_taxonomy
+from config import SKILL_TEMPLATES
+from core import CAREER_SKILLS
+
+
+def test_engines_share_one_taxonomy():
+    taxonomy = skill_taxonomy.get_taxonomy()
+    assert list(SKILL_TEMPLATES) == list(taxonomy.career_names)
+    assert SKILL_TEMPLATES["Data Analyst"][:6] == ["Excel", "SQL", "Python", "Tableau", "Statistics", "Power BI"]
+    assert CAREER_SKILLS["Data Analyst"] == ", ".join(SKILL_TEMPLATES["Data Analyst"])
+    assert taxonomy.quiz_priorities["Data Analyst"][0] == "sql"
+
+    ids = taxonomy.career_skill_ids["Data Analyst"]
+    assert ids.dtype.name == "int32" and not ids.flags.writeable
+    assert taxonomy.skill_names[ids[5]] == "Power BI"
+    assert taxonomy.alias_index["powerbi"] == ids[5]
+
+
+def test_hot_reload_swaps_taxonomy_and_keeps_last_good(tmp_path):
+    original = skill_taxonomy.get_taxonomy()
+    with open(original.path, "r", encoding="utf-8") as f:
+        source = json.load(f)
+    source["careers"]["Data Analyst"]["skills"]["machine_learning"] = 1.0
+    path = tmp_path / "taxonomy.json"
+    path.write_text(json.dumps(source), encoding="utf-8")
+
+    try:
+        assert skill_taxonomy.reload_taxonomy(str(path))
+        assert "Machine Learning" in SKILL_TEMPLATES["Data Analyst"]
+        assert CAREER_SKILLS["Data Analyst"].endswith("Machine Learning")
+        # Unchanged mtime: nothing to do
+        assert not skill_taxonomy.reload_taxonomy()
+
+        # A broken edit keeps serving the last good taxonomy
+        path.write_text("{not json", encoding="utf-8")
+        assert not skill_taxonomy.reload_taxonomy(force=True)
+        assert "Machine Learning" in skill_taxonomy.get_taxonomy().career_skill_lists["Data Analyst"]
+    finally:
+        skill_taxonomy.reload_taxonomy(original.path, force=True)
+    assert "Machine Learning" not in SKILL_TEMPLATES["Data Analyst"]
@@ -0,0 +1,57 @@
+"""
+Tests for hot-path span recording and the Prometheus / JSON-lines exporters
+"""
+
+import json
+import os
+import sys
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import tracing
+
+
+def test_spans_record_counts_and_export():
+    tracing.reset_traces()
+    tracing.enable_tracing()
+    try:
+        @tracing.traced("unit_work")
+        def work(n):
+            return sum(range(n))
+
+        tracing.set_correlation_id("session-abc")
+        work(1000)
+        work(1000)
+        with tracing.span("block"):
+            pass
+
+        summary = tracing.get_span_summary()
+        assert summary["unit_work"]["count"] == 2
+        assert summary["block"]["count"] == 1
+
+        records = [json.loads(line) for line in tracing.export_jsonl().splitlines()]
+        assert [r["span"] for r in records] == ["unit_work", "unit_work", "block"]
+        assert all(r["correlation_id"] == "session-abc" for r in records)
+
+        prometheus = tracing.export_prometheus()
+        assert 'aspirepath_span_calls_total{span="unit_work"} 2' in prometheus
+        assert "# TYPE aspirepath_span_wall_seconds_total counter" in prometheus
+    finally:
+        tracing.disable_tracing()
+        tracing.reset_traces()
+
+
+def test_disabled_tracing_records_nothing():
+    tracing.reset_traces()
+    tracing.disable_tracing()
+
+    @tracing.traced()
+    def work():
+        return 42
+
+    assert work() == 42
+    with tracing.span("ignored"):
+        pass
+    assert tracing.get_recent_spans() == []
+    assert tracing.get_span_summary() == {}
@@ -0,0 +1,72 @@
+"""
+Tests for the startup warm-up routine and the readiness gate
+"""
+
+import json
+import os
+import sys
+import threading
+import urllib.error
+import urllib.request
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import warmup
+
+
+def _get(url):
+    try:
+        with urllib.request.urlopen(url, timeout=5) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_warm_up_times_every_step_and_sets_ready():
+    calls = []
+    report = warmup.warm_up([("one", lambda: calls.append(1)), ("two", lambda: calls.append(2))], rounds=3)
+
+    assert calls == [1, 1, 1, 2, 2, 2]
+    assert report["ready"] and warmup.is_ready()
+    assert set(report["steps"]) == {"one", "two"}
+    assert all(step["error"] is None and step["steady_ms"] is not None for step in report["steps"].values())
+
+
+def test_failing_step_keeps_process_not_ready():
+    def broken():
+        raise RuntimeError("model file missing")
+
+    report = warmup.warm_up([("ok", lambda: None), ("broken", broken)])
+
+    assert not report["ready"] and not warmup.is_ready()
+    assert report["steps"]["broken"]["error"] == "RuntimeError: model file missing"
+    assert report["steps"]["ok"]["error"] is None
+
+
+def test_readiness_endpoint_flips_from_503_to_200():
+    release = threading.Event()
+    server = warmup.serve_readiness("127.0.0.1", 0)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        thread = threading.Thread(target=warmup.warm_up, args=([("slow", lambda: release.wait(5))],))
+        thread.start()
+        status, report = _get(base + "/ready")
+        assert status == 503 and not report["ready"]
+        assert _get(base + "/live")[0] == 200
+
+        release.set()
+        thread.join(5)
+        status, report = _get(base + "/ready")
+        assert status == 200 and report["ready"]
+        assert "slow" in report["steps"]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_default_steps_warm_every_engine():
+    report = warmup.warm_up(rounds=1)
+
+    assert report["ready"], report
+    assert {"taxonomy", "core", "prediction", "questions", "assets"} <= set(report["steps"])
@@ -0,0 +1,206 @@
+"""
+Hot-Path Timing Instrumentation for AspirePath
+Lightweight spans (decorator or context manager) that record wall/CPU time into an
+in-process ring buffer, with Prometheus text and JSON-lines exporters.
+
+Tracing is off unless ASPIREPATH_TRACING=1 or enable_tracing() is called; when off,
+a traced call costs one flag check.
+"""
+
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+DEFAULT_BUFFER_SIZE = 2048
+
+_correlation_id = contextvars.ContextVar("aspirepath_correlation_id", default=None)
+
+
+class _TraceState:
+    """Module-wide tracing switch, ring buffer and per-span aggregates"""
+
+    def __init__(self):
+        self.enabled = os.environ.get("ASPIREPATH_TRACING", "").lower() in ("1", "true", "yes")
+        self.buffer = deque(maxlen=DEFAULT_BUFFER_SIZE)
+        self.totals = {}
+        self.lock = threading.Lock()
+
+
+_state = _TraceState()
+
+
+def enable_tracing(buffer_size=None):
+    """Turn tracing on (optionally resizing the ring buffer)"""
+    if buffer_size is not None:
+        _state.buffer = deque(_state.buffer, maxlen=buffer_size)
+    _state.enabled = True
+
+
+def disable_tracing():
+    """Turn tracing off; recorded spans are kept until reset_traces()"""
+    _state.enabled = False
+
+
+def is_tracing_enabled():
+    return _state.enabled
+
+
+def reset_traces():
+    """Clear the ring buffer and aggregate counters"""
+    with _state.lock:
+        _state.buffer.clear()
+        _state.totals.clear()
+
+
+def set_correlation_id(correlation_id):
+    """Tag spans recorded in the current context (e.g. a Streamlit session)"""
+    _correlation_id.set(correlation_id)
+
+
+def get_correlation_id():
+    return _correlation_id.get()
+
+
+def _record(name, wall, cpu, failed):
+    _state.buffer.append({
+        "span": name,
+        "ts": time.time(),
+        "wall_ms": round(wall * 1000, 4),
+        "cpu_ms": round(cpu * 1000, 4),
+        "error": failed,
+        "correlation_id": _correlation_id.get()
+    })
+    with _state.lock:
+        totals = _state.totals.get(name)
+        if totals is None:
+            totals = _state.totals[name] = [0, 0.0, 0.0, 0]
+        totals[0] += 1
+        totals[1] += wall
+        totals[2] += cpu
+        totals[3] += failed
+
+
+class _Span:
+    __slots__ = ("name", "_wall", "_cpu")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self._wall = time.perf_counter()
+        self._cpu = time.thread_time()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _record(self.name, time.perf_counter() - self._wall,
+                time.thread_time() - self._cpu, exc_type is not None)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name):
+    """
+    Context manager timing a block of code.
+
+    Example:
+        with span("page:Career Roadmap"):
+            render_page()
+    """
+    if not _state.enabled:
+        return _NULL_SPAN
+    return _Span(name)
+
+
+def begin_span(name):
+    """Start a span that is closed later with end_span() (for code that can't be indented)"""
+    if not _state.enabled:
+        return None
+    return _Span(name).__enter__()
+
+
+def end_span(active_span):
+    if active_span is not None:
+        active_span.__exit__(None, None, None)
+
+
+def traced(name=None):
+    """Decorator timing every call of the wrapped function"""
+    def decorator(func):
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _state.enabled:
+                return func(*args, **kwargs)
+            with _Span(span_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+    return decorator
+
+
+def get_recent_spans(limit=None):
+    """Return the most recent span records (newest last)"""
+    records = list(_state.buffer)
+    return records[-limit:] if limit else records
+
+
+def get_span_summary():
+    """Aggregate count, total and mean wall/CPU time per span name"""
+    with _state.lock:
+        items = [(name, list(values)) for name, values in _state.totals.items()]
+    return {
+        name: {
+            "count": count,
+            "wall_ms_total": round(wall * 1000, 4),
+            "cpu_ms_total": round(cpu * 1000, 4),
+            "wall_ms_mean": round(wall * 1000 / count, 4) if count else 0,
+            "errors": errors
+        }
+        for name, (count, wall, cpu, errors) in items
+    }
+
+
+def _escape_label(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def export_prometheus():
+    """Render aggregate span metrics in the Prometheus text exposition format"""
+    with _state.lock:
+        items = sorted((name, list(values)) for name, values in _state.totals.items())
+
+    metrics = [
+        ("aspirepath_span_calls_total", "Number of completed spans", 0),
+        ("aspirepath_span_wall_seconds_total", "Wall-clock time spent in spans", 1),
+        ("aspirepath_span_cpu_seconds_total", "Thread CPU time spent in spans", 2),
+        ("aspirepath_span_errors_total", "Spans that exited with an exception", 3),
+    ]
+    lines = []
+    for metric, help_text, index in metrics:
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} counter")
+        for name, values in items:
+            lines.append(f'{metric}{{span="{_escape_label(name)}"}} {values[index]}')
+    return "\n".join(lines) + "\n"
+
+
+def export_jsonl(limit=None):
+    """Render buffered span records as JSON lines"""
+    return "".join(json.dumps(record) + "\n" for record in get_recent_spans(limit))
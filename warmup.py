@@ -0,0 +1,251 @@
+"""
+Startup Warm-up and Readiness for AspirePath
+Loads and exercises every engine once at process start (taxonomy matcher, the
+Mongo probe in core, TF-IDF prediction, question bank, asset cache and, when
+configured, the shared career models and their online learner) so the first
+user request costs the same as any later one. A readiness flag - optionally served over HTTP for a load
+balancer - turns true only when every step has succeeded.
+
+    python warmup.py --readiness-port 8502 -- --server.port 8501
+
+warms up, serves GET /ready (503 while warming, 200 after) and then runs
+`streamlit run app.py` *in this process*, so the app starts on warm imports.
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(BASE_DIR)
+
+SAMPLE_SKILLS = ["Python", "SQL", "Machine Learning", "Data Analysis", "PowerBI"]
+SAMPLE_RESUME = ("Data analyst with 3 years of Python, SQL and PowerBI experience; built ML "
+                 "pipelines with scikit-learn and dashboards in Tableau. Git, Docker, AWS.")
+SAMPLE_CAREER = "Data Analyst"
+
+# Runs per step: the first pays the cold cost, the last shows steady state
+WARMUP_ROUNDS = 2
+
+
+def _warm_taxonomy():
+    from skill_normalizer import canonical_skill, extract_skill_ids, get_skill_index, normalize_skills
+    get_skill_index()
+    canonical_skill("PowerBI")
+    normalize_skills(SAMPLE_SKILLS)
+    extract_skill_ids(SAMPLE_RESUME)
+
+
+def _warm_core():
+    # Importing core runs the (optional) MongoDB probe
+    from core import assess_skills, generate_roadmap, get_career_matches, predict_career
+    assess_skills(SAMPLE_RESUME)
+    predict_career(SAMPLE_SKILLS)
+    get_career_matches(SAMPLE_SKILLS)
+    generate_roadmap(SAMPLE_SKILLS, SAMPLE_CAREER)
+
+
+def _warm_prediction():
+    from enhanced_prediction import predict_career_enhanced
+    predict_career_enhanced(SAMPLE_SKILLS)
+
+
+def _warm_questions():
+    from quiz_engine import load_questions
+    from smart_quiz import load_smart_questions
+    load_questions(SAMPLE_SKILLS)
+    load_smart_questions(SAMPLE_SKILLS, SAMPLE_CAREER)
+
+
+def _warm_assets():
+    from asset_loader import get_asset_loader
+    loader = get_asset_loader()
+    if loader.fallback_dir and os.path.isdir(loader.fallback_dir):
+        for file_name in sorted(os.listdir(loader.fallback_dir)):
+            if file_name.endswith(".json"):
+                loader.load_fallback(file_name[:-5])
+    # Remote animations worth having in the cache before the first page render
+    for url in filter(None, os.environ.get("ASPIREPATH_WARMUP_ASSETS", "").split(",")):
+        loader.load_json(url.strip())
+
+
+_career_models = {}
+
+
+def _warm_career_models():
+    # Only when the shared career-model artifacts are deployed (see shared_artifacts.py)
+    directory = os.environ.get("ASPIREPATH_ARTIFACTS")
+    if not directory:
+        return
+    from shared_artifacts import QuestionIndex, load_predictor
+    if "predictor" not in _career_models:
+        _career_models["predictor"] = load_predictor(directory)
+    predictor = _career_models["predictor"]
+    for mode in ("fast", "full"):
+        predictor.predict_dynamic_careers(SAMPLE_SKILLS, mode=mode, use_cache=False)
+    if os.path.exists(os.path.join(directory, "questions_offsets.npy")):
+        QuestionIndex.load(directory).questions_for_skills(SAMPLE_SKILLS)
+    _start_online_learning(predictor)
+
+
+def _start_online_learning(predictor):
+    # Stored roadmaps, quiz results and achievements (helpers_session.record_event)
+    # train the shared predictor's fast model from here on
+    if "learner" in _career_models or not len(predictor.training_texts):
+        return
+    from online_learning import OnlineCareerLearner, register_learner
+    _career_models["learner"] = register_learner(OnlineCareerLearner(predictor))
+
+
+def get_career_models():
+    """The shared career predictor loaded during warm-up (None unless ASPIREPATH_ARTIFACTS is set)"""
+    return _career_models.get("predictor")
+
+
+def get_online_learner():
+    """The online learner registered on the shared predictor (None without career models)"""
+    return _career_models.get("learner")
+
+
+WARMUP_STEPS = [
+    ("taxonomy", _warm_taxonomy),
+    ("core", _warm_core),
+    ("prediction", _warm_prediction),
+    ("questions", _warm_questions),
+    ("assets", _warm_assets),
+    ("career_models", _warm_career_models),
+]
+
+_state = {"ready": False, "warming": False, "started_at": None, "elapsed_s": None, "steps": {}}
+_state_lock = threading.Lock()
+
+
+def warm_up(steps=None, rounds=WARMUP_ROUNDS):
+    """
+    Run every warm-up step `rounds` times and update the readiness state.
+
+    Args:
+        steps (list): (name, callable) pairs; defaults to WARMUP_STEPS
+        rounds (int): Runs per step
+
+    Returns:
+        dict: Readiness report (see readiness_report)
+    """
+    steps = WARMUP_STEPS if steps is None else steps
+    with _state_lock:
+        _state.update(ready=False, warming=True, started_at=time.time(), elapsed_s=None, steps={})
+    started = time.perf_counter()
+    failed = False
+    for name, step in steps:
+        timings = []
+        error = None
+        for _ in range(max(1, rounds)):
+            step_started = time.perf_counter()
+            try:
+                step()
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+                print(f"Warm-up step {name} failed: {error}")
+                break
+            timings.append(round((time.perf_counter() - step_started) * 1000, 2))
+        failed = failed or error is not None
+        with _state_lock:
+            _state["steps"][name] = {
+                "first_ms": timings[0] if timings else None,
+                "steady_ms": timings[-1] if timings else None,
+                "error": error,
+            }
+    with _state_lock:
+        _state.update(ready=not failed, warming=False, elapsed_s=round(time.perf_counter() - started, 3))
+    return readiness_report()
+
+
+_background = {}
+
+
+def start_warm_up(steps=None):
+    """Warm up on a daemon thread, once per process; returns the thread (None if already warm)"""
+    with _state_lock:
+        thread = _background.get("thread")
+        if thread is None and not (_state["ready"] or _state["warming"]):
+            thread = threading.Thread(target=warm_up, args=(steps,), name="aspirepath-warmup", daemon=True)
+            _background["thread"] = thread
+            thread.start()
+    return thread
+
+
+def is_ready():
+    """True once every warm-up step has run successfully"""
+    return _state["ready"]
+
+
+def readiness_report():
+    """Copy of the readiness state: ready flag, total time and per-step first/steady timings"""
+    with _state_lock:
+        return dict(_state, steps={name: dict(step) for name, step in _state["steps"].items()})
+
+
+class ReadinessHandler(BaseHTTPRequestHandler):
+    server_version = "AspirePathReadiness/1.0"
+
+    def do_GET(self):
+        if self.path == "/ready":
+            report = readiness_report()
+            self._send_json(200 if report["ready"] else 503, report)
+        elif self.path == "/live":
+            self._send_json(200, {"alive": True, "pid": os.getpid()})
+        else:
+            self._send_json(404, {"error": f"Unknown endpoint: {self.path}"})
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve_readiness(host="0.0.0.0", port=8502):
+    """Serve /ready and /live on a daemon thread; returns the server (port 0 picks a free port)"""
+    server = ThreadingHTTPServer((host, port), ReadinessHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="aspirepath-readiness", daemon=True).start()
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Warm AspirePath up, then run the Streamlit app in-process")
+    parser.add_argument("--readiness-port", type=int, default=None,
+                        help="Serve GET /ready and /live on this port for the load balancer")
+    parser.add_argument("--no-app", action="store_true", help="Only warm up and print the report")
+    args, streamlit_args = parser.parse_known_args(argv)
+    if streamlit_args[:1] == ["--"]:
+        streamlit_args = streamlit_args[1:]
+
+    if args.readiness_port is not None:
+        serve_readiness(port=args.readiness_port)
+    report = warm_up()
+    for name, step in report["steps"].items():
+        status = step["error"] or f"first {step['first_ms']} ms, steady {step['steady_ms']} ms"
+        print(f"   🔥 {name}: {status}")
+    print(f"{'✅ Ready' if report['ready'] else '❌ Not ready'} after {report['elapsed_s']:.2f}s")
+    if args.no_app:
+        return 0 if report["ready"] else 1
+
+    from streamlit.web import cli
+    sys.argv = ["streamlit", "run", os.path.join(BASE_DIR, "app.py")] + streamlit_args
+    return cli.main()
+
+
+if __name__ == "__main__":
+    # Run through the importable module so app.py (`from warmup import ...`) sees this readiness state
+    from warmup import main as warmup_main
+    sys.exit(warmup_main())